@@ -1,10 +1,14 @@
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, Response, status
 from fastapi.security import OAuth2PasswordBearer
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app import crud, models
+from app import crud, models, schemas
 from app.core.security import verify_token
+from app.core import http_cache
+from app.core.auth_cache import cache_principal, get_cached_principal
+from app.core.catalog_cache import catalog_cache, catalog_version
 from app.db.session import get_db
+from app.rule_engine import CompiledProductType, rule_engine
 
 # Define the OAuth2 scheme
 # tokenUrl should point to our login endpoint
@@ -17,14 +21,109 @@ credentials_exception = HTTPException(
     headers={"WWW-Authenticate": "Bearer"},
 )
 
-def get_current_admin_user(
+async def get_current_admin_user(
     token: str = Depends(oauth2_scheme),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ) -> models.AdminUser:
-    """Dependency to get the current authenticated admin user."""
+    """Dependency to get the current authenticated admin user.
+
+    The user a token resolved to is cached (see app.core.auth_cache), so repeated
+    requests with the same token do not query the database.
+    """
     username = verify_token(token=token, credentials_exception=credentials_exception)
-    user = crud.get_admin_user_by_username(db, username=username)
+    user = get_cached_principal(username, token)
     if user is None:
-        # This case might happen if the user was deleted after the token was issued
-        raise credentials_exception
-    return user 
\ No newline at end of file
+        user = await crud.get_admin_user_by_username(db, username=username)
+        if user is None:
+            # This case might happen if the user was deleted after the token was issued
+            raise credentials_exception
+        # Shared across requests from now on, so detach it from this session
+        db.expunge(user)
+        cache_principal(username, token, user)
+    return user
+
+def catalog_etag(*table_names: str, cache_control: str = http_cache.ADMIN_CACHE_CONTROL):
+    """Dependency factory for conditional catalog reads.
+
+    The ETag only depends on the path, the query string and the versions of the
+    given tables, so a matching If-None-Match is answered with 304 after one
+    version query, before the endpoint runs its own. Declare it after the auth
+    dependency.
+    """
+    async def check_etag(request: Request, response: Response, db: AsyncSession = Depends(get_db)) -> str:
+        versions = await catalog_version.read(db)
+        etag = http_cache.make_etag(
+            request.url.path, request.url.query, *(versions.table(name) for name in table_names)
+        )
+        headers = http_cache.cache_headers(etag, cache_control)
+        if http_cache.etag_matches(request.headers.get("if-none-match"), etag):
+            raise HTTPException(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        response.headers.update(headers)
+        return etag
+    return check_etag
+
+async def fetch_catalog_snapshot(
+    db: AsyncSession, product_type_id: int, version: int
+) -> schemas.ProductConfiguration:
+    """Returns the category/option tree of a product type, from memory when the catalog is unchanged.
+
+    `version` must be read before anything is loaded so that a concurrent write
+    leaves the freshly loaded snapshot stamped as stale.
+    """
+    snapshot = catalog_cache.get(product_type_id, version)
+    if snapshot is not None:
+        return snapshot
+    product_type = await crud.get_product_type(db, product_type_id=product_type_id)
+    if product_type is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="ProductType not found")
+    categories = await crud.get_part_categories_by_product_type(db, product_type_id=product_type_id, limit=None)
+    options = await crud.get_part_options_by_product_type(db, product_type_id=product_type_id)
+    options_by_category = {category.id: [] for category in categories}
+    for option in options:
+        # The two queries see different commits when a category and its options are written in between.
+        # Such a snapshot is stamped with the version read before the write, so it is replaced on the next call.
+        if option.part_category_id in options_by_category:
+            options_by_category[option.part_category_id].append(schemas.PartOption.model_validate(option))
+    snapshot = schemas.ProductConfiguration(
+        product_type=schemas.ProductType.model_validate(product_type),
+        categories=[
+            schemas.PartCategoryWithOptions(
+                **schemas.PartCategory.model_validate(category).model_dump(),
+                options=options_by_category[category.id],
+            )
+            for category in categories
+        ],
+    )
+    catalog_cache.put(product_type_id, snapshot, version)
+    return snapshot
+
+async def get_catalog_snapshot(
+    product_type_id: int,
+    db: AsyncSession = Depends(get_db)
+) -> schemas.ProductConfiguration:
+    """Dependency returning the cached category/option tree of a product type."""
+    versions = await catalog_version.read(db)
+    return await fetch_catalog_snapshot(db, product_type_id, versions.current)
+
+async def get_compiled_product_type(
+    product_type_id: int,
+    db: AsyncSession = Depends(get_db)
+) -> CompiledProductType:
+    """Dependency returning the compiled rules of a product type.
+
+    Only the first request after a catalog write loads rows; every other call
+    costs the version query and is served from the in-process rule engine.
+    """
+    version = (await catalog_version.read(db)).current
+    compiled = rule_engine.get(product_type_id, version)
+    if compiled is not None:
+        return compiled
+    snapshot = await fetch_catalog_snapshot(db, product_type_id, version)
+    compatibility_rules = await crud.get_compatibility_rules_by_product_type(
+        db, product_type_id=product_type_id, limit=None
+    )
+    pricing_rules = await crud.get_pricing_rules_by_product_type(db, product_type_id=product_type_id, limit=None)
+    options = [option for category in snapshot.categories for option in category.options]
+    return rule_engine.compile(
+        product_type_id, snapshot.categories, options, compatibility_rules, pricing_rules, version=version
+    )
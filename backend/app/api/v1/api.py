@@ -6,6 +6,14 @@ from .endpoints import auth
 from .endpoints import product_types
 from .endpoints import part_categories
 from .endpoints import part_options
+from .endpoints import compatibility_rules
+from .endpoints import pricing_rules
+from .endpoints import products
+from .endpoints import configurator
+from .endpoints import catalog
+from .endpoints import analytics
+from .endpoints import cart
+from .endpoints import stream
 
 api_router = APIRouter()
 
@@ -16,8 +24,16 @@ api_router.include_router(auth.router, tags=["auth"])
 api_router.include_router(product_types.router, prefix="/admin", tags=["Admin - Product Types"])
 api_router.include_router(part_categories.router, prefix="/admin", tags=["Admin - Part Categories"])
 api_router.include_router(part_options.router, prefix="/admin", tags=["Admin - Part Options"])
+api_router.include_router(compatibility_rules.router, prefix="/admin", tags=["Admin - Compatibility Rules"])
+api_router.include_router(pricing_rules.router, prefix="/admin", tags=["Admin - Pricing Rules"])
+api_router.include_router(catalog.router, prefix="/admin", tags=["Admin - Catalog"])
+api_router.include_router(analytics.router, prefix="/admin", tags=["Admin - Analytics"])
+api_router.include_router(products.router, prefix="/products", tags=["Products"])
+api_router.include_router(configurator.router, prefix="/products", tags=["Products"])
+api_router.include_router(cart.router, prefix="/cart", tags=["Cart"])
+api_router.include_router(stream.router, prefix="/stream", tags=["Stream"])
 
 @api_router.get("/health", status_code=200)
-def health_check():
+async def health_check():
     """Basic health check endpoint."""
     return {"status": "ok"} 
\ No newline at end of file
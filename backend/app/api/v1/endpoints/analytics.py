@@ -0,0 +1,31 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
+
+from app import models, schemas
+from app.api.deps import get_compiled_product_type, get_current_admin_user
+from app.rule_engine import AnalysisTooComplexError, CompiledProductType
+
+router = APIRouter()
+
+@router.get("/product-types/{product_type_id}/analytics", response_model=schemas.ConfigurationAnalytics)
+async def read_configuration_analytics(
+    product_type_id: int,
+    current_user: models.AdminUser = Depends(get_current_admin_user),
+    compiled: CompiledProductType = Depends(get_compiled_product_type),
+):
+    """Count the buildable configurations of a product type and find dead options (requires admin privileges).
+
+    Only in-stock options count. The result is computed once per catalog
+    version; the counting is CPU-bound, so it runs off the event loop. A
+    catalog too large to count answers 503 until it changes.
+    """
+    try:
+        analysis = await run_in_threadpool(lambda: compiled.analysis)
+    except AnalysisTooComplexError as exc:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(exc))
+    return {
+        "product_type_id": product_type_id,
+        "total_configurations": analysis.total_configurations,
+        "dead_options": [{"id": option_id, "reason": reason} for option_id, reason in analysis.dead_options],
+        "option_frequencies": analysis.option_frequencies,
+    }
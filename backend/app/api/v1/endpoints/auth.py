@@ -1,24 +1,31 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app import crud, schemas, models
 from app.db.session import get_db
-from app.core.security import create_access_token
+from app.core.security import PasswordHashingBusyError, create_access_token
 from app.api.deps import get_current_admin_user
 
 router = APIRouter()
 
 @router.post("/admin/login", response_model=schemas.Token)
-def login_admin_for_access_token(
+async def login_admin_for_access_token(
     form_data: schemas.LoginRequest,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Authenticate admin user and return JWT token."""
-    admin_user = crud.authenticate_admin_user(
-        db,
-        username=form_data.username,
-        password=form_data.password
-    )
+    try:
+        admin_user = await crud.authenticate_admin_user(
+            db,
+            username=form_data.username,
+            password=form_data.password
+        )
+    except PasswordHashingBusyError:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many login attempts in progress, retry shortly.",
+            headers={"Retry-After": "1"},
+        )
     if not admin_user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -31,7 +38,7 @@ def login_admin_for_access_token(
     return {"access_token": access_token, "token_type": "bearer"}
 
 @router.get("/admin/me", response_model=schemas.AdminUserRead)
-def read_admin_me(
+async def read_admin_me(
     current_user: models.AdminUser = Depends(get_current_admin_user)
 ):
     """Fetch the current logged in admin user."""
@@ -0,0 +1,111 @@
+from fastapi import APIRouter, Depends, Header, HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from decimal import Decimal
+
+from app import crud, models, schemas
+from app.db.session import get_db
+from app.api.deps import get_compiled_product_type
+from app.rule_engine import CompiledProductType, InvalidSelectionError
+
+router = APIRouter()
+
+CART_TOKEN_HEADER = "X-Cart-Token"
+
+async def get_cart(
+    cart_token: str | None = Header(None, alias=CART_TOKEN_HEADER),
+    db: AsyncSession = Depends(get_db)
+) -> models.Cart:
+    """Dependency returning the cart named by the X-Cart-Token header."""
+    cart = await crud.get_cart_by_token(db, token=cart_token) if cart_token else None
+    if cart is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Cart not found")
+    return cart
+
+def price_cart_item(compiled: CompiledProductType, item: models.CartItem) -> schemas.CartItem:
+    """Prices a cart item like the configurator does, against the current catalog.
+
+    Options deleted since the item was added are reported in `missing_options`
+    and make the item unavailable; the remaining options are still priced.
+    """
+    missing = [option_id for option_id in item.part_option_ids if option_id not in compiled.pricing.options]
+    known = [option_id for option_id in item.part_option_ids if option_id in compiled.pricing.options]
+    unit_price = compiled.pricing.price(known).total_price
+    try:
+        compiled.compatibility.check_configuration(item.part_option_ids)
+        is_available = True
+    except InvalidSelectionError:
+        is_available = False
+    return schemas.CartItem(
+        id=item.id,
+        product_type_id=item.product_type_id,
+        selected_options=item.part_option_ids,
+        quantity=item.quantity,
+        unit_price=unit_price,
+        line_price=unit_price * item.quantity,
+        is_available=is_available,
+        missing_options=missing,
+    )
+
+async def read_priced_cart(db: AsyncSession, cart: models.Cart) -> schemas.Cart:
+    compiled_product_types = {}
+    items = []
+    for item in await crud.get_cart_items(db, cart_id=cart.id):
+        compiled = compiled_product_types.get(item.product_type_id)
+        if compiled is None:
+            # Served from the rule engine unless the catalog changed
+            compiled = await get_compiled_product_type(item.product_type_id, db=db)
+            compiled_product_types[item.product_type_id] = compiled
+        items.append(price_cart_item(compiled, item))
+    return schemas.Cart(
+        token=cart.token,
+        items=items,
+        total_price=sum((item.line_price for item in items), Decimal("0")),
+    )
+
+@router.post("", response_model=schemas.Cart, status_code=status.HTTP_201_CREATED)
+async def add_to_cart(
+    cart_item_in: schemas.CartItemCreate,
+    cart_token: str | None = Header(None, alias=CART_TOKEN_HEADER),
+    db: AsyncSession = Depends(get_db)
+):
+    """Add a full configuration to the cart (public).
+
+    Without an X-Cart-Token header a new cart is created; its token is in the
+    response. Adding a configuration the cart already holds raises its quantity.
+    """
+    compiled = await get_compiled_product_type(cart_item_in.product_type_id, db=db)
+    try:
+        compiled.compatibility.check_configuration(cart_item_in.selected_options)
+    except InvalidSelectionError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
+    cart = await get_cart(cart_token, db) if cart_token else await crud.create_cart(db)
+    await crud.add_cart_item(db, cart_id=cart.id, cart_item_in=cart_item_in)
+    return await read_priced_cart(db, cart)
+
+@router.get("", response_model=schemas.Cart)
+async def read_cart(
+    cart: models.Cart = Depends(get_cart),
+    db: AsyncSession = Depends(get_db)
+):
+    """Retrieve the cart with prices recomputed from the current catalog and pricing rules (public)."""
+    return await read_priced_cart(db, cart)
+
+@router.delete("", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_cart(
+    cart: models.Cart = Depends(get_cart),
+    db: AsyncSession = Depends(get_db)
+):
+    """Delete the cart and everything in it (public)."""
+    # Returned as None: a Response of our own would drop the pin cookie set by get_db
+    await crud.remove_cart(db, cart=cart)
+
+@router.delete("/items/{cart_item_id}", response_model=schemas.Cart)
+async def delete_cart_item(
+    cart_item_id: int,
+    cart: models.Cart = Depends(get_cart),
+    db: AsyncSession = Depends(get_db)
+):
+    """Remove one configuration from the cart (public)."""
+    if not await crud.remove_cart_item(db, cart_id=cart.id, cart_item_id=cart_item_id):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Cart item not found")
+    return await read_priced_cart(db, cart)
@@ -0,0 +1,56 @@
+from fastapi import APIRouter, Depends, HTTPException, Request, status, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Literal
+
+from app import catalog_io, models, schemas
+from app.db.session import get_db
+from app.api.deps import get_current_admin_user
+
+router = APIRouter()
+
+@router.post("/catalog/import", response_model=schemas.CatalogImportSummary)
+async def import_catalog(
+    request: Request,
+    file_format: Literal["csv", "ndjson"] | None = Query(
+        None, alias="format", description="Defaults to the request Content-Type"
+    ),
+    db: AsyncSession = Depends(get_db),
+    current_user: models.AdminUser = Depends(get_current_admin_user)
+):
+    """Import product types, part categories and part options from a CSV or NDJSON
+    request body (requires admin privileges).
+
+    The body is read as a stream and written in batches, so files of any size can
+    be uploaded. Rows are matched on their names and updated, or inserted; rows
+    that cannot be imported are counted and the first ones reported in `errors`.
+    """
+    file_format = file_format or catalog_io.format_from_content_type(request.headers.get("content-type"))
+    if file_format is None:
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail="Send text/csv or application/x-ndjson, or pass the 'format' query parameter.",
+        )
+    try:
+        summary = await catalog_io.import_catalog(db, catalog_io.iter_rows(request.stream(), file_format))
+    except catalog_io.ImportFormatError as exc:
+        await db.rollback()
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
+    return summary
+
+@router.get("/catalog/export", response_class=StreamingResponse)
+async def export_catalog(
+    db: AsyncSession = Depends(get_db),
+    current_user: models.AdminUser = Depends(get_current_admin_user)
+):
+    """Stream every product type, part category and part option as NDJSON (requires admin privileges).
+
+    Lines use the import row format with parents referenced by name, parents
+    first, so the file can be fed back to the catalog import of any database.
+    Compatibility and pricing rules are not exported.
+    """
+    return StreamingResponse(
+        catalog_io.iter_catalog_ndjson(db),
+        media_type="application/x-ndjson",
+        headers={"Content-Disposition": 'attachment; filename="catalog.ndjson"'},
+    )
@@ -0,0 +1,142 @@
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import IntegrityError
+from typing import Iterable, List
+
+from app import crud, models, schemas
+from app.db.session import get_db
+from app.api.deps import get_current_admin_user
+from app.config import settings
+from app.core.fast_json import RowSerializer
+from app.core.pagination import InvalidCursorError, next_cursor, set_next_cursor
+
+router = APIRouter()
+
+# Fast path for list pages (see app.core.fast_json)
+COMPATIBILITY_RULE_ROWS = RowSerializer(schemas.CompatibilityRule)
+
+async def validate_rule_options(
+    db: AsyncSession, product_type_id: int, option_ids: Iterable[int | None]
+) -> None:
+    """Ensure every referenced option exists and belongs to the rule's product type (one query)."""
+    wanted = {option_id for option_id in option_ids if option_id is not None}
+    if not wanted:
+        return
+    found = await crud.get_part_options_in_product_type(
+        db, product_type_id=product_type_id, part_option_ids=wanted
+    )
+    missing = wanted - {part_option.id for part_option in found}
+    if missing:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"PartOptions {sorted(missing)} not found in ProductType {product_type_id}.",
+        )
+
+@router.post("/rules/compatibility", response_model=schemas.CompatibilityRule, status_code=status.HTTP_201_CREATED)
+async def create_new_compatibility_rule(
+    *,
+    db: AsyncSession = Depends(get_db),
+    compatibility_rule_in: schemas.CompatibilityRuleCreate,
+    current_user: models.AdminUser = Depends(get_current_admin_user)
+):
+    """Create a new compatibility rule (requires admin privileges)."""
+    product_type = await crud.get_product_type(db, product_type_id=compatibility_rule_in.product_type_id)
+    if not product_type:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"ProductType with id {compatibility_rule_in.product_type_id} not found.",
+        )
+    await validate_rule_options(
+        db,
+        compatibility_rule_in.product_type_id,
+        [compatibility_rule_in.trigger_option_id, compatibility_rule_in.target_option_id],
+    )
+    try:
+        rule = await crud.create_compatibility_rule(db=db, compatibility_rule_in=compatibility_rule_in)
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Compatibility rule creation failed. Check constraints.",
+        )
+    return rule
+
+@router.get("/rules/compatibility", response_model=List[schemas.CompatibilityRule])
+async def read_compatibility_rules(
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_db),
+    product_type_id: int | None = Query(None, description="Filter by Product Type ID"),
+    cursor: str | None = Query(None, description="Opaque cursor of the next page (see the X-Next-Cursor header)"),
+    skip: int = Query(0, deprecated=True, description="Offset pagination; use cursor instead"),
+    limit: int = 100,
+    current_user: models.AdminUser = Depends(get_current_admin_user)
+):
+    """Retrieve the compatibility rules of a product type (requires admin privileges)."""
+    if product_type_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Query parameter 'product_type_id' is required."
+        )
+    try:
+        rules = await crud.get_compatibility_rules_by_product_type(
+            db, product_type_id=product_type_id, skip=skip, limit=limit, cursor=cursor
+        )
+    except InvalidCursorError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
+    set_next_cursor(response, request, next_cursor(rules, crud.COMPATIBILITY_RULE_ORDER, limit))
+    if settings.FAST_JSON_RESPONSES:
+        return COMPATIBILITY_RULE_ROWS.response(rules, response)
+    return rules
+
+@router.get("/rules/compatibility/{compatibility_rule_id}", response_model=schemas.CompatibilityRule)
+async def read_compatibility_rule(
+    compatibility_rule_id: int,
+    db: AsyncSession = Depends(get_db),
+    current_user: models.AdminUser = Depends(get_current_admin_user)
+):
+    """Retrieve a specific compatibility rule by ID (requires admin privileges)."""
+    db_rule = await crud.get_compatibility_rule(db, compatibility_rule_id=compatibility_rule_id)
+    if db_rule is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="CompatibilityRule not found")
+    return db_rule
+
+@router.put("/rules/compatibility/{compatibility_rule_id}", response_model=schemas.CompatibilityRule)
+async def update_existing_compatibility_rule(
+    compatibility_rule_id: int,
+    compatibility_rule_in: schemas.CompatibilityRuleUpdate,
+    db: AsyncSession = Depends(get_db),
+    current_user: models.AdminUser = Depends(get_current_admin_user)
+):
+    """Update a compatibility rule (requires admin privileges)."""
+    db_rule = await crud.get_compatibility_rule(db, compatibility_rule_id=compatibility_rule_id)
+    if not db_rule:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="CompatibilityRule not found")
+    await validate_rule_options(
+        db,
+        db_rule.product_type_id,
+        [compatibility_rule_in.trigger_option_id, compatibility_rule_in.target_option_id],
+    )
+    try:
+        updated_rule = await crud.update_compatibility_rule(
+            db=db, db_obj=db_rule, compatibility_rule_in=compatibility_rule_in
+        )
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Compatibility rule update failed. Check constraints.",
+        )
+    return updated_rule
+
+@router.delete("/rules/compatibility/{compatibility_rule_id}", response_model=schemas.CompatibilityRule)
+async def delete_compatibility_rule(
+    compatibility_rule_id: int,
+    db: AsyncSession = Depends(get_db),
+    current_user: models.AdminUser = Depends(get_current_admin_user)
+):
+    """Delete a compatibility rule (requires admin privileges)."""
+    deleted_rule = await crud.remove_compatibility_rule(db=db, compatibility_rule_id=compatibility_rule_id)
+    if not deleted_rule:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="CompatibilityRule not found")
+    return deleted_rule
@@ -0,0 +1,113 @@
+"""Live configurator sessions over a WebSocket.
+
+    ws /api/v1/products/{product_type_id}/session
+
+The session's selection is kept in memory on the server, so the client only
+sends what changed: `{"type": "select", "category_id": 1, "option_id": 2}`
+(`option_id` null clears the category). After connecting and after every
+select the server pushes a `state` message with the priced selection and
+the availability of the categories that changed (all of them on connect and
+after a catalog change). A message that cannot be applied is answered with
+`{"type": "error", "detail": ...}` and the session stays open.
+"""
+import asyncio
+from typing import List
+
+from fastapi import APIRouter, HTTPException, WebSocket, WebSocketDisconnect, status
+from pydantic import ValidationError
+
+from app import schemas
+from app.api.deps import get_compiled_product_type
+from app.api.v1.endpoints.products import category_availability
+from app.config import settings
+from app.db.session import AsyncSessionLocal, async_engine, replica_router
+from app.rule_engine import CategoryEvaluation, CompiledProductType, InvalidSelectionError
+
+router = APIRouter()
+
+class SessionLimiter:
+    """Caps the open sessions of this worker process."""
+
+    def __init__(self, limit: int) -> None:
+        self.limit = limit
+        self.active = 0
+
+    def try_acquire(self) -> bool:
+        if self.active >= self.limit:
+            return False
+        self.active += 1
+        return True
+
+    def release(self) -> None:
+        self.active -= 1
+
+session_limiter = SessionLimiter(settings.CONFIGURATOR_MAX_SESSIONS)
+
+async def _load_compiled(product_type_id: int) -> CompiledProductType:
+    """The current compiled rules; only the catalog versions are read unless the catalog changed."""
+    engine = replica_router.engine_for("GET", client_pinned=False) or async_engine
+    async with AsyncSessionLocal(bind=engine) as db:
+        return await get_compiled_product_type(product_type_id, db)
+
+async def _send_state(
+    websocket: WebSocket, compiled: CompiledProductType, selected: List[int], categories: List[CategoryEvaluation]
+) -> None:
+    breakdown = compiled.pricing.price(selected)
+    state = schemas.ConfiguratorState(
+        product_type_id=compiled.product_type_id,
+        selected_options=selected,
+        configuration=category_availability(categories),
+        base_price=breakdown.base_price,
+        total_price=breakdown.total_price,
+    )
+    await websocket.send_text(state.model_dump_json())
+
+async def _run_session(websocket: WebSocket, product_type_id: int) -> None:
+    compiled = await _load_compiled(product_type_id)
+    selected: List[int] = []
+    await _send_state(websocket, compiled, selected, compiled.compatibility.evaluate(selected))
+    while True:
+        try:
+            text = await asyncio.wait_for(websocket.receive_text(), settings.CONFIGURATOR_IDLE_TIMEOUT_SECONDS)
+        except asyncio.TimeoutError:
+            await websocket.close(code=status.WS_1000_NORMAL_CLOSURE, reason="Idle timeout")
+            return
+        try:
+            message = schemas.ConfiguratorSelect.model_validate_json(text)
+        except ValidationError as exc:
+            detail = exc.errors(include_url=False, include_input=False, include_context=False)
+            await websocket.send_json({"type": "error", "detail": detail})
+            continue
+
+        current = await _load_compiled(product_type_id)
+        previous = selected
+        if current.version != compiled.version:
+            # Options deleted since the last message drop out of the selection
+            previous = [option_id for option_id in selected if option_id in current.compatibility.option_bits]
+        try:
+            changed_selection, categories = current.compatibility.evaluate_change(
+                previous, message.category_id, message.option_id
+            )
+            if current.version != compiled.version:
+                categories = current.compatibility.evaluate(changed_selection)
+        except InvalidSelectionError as exc:
+            await websocket.send_json({"type": "error", "detail": str(exc)})
+            continue
+        compiled, selected = current, changed_selection
+        await _send_state(websocket, compiled, selected, categories)
+
+@router.websocket("/{product_type_id}/session")
+async def configurator_session(websocket: WebSocket, product_type_id: int):
+    """Keep a selection for a product type and push its price and availability after every change (public)."""
+    await websocket.accept()
+    if not session_limiter.try_acquire():
+        await websocket.close(code=status.WS_1013_TRY_AGAIN_LATER, reason="Too many configurator sessions")
+        return
+    try:
+        await _run_session(websocket, product_type_id)
+    except HTTPException as exc:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION, reason=exc.detail)
+    except WebSocketDisconnect:
+        pass
+    finally:
+        session_limiter.release()
@@ -1,33 +1,40 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status, Query
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import IntegrityError
 from typing import List
 
 from app import crud, models, schemas
 from app.db.session import get_db
-from app.api.deps import get_current_admin_user
+from app.api.deps import catalog_etag, get_current_admin_user
+from app.config import settings
+from app.core.fast_json import RowSerializer
+from app.core.http_cache import set_last_modified
+from app.core.pagination import InvalidCursorError, next_cursor, set_next_cursor
 
 router = APIRouter()
 
+# Fast path for list pages (see app.core.fast_json)
+PART_CATEGORY_ROWS = RowSerializer(schemas.PartCategory)
+
 @router.post("/part-categories", response_model=schemas.PartCategory, status_code=status.HTTP_201_CREATED)
-def create_new_part_category(
+async def create_new_part_category(
     *, # Keyword-only args
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     part_category_in: schemas.PartCategoryCreate,
     current_user: models.AdminUser = Depends(get_current_admin_user)
 ):
     """Create a new part category (requires admin privileges)."""
     # Check if product type exists first?
-    product_type = crud.get_product_type(db, product_type_id=part_category_in.product_type_id)
+    product_type = await crud.get_product_type(db, product_type_id=part_category_in.product_type_id)
     if not product_type:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"ProductType with id {part_category_in.product_type_id} not found.",
         )
     try:
-        part_category = crud.create_part_category(db=db, part_category_in=part_category_in)
+        part_category = await crud.create_part_category(db=db, part_category_in=part_category_in)
     except IntegrityError: # Catch potential DB errors if constraints fail
-        db.rollback()
+        await db.rollback()
         # Could be more specific, e.g., unique constraint on (product_type_id, name)?
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
@@ -36,18 +43,25 @@ def create_new_part_category(
     return part_category
 
 @router.get("/part-categories", response_model=List[schemas.PartCategory])
-def read_part_categories(
-    db: Session = Depends(get_db),
+async def read_part_categories(
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_db),
     product_type_id: int | None = Query(None, description="Filter by Product Type ID"),
-    skip: int = 0,
+    cursor: str | None = Query(None, description="Opaque cursor of the next page (see the X-Next-Cursor header)"),
+    skip: int = Query(0, deprecated=True, description="Offset pagination; use cursor instead"),
     limit: int = 100,
-    current_user: models.AdminUser = Depends(get_current_admin_user)
+    current_user: models.AdminUser = Depends(get_current_admin_user),
+    etag: str = Depends(catalog_etag(models.PartCategory.__tablename__)),
 ):
     """Retrieve part categories, optionally filtered by ProductType (requires admin privileges)."""
     if product_type_id is not None:
-        part_categories = crud.get_part_categories_by_product_type(
-            db, product_type_id=product_type_id, skip=skip, limit=limit
-        )
+        try:
+            part_categories = await crud.get_part_categories_by_product_type(
+                db, product_type_id=product_type_id, skip=skip, limit=limit, cursor=cursor
+            )
+        except InvalidCursorError as exc:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
     else:
         # TODO: Implement get_all_part_categories if needed, or require product_type_id filter.
         # For now, returning empty list if no filter provided.
@@ -57,46 +71,53 @@ def read_part_categories(
             detail="Query parameter 'product_type_id' is required."
         )
         # part_categories = [] # Or implement a get_all function
+    set_next_cursor(response, request, next_cursor(part_categories, crud.PART_CATEGORY_ORDER, limit))
+    set_last_modified(response, part_categories)
+    if settings.FAST_JSON_RESPONSES:
+        return PART_CATEGORY_ROWS.response(part_categories, response)
     return part_categories
 
 @router.get("/part-categories/{part_category_id}", response_model=schemas.PartCategory)
-def read_part_category(
+async def read_part_category(
     part_category_id: int,
-    db: Session = Depends(get_db),
-    current_user: models.AdminUser = Depends(get_current_admin_user)
+    response: Response,
+    db: AsyncSession = Depends(get_db),
+    current_user: models.AdminUser = Depends(get_current_admin_user),
+    etag: str = Depends(catalog_etag(models.PartCategory.__tablename__)),
 ):
     """Retrieve a specific part category by ID (requires admin privileges)."""
-    db_part_category = crud.get_part_category(db, part_category_id=part_category_id)
+    db_part_category = await crud.get_part_category(db, part_category_id=part_category_id)
     if db_part_category is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="PartCategory not found")
+    set_last_modified(response, [db_part_category])
     return db_part_category
 
 @router.put("/part-categories/{part_category_id}", response_model=schemas.PartCategory)
-def update_existing_part_category(
+async def update_existing_part_category(
     part_category_id: int,
     part_category_in: schemas.PartCategoryUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: models.AdminUser = Depends(get_current_admin_user)
 ):
     """Update a part category (requires admin privileges)."""
-    db_part_category = crud.get_part_category(db, part_category_id=part_category_id)
+    db_part_category = await crud.get_part_category(db, part_category_id=part_category_id)
     if not db_part_category:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="PartCategory not found")
     # If product_type_id is being changed, check if the new one exists
     if part_category_in.product_type_id is not None and \
        part_category_in.product_type_id != db_part_category.product_type_id:
-        product_type = crud.get_product_type(db, product_type_id=part_category_in.product_type_id)
+        product_type = await crud.get_product_type(db, product_type_id=part_category_in.product_type_id)
         if not product_type:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"ProductType with id {part_category_in.product_type_id} not found.",
             )
     try:
-        updated_part_category = crud.update_part_category(
+        updated_part_category = await crud.update_part_category(
             db=db, db_obj=db_part_category, part_category_in=part_category_in
         )
     except IntegrityError:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="Part category update failed. Check constraints.",
@@ -104,13 +125,13 @@ def update_existing_part_category(
     return updated_part_category
 
 @router.delete("/part-categories/{part_category_id}", response_model=schemas.PartCategory)
-def delete_part_category(
+async def delete_part_category(
     part_category_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: models.AdminUser = Depends(get_current_admin_user)
 ):
     """Delete a part category (requires admin privileges)."""
-    deleted_part_category = crud.remove_part_category(db=db, part_category_id=part_category_id)
+    deleted_part_category = await crud.remove_part_category(db=db, part_category_id=part_category_id)
     if not deleted_part_category:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="PartCategory not found")
-    return deleted_part_category 
\ No newline at end of file
+    return deleted_part_category
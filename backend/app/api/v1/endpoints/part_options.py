@@ -1,15 +1,21 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import IntegrityError
 from typing import List
 
 from app import crud, models, schemas
 from app.db.session import get_db
-from app.api.deps import get_current_admin_user
+from app.api.deps import catalog_etag, get_current_admin_user
+from app.config import settings
+from app.core.fast_json import RowSerializer
+from app.core.http_cache import set_last_modified
+from app.core.pagination import InvalidCursorError, next_cursor, set_next_cursor
 
 router = APIRouter()
 
+# Fast path for list pages (see app.core.fast_json)
+PART_OPTION_ROWS = RowSerializer(schemas.PartOption)
+
 @router.post("/part-options", response_model=schemas.PartOption, status_code=status.HTTP_201_CREATED)
 async def create_new_part_option(
     *,
@@ -35,37 +41,152 @@ async def create_new_part_option(
         )
     return part_option
 
+@router.post("/part-options/bulk", response_model=schemas.PartOptionBulkResult)
+async def create_part_options_bulk(
+    *,
+    db: AsyncSession = Depends(get_db),
+    part_options_in: List[schemas.PartOptionCreate],
+    current_user: models.AdminUser = Depends(get_current_admin_user)
+):
+    """Create many part options in one transaction (requires admin privileges).
+
+    Rows referencing a missing part category or rejected by the database are
+    reported in `errors`; the other rows are still created.
+    """
+    known_categories = await crud.get_existing_part_category_ids(
+        db, part_category_ids={part_option_in.part_category_id for part_option_in in part_options_in}
+    )
+    errors = []
+    valid = []
+    for index, part_option_in in enumerate(part_options_in):
+        if part_option_in.part_category_id in known_categories:
+            valid.append(index)
+        else:
+            errors.append(schemas.BulkRowError(
+                index=index, detail=f"PartCategory with id {part_option_in.part_category_id} not found."
+            ))
+    created, failed = await crud.create_part_options(db=db, part_options_in=[part_options_in[i] for i in valid])
+    errors.extend(schemas.BulkRowError(index=valid[position], detail=detail) for position, detail in failed.items())
+    errors.sort(key=lambda error: error.index)
+    return schemas.PartOptionBulkResult(
+        part_options=[created[position] for position in sorted(created)], errors=errors
+    )
+
+@router.patch("/part-options/bulk", response_model=schemas.PartOptionBulkResult)
+async def update_part_options_bulk(
+    *,
+    db: AsyncSession = Depends(get_db),
+    part_options_in: List[schemas.PartOptionBulkUpdateItem],
+    current_user: models.AdminUser = Depends(get_current_admin_user)
+):
+    """Update many part options (price, stock, name) in one transaction (requires admin privileges).
+
+    Rows naming a missing or repeated option, rows without any field to change
+    and rows rejected by the database are reported in `errors`; the other rows
+    are still updated.
+    """
+    known_options = await crud.get_existing_part_option_ids(
+        db, part_option_ids={part_option_in.id for part_option_in in part_options_in}
+    )
+    errors = []
+    valid = []
+    seen = set()
+    for index, part_option_in in enumerate(part_options_in):
+        if part_option_in.id not in known_options:
+            detail = f"PartOption with id {part_option_in.id} not found."
+        elif part_option_in.id in seen:
+            detail = f"PartOption with id {part_option_in.id} appears more than once."
+        elif not part_option_in.model_fields_set - {"id"}:
+            detail = "No fields to update."
+        else:
+            seen.add(part_option_in.id)
+            valid.append(index)
+            continue
+        errors.append(schemas.BulkRowError(index=index, detail=detail))
+    updated, failed = await crud.update_part_options(db=db, part_options_in=[part_options_in[i] for i in valid])
+    errors.extend(schemas.BulkRowError(index=valid[position], detail=detail) for position, detail in failed.items())
+    errors.sort(key=lambda error: error.index)
+    return schemas.PartOptionBulkResult(
+        part_options=[updated[position] for position in sorted(updated)], errors=errors
+    )
+
+@router.patch("/part-options/stock", response_model=schemas.PartOptionStockResult)
+async def update_part_options_stock(
+    *,
+    db: AsyncSession = Depends(get_db),
+    stock_in: schemas.PartOptionStockUpdate,
+    current_user: models.AdminUser = Depends(get_current_admin_user)
+):
+    """Mark many part options in or out of stock with one statement (requires admin privileges).
+
+    Options are selected by `ids`, `part_category_id` and/or `name_contains`
+    (combined with AND); at least one filter is required.
+    """
+    if stock_in.ids is None and stock_in.part_category_id is None and not stock_in.name_contains:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Provide at least one of 'ids', 'part_category_id' or 'name_contains'.",
+        )
+    changed_ids = await crud.set_part_options_stock(
+        db,
+        is_in_stock=stock_in.is_in_stock,
+        part_option_ids=stock_in.ids,
+        part_category_id=stock_in.part_category_id,
+        name_contains=stock_in.name_contains,
+    )
+    return schemas.PartOptionStockResult(is_in_stock=stock_in.is_in_stock, changed_ids=changed_ids)
+
 @router.get("/part-options", response_model=List[schemas.PartOption])
 async def read_part_options(
+    request: Request,
+    response: Response,
     db: AsyncSession = Depends(get_db),
     part_category_id: int | None = Query(None, description="Filter by Part Category ID"),
-    skip: int = 0,
+    in_stock_only: bool = Query(False, description="Only return options that are in stock"),
+    cursor: str | None = Query(None, description="Opaque cursor of the next page (see the X-Next-Cursor header)"),
+    skip: int = Query(0, deprecated=True, description="Offset pagination; use cursor instead"),
     limit: int = 100,
-    current_user: models.AdminUser = Depends(get_current_admin_user)
+    current_user: models.AdminUser = Depends(get_current_admin_user),
+    etag: str = Depends(catalog_etag(models.PartOption.__tablename__)),
 ):
     """Retrieve part options, optionally filtered by PartCategory (requires admin privileges)."""
     if part_category_id is not None:
-        part_options = await crud.get_part_options_by_category(
-            db, part_category_id=part_category_id, skip=skip, limit=limit
-        )
+        try:
+            part_options = await crud.get_part_options_by_category(
+                db,
+                part_category_id=part_category_id,
+                skip=skip,
+                limit=limit,
+                cursor=cursor,
+                in_stock_only=in_stock_only,
+            )
+        except InvalidCursorError as exc:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
     else:
         # Require filtering by category
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Query parameter 'part_category_id' is required."
         )
+    set_next_cursor(response, request, next_cursor(part_options, crud.PART_OPTION_ORDER, limit))
+    set_last_modified(response, part_options)
+    if settings.FAST_JSON_RESPONSES:
+        return PART_OPTION_ROWS.response(part_options, response)
     return part_options
 
 @router.get("/part-options/{part_option_id}", response_model=schemas.PartOption)
 async def read_part_option(
     part_option_id: int,
+    response: Response,
     db: AsyncSession = Depends(get_db),
-    current_user: models.AdminUser = Depends(get_current_admin_user)
+    current_user: models.AdminUser = Depends(get_current_admin_user),
+    etag: str = Depends(catalog_etag(models.PartOption.__tablename__)),
 ):
     """Retrieve a specific part option by ID (requires admin privileges)."""
     db_part_option = await crud.get_part_option(db, part_option_id=part_option_id)
     if db_part_option is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="PartOption not found")
+    set_last_modified(response, [db_part_option])
     return db_part_option
 
 @router.put("/part-options/{part_option_id}", response_model=schemas.PartOption)
@@ -0,0 +1,124 @@
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import IntegrityError
+from typing import List
+
+from app import crud, models, schemas
+from app.db.session import get_db
+from app.api.deps import get_current_admin_user
+from app.config import settings
+from app.core.fast_json import RowSerializer
+from app.core.pagination import InvalidCursorError, next_cursor, set_next_cursor
+from app.api.v1.endpoints.compatibility_rules import validate_rule_options
+
+router = APIRouter()
+
+# Fast path for list pages (see app.core.fast_json)
+PRICING_RULE_ROWS = RowSerializer(schemas.PricingRule)
+
+@router.post("/rules/pricing", response_model=schemas.PricingRule, status_code=status.HTTP_201_CREATED)
+async def create_new_pricing_rule(
+    *,
+    db: AsyncSession = Depends(get_db),
+    pricing_rule_in: schemas.PricingRuleCreate,
+    current_user: models.AdminUser = Depends(get_current_admin_user)
+):
+    """Create a new pricing rule (requires admin privileges)."""
+    product_type = await crud.get_product_type(db, product_type_id=pricing_rule_in.product_type_id)
+    if not product_type:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"ProductType with id {pricing_rule_in.product_type_id} not found.",
+        )
+    await validate_rule_options(
+        db,
+        pricing_rule_in.product_type_id,
+        [pricing_rule_in.target_option_id, *pricing_rule_in.condition_options],
+    )
+    try:
+        rule = await crud.create_pricing_rule(db=db, pricing_rule_in=pricing_rule_in)
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Pricing rule creation failed. Check constraints.",
+        )
+    return rule
+
+@router.get("/rules/pricing", response_model=List[schemas.PricingRule])
+async def read_pricing_rules(
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_db),
+    product_type_id: int | None = Query(None, description="Filter by Product Type ID"),
+    cursor: str | None = Query(None, description="Opaque cursor of the next page (see the X-Next-Cursor header)"),
+    skip: int = Query(0, deprecated=True, description="Offset pagination; use cursor instead"),
+    limit: int = 100,
+    current_user: models.AdminUser = Depends(get_current_admin_user)
+):
+    """Retrieve the pricing rules of a product type (requires admin privileges)."""
+    if product_type_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Query parameter 'product_type_id' is required."
+        )
+    try:
+        rules = await crud.get_pricing_rules_by_product_type(
+            db, product_type_id=product_type_id, skip=skip, limit=limit, cursor=cursor
+        )
+    except InvalidCursorError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
+    set_next_cursor(response, request, next_cursor(rules, crud.PRICING_RULE_ORDER, limit))
+    if settings.FAST_JSON_RESPONSES:
+        return PRICING_RULE_ROWS.response(rules, response)
+    return rules
+
+@router.get("/rules/pricing/{pricing_rule_id}", response_model=schemas.PricingRule)
+async def read_pricing_rule(
+    pricing_rule_id: int,
+    db: AsyncSession = Depends(get_db),
+    current_user: models.AdminUser = Depends(get_current_admin_user)
+):
+    """Retrieve a specific pricing rule by ID (requires admin privileges)."""
+    db_rule = await crud.get_pricing_rule(db, pricing_rule_id=pricing_rule_id)
+    if db_rule is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="PricingRule not found")
+    return db_rule
+
+@router.put("/rules/pricing/{pricing_rule_id}", response_model=schemas.PricingRule)
+async def update_existing_pricing_rule(
+    pricing_rule_id: int,
+    pricing_rule_in: schemas.PricingRuleUpdate,
+    db: AsyncSession = Depends(get_db),
+    current_user: models.AdminUser = Depends(get_current_admin_user)
+):
+    """Update a pricing rule (requires admin privileges)."""
+    db_rule = await crud.get_pricing_rule(db, pricing_rule_id=pricing_rule_id)
+    if not db_rule:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="PricingRule not found")
+    await validate_rule_options(
+        db,
+        db_rule.product_type_id,
+        [pricing_rule_in.target_option_id, *(pricing_rule_in.condition_options or [])],
+    )
+    try:
+        updated_rule = await crud.update_pricing_rule(db=db, db_obj=db_rule, pricing_rule_in=pricing_rule_in)
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Pricing rule update failed. Check constraints.",
+        )
+    return updated_rule
+
+@router.delete("/rules/pricing/{pricing_rule_id}", response_model=schemas.PricingRule)
+async def delete_pricing_rule(
+    pricing_rule_id: int,
+    db: AsyncSession = Depends(get_db),
+    current_user: models.AdminUser = Depends(get_current_admin_user)
+):
+    """Delete a pricing rule (requires admin privileges)."""
+    deleted_rule = await crud.remove_pricing_rule(db=db, pricing_rule_id=pricing_rule_id)
+    if not deleted_rule:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="PricingRule not found")
+    return deleted_rule
@@ -1,26 +1,33 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status, Query
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import IntegrityError
 from typing import List
 
 from app import crud, models, schemas
 from app.db.session import get_db
-from app.api.deps import get_current_admin_user
+from app.api.deps import catalog_etag, get_current_admin_user
+from app.config import settings
+from app.core.fast_json import RowSerializer
+from app.core.http_cache import set_last_modified
+from app.core.pagination import InvalidCursorError, next_cursor, set_next_cursor
 
 router = APIRouter()
 
+# Fast path for list pages (see app.core.fast_json)
+PRODUCT_TYPE_ROWS = RowSerializer(schemas.ProductType)
+
 @router.post("/product-types", response_model=schemas.ProductType, status_code=status.HTTP_201_CREATED)
-def create_new_product_type(
+async def create_new_product_type(
     *, # Make following arguments keyword-only
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     product_type_in: schemas.ProductTypeCreate,
     current_user: models.AdminUser = Depends(get_current_admin_user)
 ):
     """Create a new product type (requires admin privileges)."""
     try:
-        product_type = crud.create_product_type(db=db, product_type_in=product_type_in)
+        product_type = await crud.create_product_type(db=db, product_type_in=product_type_in)
     except IntegrityError:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail=f"ProductType with name '{product_type_in.name}' already exists.",
@@ -28,53 +35,81 @@ def create_new_product_type(
     return product_type
 
 @router.get("/product-types", response_model=List[schemas.ProductType])
-def read_product_types(
-    db: Session = Depends(get_db),
-    skip: int = 0,
+async def read_product_types(
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_db),
+    cursor: str | None = Query(None, description="Opaque cursor of the next page (see the X-Next-Cursor header)"),
+    skip: int = Query(0, deprecated=True, description="Offset pagination; use cursor instead"),
     limit: int = 100,
-    current_user: models.AdminUser = Depends(get_current_admin_user) # Protect endpoint
+    current_user: models.AdminUser = Depends(get_current_admin_user), # Protect endpoint
+    etag: str = Depends(catalog_etag(models.ProductType.__tablename__)),
 ):
     """Retrieve product types (requires admin privileges)."""
-    product_types = crud.get_product_types(db, skip=skip, limit=limit)
+    try:
+        product_types = await crud.get_product_types(db, skip=skip, limit=limit, cursor=cursor)
+    except InvalidCursorError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
+    set_next_cursor(response, request, next_cursor(product_types, crud.PRODUCT_TYPE_ORDER, limit))
+    set_last_modified(response, product_types)
+    if settings.FAST_JSON_RESPONSES:
+        return PRODUCT_TYPE_ROWS.response(product_types, response)
     return product_types
 
 @router.get("/product-types/{product_type_id}", response_model=schemas.ProductType)
-def read_product_type(
+async def read_product_type(
     product_type_id: int,
-    db: Session = Depends(get_db),
-    current_user: models.AdminUser = Depends(get_current_admin_user) # Protect endpoint
+    response: Response,
+    db: AsyncSession = Depends(get_db),
+    current_user: models.AdminUser = Depends(get_current_admin_user), # Protect endpoint
+    etag: str = Depends(catalog_etag(models.ProductType.__tablename__)),
 ):
     """Retrieve a specific product type by ID (requires admin privileges)."""
-    db_product_type = crud.get_product_type(db, product_type_id=product_type_id)
+    db_product_type = await crud.get_product_type(db, product_type_id=product_type_id)
     if db_product_type is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="ProductType not found")
+    set_last_modified(response, [db_product_type])
     return db_product_type
 
 @router.put("/product-types/{product_type_id}", response_model=schemas.ProductType)
-def update_existing_product_type(
+async def update_existing_product_type(
     product_type_id: int,
     product_type_in: schemas.ProductTypeUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: models.AdminUser = Depends(get_current_admin_user)
 ):
     """Update a product type (requires admin privileges)."""
-    db_product_type = crud.get_product_type(db, product_type_id=product_type_id)
+    db_product_type = await crud.get_product_type(db, product_type_id=product_type_id)
     if not db_product_type:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="ProductType not found")
     # TODO: Handle potential duplicate name on update?
-    updated_product_type = crud.update_product_type(
+    updated_product_type = await crud.update_product_type(
         db=db, db_obj=db_product_type, product_type_in=product_type_in
     )
     return updated_product_type
 
+@router.post("/product-types/bulk-delete", response_model=schemas.ProductTypeBulkDeleteResult)
+async def delete_product_types_bulk(
+    *,
+    db: AsyncSession = Depends(get_db),
+    product_types_in: schemas.ProductTypeBulkDelete,
+    current_user: models.AdminUser = Depends(get_current_admin_user)
+):
+    """Delete many product types and everything below them in one statement (requires admin privileges).
+
+    IDs that do not exist are skipped and left out of `deleted_ids`.
+    """
+    deleted_ids = await crud.remove_product_types(db=db, product_type_ids=product_types_in.ids)
+    return schemas.ProductTypeBulkDeleteResult(deleted_ids=deleted_ids)
+
 @router.delete("/product-types/{product_type_id}", response_model=schemas.ProductType)
-def delete_product_type(
+async def delete_product_type(
     product_type_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: models.AdminUser = Depends(get_current_admin_user)
 ):
     """Delete a product type (requires admin privileges)."""
-    deleted_product_type = crud.remove_product_type(db=db, product_type_id=product_type_id)
+    deleted_product_type = await crud.remove_product_type(db=db, product_type_id=product_type_id)
     if not deleted_product_type:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="ProductType not found")
-    return deleted_product_type 
\ No newline at end of file
+    return deleted_product_type
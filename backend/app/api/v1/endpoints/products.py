@@ -0,0 +1,157 @@
+from dataclasses import asdict
+from fastapi import APIRouter, Depends, HTTPException, status
+from typing import AbstractSet, Iterable
+
+from app import models, schemas
+from app.api.deps import catalog_etag, get_catalog_snapshot, get_compiled_product_type
+from app.core.catalog_cache import evaluation_cache
+from app.core.http_cache import PUBLIC_CACHE_CONTROL
+from app.core.selection_token import InvalidSelectionTokenError, decode_selection_token, encode_selection_token
+from app.rule_engine import CategoryEvaluation, CompiledProductType, InvalidSelectionError
+
+router = APIRouter()
+
+@router.get("/{product_type_id}/configuration", response_model=schemas.ProductConfiguration)
+async def read_product_configuration(
+    etag: str = Depends(catalog_etag(
+        models.ProductType.__tablename__,
+        models.PartCategory.__tablename__,
+        models.PartOption.__tablename__,
+        cache_control=PUBLIC_CACHE_CONTROL,
+    )),
+    snapshot: schemas.ProductConfiguration = Depends(get_catalog_snapshot),
+):
+    """Retrieve a product type with all of its part categories and options (public)."""
+    return snapshot
+
+def category_availability(categories: Iterable[CategoryEvaluation]) -> dict:
+    """The `configuration` part of an evaluate response, keyed by part category ID."""
+    return {
+        category.category_id: {
+            "available_options": category.available_options,
+            "disabled_options": [
+                {"id": option_id, "reason": reason} for option_id, reason in category.disabled_options
+            ],
+        }
+        for category in categories
+    }
+
+def evaluate_selection(compiled: CompiledProductType, selected_option_ids: AbstractSet[int]) -> dict:
+    """The selection-dependent part of an evaluate response."""
+    categories = compiled.compatibility.evaluate(selected_option_ids)
+    breakdown = compiled.pricing.price(selected_option_ids)
+    return {
+        "configuration": category_availability(categories),
+        "base_price": breakdown.base_price,
+        "total_price": breakdown.total_price,
+        "price_breakdown": [asdict(line) for line in breakdown.lines],
+    }
+
+def cached_evaluation(compiled: CompiledProductType, selected_option_ids: Iterable[int]) -> dict:
+    """`evaluate_selection`, cached per set of selected options until the catalog changes."""
+    key = (compiled.product_type_id, frozenset(selected_option_ids))
+    result = evaluation_cache.get(key, compiled.version)
+    if result is None:
+        try:
+            result = evaluate_selection(compiled, key[1])
+        except InvalidSelectionError as exc:
+            result = str(exc)
+        evaluation_cache.put(key, result, compiled.version)
+    if isinstance(result, str):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=result)
+    return result
+
+@router.post("/{product_type_id}/evaluate", response_model=schemas.ConfigurationEvaluateResponse)
+async def evaluate_configuration(
+    product_type_id: int,
+    selection: schemas.ConfigurationEvaluateRequest,
+    compiled: CompiledProductType = Depends(get_compiled_product_type),
+):
+    """Evaluate a (partial) selection: available options per category and the priced selection (public).
+
+    Results are cached per set of selected options until the catalog changes.
+    """
+    result = cached_evaluation(compiled, selection.selected_options)
+    return {"product_type_id": product_type_id, "selected_options": selection.selected_options, **result}
+
+@router.post("/{product_type_id}/selection", response_model=schemas.SelectionStateResponse)
+async def start_selection(
+    product_type_id: int,
+    selection: schemas.ConfigurationEvaluateRequest,
+    compiled: CompiledProductType = Depends(get_compiled_product_type),
+):
+    """Evaluate a selection like POST /evaluate and return a signed state token for PATCH /selection (public)."""
+    result = cached_evaluation(compiled, selection.selected_options)
+    return {
+        "product_type_id": product_type_id,
+        "selected_options": selection.selected_options,
+        "token": encode_selection_token(product_type_id, compiled.version, selection.selected_options),
+        **result,
+    }
+
+@router.patch("/{product_type_id}/selection", response_model=schemas.SelectionChangeResponse)
+async def change_selection(
+    product_type_id: int,
+    change: schemas.SelectionChangeRequest,
+    compiled: CompiledProductType = Depends(get_compiled_product_type),
+):
+    """Change the option of one category in the selection held by a state token (public).
+
+    Only the categories whose availability changed are returned, unless the
+    catalog changed since the token was issued; then every category is.
+    """
+    try:
+        state = decode_selection_token(change.token)
+    except InvalidSelectionTokenError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
+    if state.product_type_id != product_type_id:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Selection token belongs to another product type"
+        )
+    try:
+        selected, categories = compiled.compatibility.evaluate_change(
+            state.selected_options, change.category_id, change.new_option_id
+        )
+        if state.version != compiled.version:
+            categories = compiled.compatibility.evaluate(selected)
+    except InvalidSelectionError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
+    breakdown = compiled.pricing.price(selected)
+    return {
+        "product_type_id": product_type_id,
+        "token": encode_selection_token(product_type_id, compiled.version, selected),
+        "selected_options": selected,
+        "configuration": category_availability(categories),
+        "base_price": breakdown.base_price,
+        "total_price": breakdown.total_price,
+    }
+
+@router.post("/{product_type_id}/complete", response_model=schemas.ConfigurationCompleteResponse)
+async def complete_configuration(
+    product_type_id: int,
+    selection: schemas.ConfigurationCompleteRequest,
+    compiled: CompiledProductType = Depends(get_compiled_product_type),
+):
+    """Complete a partial selection with the cheapest (or most expensive) valid in-stock options (public).
+
+    The sum of the options' base prices is optimized; the returned total also
+    applies pricing rules.
+    """
+    try:
+        option_ids = compiled.completion.complete(selection.selected_options, selection.objective)
+    except InvalidSelectionError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
+    if option_ids is None:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="No valid in-stock configuration contains this selection.",
+        )
+    breakdown = compiled.pricing.price(option_ids)
+    return {
+        "product_type_id": product_type_id,
+        "objective": selection.objective,
+        "selected_options": option_ids,
+        "base_price": breakdown.base_price,
+        "total_price": breakdown.total_price,
+        "price_breakdown": [asdict(line) for line in breakdown.lines],
+    }
@@ -0,0 +1,51 @@
+import asyncio
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import AsyncIterator
+
+from app import crud
+from app.config import settings
+from app.core.change_feed import part_option_feed
+from app.db.session import get_db
+
+router = APIRouter()
+
+SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "X-Accel-Buffering": "no", # Keep nginx from buffering the stream
+}
+
+async def part_option_events(product_type_id: int) -> AsyncIterator[str]:
+    """Server-Sent Events frames for the part option changes of a product type, until the client leaves."""
+    subscription = part_option_feed.subscribe(product_type_id)
+    try:
+        yield ": connected\n\n"
+        while True:
+            if not await subscription.wait(settings.STREAM_HEARTBEAT_SECONDS):
+                yield ": heartbeat\n\n"
+                continue
+            # Let a burst of writes settle so it goes out as one frame per option
+            await asyncio.sleep(settings.STREAM_COALESCE_SECONDS)
+            yield "".join(f"event: {name}\ndata: {data}\n\n" for name, data in subscription.drain())
+    finally:
+        part_option_feed.unsubscribe(product_type_id, subscription)
+
+@router.get("/product-types/{product_type_id}")
+async def stream_product_type_changes(
+    product_type_id: int,
+    # Closed before streaming starts, so an open stream does not hold a connection
+    db: AsyncSession = Depends(get_db, scope="function"),
+):
+    """Stream stock and price changes of a product type's part options as Server-Sent Events (public).
+
+    Events: `part_option` (the option as read from the API), `part_option_deleted`
+    (`id`, `part_category_id`) and `resync` (reload the configuration, e.g. after
+    an import or when the client fell too far behind). Comment frames are sent
+    as heartbeats.
+    """
+    if await crud.get_product_type(db, product_type_id=product_type_id) is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="ProductType not found")
+    return StreamingResponse(
+        part_option_events(product_type_id), media_type="text/event-stream", headers=SSE_HEADERS
+    )
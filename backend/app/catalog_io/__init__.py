@@ -0,0 +1,9 @@
+from .parsing import (
+    FORMATS,
+    ImportFormatError,
+    ParsedRow,
+    format_from_content_type,
+    iter_rows,
+)
+from .importer import CatalogImporter, import_catalog
+from .exporter import iter_catalog_ndjson
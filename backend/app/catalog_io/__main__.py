@@ -0,0 +1,70 @@
+"""Catalog import and export from the command line.
+
+    python -m app.catalog_io import parts.csv
+    python -m app.catalog_io import parts.jsonl --format ndjson --batch-size 20000
+    python -m app.catalog_io export catalog.ndjson
+"""
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+from typing import AsyncIterator, Optional
+
+from app.catalog_io.exporter import iter_catalog_ndjson
+from app.catalog_io.importer import import_catalog
+from app.catalog_io.parsing import FORMATS, ImportFormatError, iter_rows
+from app.config import settings
+from app.db.session import AsyncSessionLocal, async_engine
+
+CHUNK_SIZE = 1 << 16
+EXTENSIONS = {".csv": "csv", ".ndjson": "ndjson", ".jsonl": "ndjson"}
+
+async def _read_chunks(path: Path) -> AsyncIterator[bytes]:
+    with path.open("rb") as file:
+        while chunk := file.read(CHUNK_SIZE):
+            yield chunk
+
+async def _import(path: Path, file_format: str, batch_size: int) -> int:
+    try:
+        async with AsyncSessionLocal() as db:
+            summary = await import_catalog(db, iter_rows(_read_chunks(path), file_format), batch_size=batch_size)
+    except ImportFormatError as exc:
+        print(f"{path}: {exc}", file=sys.stderr)
+        return 1
+    finally:
+        await async_engine.dispose()
+    print(summary.model_dump_json(indent=2))
+    return 0
+
+async def _export(path: Optional[Path]) -> int:
+    file = path.open("wb") if path else sys.stdout.buffer
+    try:
+        async with AsyncSessionLocal() as db:
+            async for chunk in iter_catalog_ndjson(db):
+                file.write(chunk)
+    finally:
+        if path:
+            file.close()
+        await async_engine.dispose()
+    return 0
+
+def main(argv: Optional[list] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m app.catalog_io", description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+    import_parser = commands.add_parser("import", help="Import a CSV or NDJSON catalog file")
+    import_parser.add_argument("path", type=Path)
+    import_parser.add_argument("--format", choices=FORMATS, help="Defaults from the file extension")
+    import_parser.add_argument("--batch-size", type=int, default=settings.CATALOG_IMPORT_BATCH_SIZE)
+    export_parser = commands.add_parser("export", help="Export the catalog as NDJSON")
+    export_parser.add_argument("path", type=Path, nargs="?", help="Defaults to standard output")
+    args = parser.parse_args(argv)
+
+    if args.command == "export":
+        return asyncio.run(_export(args.path))
+    file_format = args.format or EXTENSIONS.get(args.path.suffix.lower())
+    if file_format is None:
+        parser.error(f"cannot tell the format of {args.path}; pass --format")
+    return asyncio.run(_import(args.path, file_format, args.batch_size))
+
+if __name__ == "__main__":
+    sys.exit(main())
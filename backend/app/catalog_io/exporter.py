@@ -0,0 +1,70 @@
+"""Streaming NDJSON export of the catalog.
+
+Product types, then part categories, then part options are read through
+server-side cursors (`stream` with `yield_per`) and written out one batch at
+a time, so memory use does not depend on the catalog size and the first lines
+are sent while the rest is still being read. Every line is an import row
+(`schemas.CatalogImportRow`): parents are referenced by name rather than by
+database ID and come before their children, so an export can be imported
+into another database, including an empty one. All three queries run in one
+REPEATABLE READ transaction, so the export is a consistent snapshot.
+
+Compatibility and pricing rules are not exported: the import has no row kind
+for them.
+"""
+import json
+from typing import AsyncIterator
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import schemas
+from app.models import PartCategory, PartOption, ProductType
+
+EXPORT_BATCH_SIZE = 1000
+
+EXPORTS = (
+    (
+        "product_type",
+        schemas.ProductTypeImportRow,
+        select(ProductType.name, ProductType.description).order_by(ProductType.id),
+    ),
+    (
+        "part_category",
+        schemas.PartCategoryImportRow,
+        select(PartCategory.name, PartCategory.display_order, ProductType.name.label("product_type"))
+        .join(PartCategory.product_type)
+        .order_by(PartCategory.product_type_id, PartCategory.display_order, PartCategory.id),
+    ),
+    (
+        "part_option",
+        schemas.PartOptionImportRow,
+        select(
+            PartOption.name,
+            PartOption.base_price,
+            PartOption.is_in_stock,
+            ProductType.name.label("product_type"),
+            PartCategory.name.label("part_category"),
+        )
+        .join(PartOption.part_category)
+        .join(PartCategory.product_type)
+        .order_by(PartOption.part_category_id, PartOption.name, PartOption.id),
+    ),
+)
+
+async def iter_catalog_ndjson(db: AsyncSession, batch_size: int = EXPORT_BATCH_SIZE) -> AsyncIterator[bytes]:
+    """Yields the catalog as NDJSON, one chunk of up to `batch_size` lines at a time."""
+    # Start a fresh transaction so the isolation level applies to it
+    await db.rollback()
+    await db.connection(execution_options={"isolation_level": "REPEATABLE READ"})
+    try:
+        for kind, schema, statement in EXPORTS:
+            result = await db.stream(statement.execution_options(yield_per=batch_size))
+            async for rows in result.mappings().partitions():
+                lines = (
+                    json.dumps(schema(kind=kind, **row).model_dump(mode="json", exclude_unset=True)) + "\n"
+                    for row in rows
+                )
+                yield "".join(lines).encode("utf-8")
+    finally:
+        await db.rollback()
@@ -0,0 +1,273 @@
+"""Batched catalog import.
+
+Parsed rows are buffered per kind and, every `batch_size` rows, written with
+asyncpg's binary COPY into temporary staging tables. Each staging table is then
+merged into its catalog table with a handful of set-based statements: resolve
+parent references given by name, reject rows whose parent does not exist or
+that a later row of the batch overrides, update the rows that match on their
+natural key (product type name; product type and name; part category and name)
+and insert the rest. Buffers are flushed parents first, so rows may refer to
+parents earlier in the same file.
+
+The whole import runs in one transaction and commits once. Fields a row does
+not set keep their current value on update and take the model default on
+insert.
+"""
+from typing import AsyncIterator, Dict, List, Set, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import schemas
+from app.catalog_io.parsing import ParsedRow
+from app.config import settings
+from app.core.catalog_cache import catalog_version
+from app.core.change_feed import part_option_feed
+from app.models import PartCategory, PartOption, ProductType
+
+# Only the first rejections are reported, to keep the summary bounded
+MAX_REPORTED_ERRORS = 100
+
+# Serializes concurrent imports (categories and options have no unique key to upsert on)
+IMPORT_LOCK_KEY = 7_361_402_019
+
+STAGING_TABLES = {
+    "product_type": (
+        "catalog_import_product_types",
+        ("line", "name", "description"),
+        "line integer NOT NULL, name text NOT NULL, description text",
+    ),
+    "part_category": (
+        "catalog_import_part_categories",
+        ("line", "name", "display_order", "product_type_id", "product_type"),
+        "line integer NOT NULL, name text NOT NULL, display_order integer, "
+        "product_type_id integer, product_type text",
+    ),
+    "part_option": (
+        "catalog_import_part_options",
+        ("line", "name", "base_price", "is_in_stock", "part_category_id", "product_type", "part_category"),
+        "line integer NOT NULL, name text NOT NULL, base_price numeric(10, 2), is_in_stock boolean, "
+        "part_category_id integer, product_type text, part_category text",
+    ),
+}
+
+MERGE_PRODUCT_TYPES = (
+    text("""
+        DELETE FROM catalog_import_product_types AS s
+        USING catalog_import_product_types AS later
+        WHERE later.name = s.name AND later.line > s.line
+        RETURNING s.line
+    """),
+    text("""
+        INSERT INTO product_types (name, description, created_at, updated_at)
+        SELECT s.name, s.description, now(), now() FROM catalog_import_product_types AS s
+        ON CONFLICT (name) DO UPDATE
+        SET description = EXCLUDED.description, updated_at = now()
+        WHERE EXCLUDED.description IS NOT NULL
+          AND EXCLUDED.description IS DISTINCT FROM product_types.description
+        RETURNING (xmax = 0) AS inserted
+    """),
+)
+
+MERGE_PART_CATEGORIES = (
+    text("""
+        UPDATE catalog_import_part_categories AS s SET product_type_id = pt.id
+        FROM product_types AS pt
+        WHERE s.product_type_id IS NULL AND pt.name = s.product_type
+    """),
+    text("""
+        DELETE FROM catalog_import_part_categories AS s
+        WHERE NOT EXISTS (SELECT 1 FROM product_types AS pt WHERE pt.id = s.product_type_id)
+        RETURNING s.line, s.product_type_id, s.product_type
+    """),
+    text("""
+        DELETE FROM catalog_import_part_categories AS s
+        USING catalog_import_part_categories AS later
+        WHERE later.product_type_id = s.product_type_id AND later.name = s.name AND later.line > s.line
+        RETURNING s.line
+    """),
+    text("""
+        UPDATE part_categories AS c SET display_order = s.display_order, updated_at = now()
+        FROM catalog_import_part_categories AS s
+        WHERE c.product_type_id = s.product_type_id AND c.name = s.name
+          AND s.display_order IS NOT NULL AND c.display_order IS DISTINCT FROM s.display_order
+        RETURNING s.line
+    """),
+    text("""
+        INSERT INTO part_categories (name, display_order, product_type_id, created_at, updated_at)
+        SELECT s.name, COALESCE(s.display_order, 0), s.product_type_id, now(), now()
+        FROM catalog_import_part_categories AS s
+        WHERE NOT EXISTS (
+            SELECT 1 FROM part_categories AS c WHERE c.product_type_id = s.product_type_id AND c.name = s.name
+        )
+        RETURNING id
+    """),
+)
+
+MERGE_PART_OPTIONS = (
+    text("""
+        UPDATE catalog_import_part_options AS s SET part_category_id = c.id
+        FROM part_categories AS c JOIN product_types AS pt ON pt.id = c.product_type_id
+        WHERE s.part_category_id IS NULL AND pt.name = s.product_type AND c.name = s.part_category
+    """),
+    text("""
+        DELETE FROM catalog_import_part_options AS s
+        WHERE NOT EXISTS (SELECT 1 FROM part_categories AS c WHERE c.id = s.part_category_id)
+        RETURNING s.line, s.part_category_id, s.product_type, s.part_category
+    """),
+    text("""
+        DELETE FROM catalog_import_part_options AS s
+        USING catalog_import_part_options AS later
+        WHERE later.part_category_id = s.part_category_id AND later.name = s.name AND later.line > s.line
+        RETURNING s.line
+    """),
+    text("""
+        UPDATE part_options AS o
+        SET base_price = s.base_price, is_in_stock = COALESCE(s.is_in_stock, o.is_in_stock), updated_at = now()
+        FROM catalog_import_part_options AS s
+        WHERE o.part_category_id = s.part_category_id AND o.name = s.name
+          AND (o.base_price, o.is_in_stock) IS DISTINCT FROM (s.base_price, COALESCE(s.is_in_stock, o.is_in_stock))
+        RETURNING s.line
+    """),
+    text("""
+        INSERT INTO part_options (name, base_price, is_in_stock, part_category_id, created_at, updated_at)
+        SELECT s.name, s.base_price, COALESCE(s.is_in_stock, true), s.part_category_id, now(), now()
+        FROM catalog_import_part_options AS s
+        WHERE NOT EXISTS (
+            SELECT 1 FROM part_options AS o WHERE o.part_category_id = s.part_category_id AND o.name = s.name
+        )
+        RETURNING id
+    """),
+)
+
+DUPLICATE_ROW = "Overridden by a later row for the same {} in this file."
+
+def _set_value(row, field: str):
+    """The value of a field the row actually set, else None (keep/default)."""
+    return getattr(row, field) if field in row.model_fields_set else None
+
+def _staging_record(line: int, row) -> Tuple:
+    if row.kind == "product_type":
+        return (line, row.name, _set_value(row, "description"))
+    if row.kind == "part_category":
+        return (line, row.name, _set_value(row, "display_order"), row.product_type_id, row.product_type)
+    return (
+        line,
+        row.name,
+        row.base_price,
+        _set_value(row, "is_in_stock"),
+        row.part_category_id,
+        row.product_type,
+        row.part_category,
+    )
+
+class CatalogImporter:
+    def __init__(self, db: AsyncSession, batch_size: int = settings.CATALOG_IMPORT_BATCH_SIZE) -> None:
+        self.db = db
+        self.batch_size = batch_size
+        self.summary = schemas.CatalogImportSummary()
+        self.buffers: Dict[str, List[Tuple]] = {kind: [] for kind in STAGING_TABLES}
+        self.touched_tables: Set[str] = set()
+
+    async def run(self, rows: AsyncIterator[ParsedRow]) -> schemas.CatalogImportSummary:
+        await self._prepare()
+        buffered = 0
+        async for parsed in rows:
+            if parsed.error:
+                self._reject(parsed.line, parsed.error)
+                continue
+            self.buffers[parsed.row.kind].append(_staging_record(parsed.line, parsed.row))
+            buffered += 1
+            if buffered >= self.batch_size:
+                await self._flush()
+                buffered = 0
+        await self._flush()
+        if self.touched_tables:
+            await catalog_version.bump(self.db, *self.touched_tables)
+        await self.db.commit()
+        if PartOption.__tablename__ in self.touched_tables:
+            # Imports can touch any number of options; subscribers reload instead of getting one event each
+            part_option_feed.resync()
+        return self.summary
+
+    def _reject(self, line: int, detail: str) -> None:
+        self.summary.rejected += 1
+        if len(self.summary.errors) < MAX_REPORTED_ERRORS:
+            self.summary.errors.append(schemas.CatalogImportError(line=line, detail=detail))
+
+    def _count(self, table_name: str, staged: int, inserted: int, updated: int) -> None:
+        self.summary.inserted += inserted
+        self.summary.updated += updated
+        self.summary.unchanged += staged - inserted - updated
+        if inserted or updated:
+            self.touched_tables.add(table_name)
+
+    async def _prepare(self) -> None:
+        await self.db.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": IMPORT_LOCK_KEY})
+        for table, _, columns in STAGING_TABLES.values():
+            await self.db.execute(text(f"CREATE TEMPORARY TABLE {table} ({columns}) ON COMMIT DROP"))
+
+    async def _flush(self) -> None:
+        # Parents first, so children in the same batch can resolve them
+        for kind, merge in (
+            ("product_type", self._merge_product_types),
+            ("part_category", self._merge_part_categories),
+            ("part_option", self._merge_part_options),
+        ):
+            records = self.buffers[kind]
+            if not records:
+                continue
+            table, columns, _ = STAGING_TABLES[kind]
+            connection = await self.db.connection()
+            raw_connection = await connection.get_raw_connection()
+            await raw_connection.driver_connection.copy_records_to_table(table, records=records, columns=columns)
+            await merge(len(records))
+            await self.db.execute(text(f"TRUNCATE {table}"))
+            self.buffers[kind] = []
+
+    async def _merge_product_types(self, staged: int) -> None:
+        deduplicate, upsert = MERGE_PRODUCT_TYPES
+        for (line,) in await self.db.execute(deduplicate):
+            self._reject(line, DUPLICATE_ROW.format("product type"))
+            staged -= 1
+        flags = (await self.db.scalars(upsert)).all()
+        inserted = sum(1 for flag in flags if flag)
+        self._count(ProductType.__tablename__, staged, inserted, len(flags) - inserted)
+
+    async def _merge_part_categories(self, staged: int) -> None:
+        resolve, orphans, deduplicate, update, insert = MERGE_PART_CATEGORIES
+        await self.db.execute(resolve)
+        for line, product_type_id, product_type in await self.db.execute(orphans):
+            if product_type_id is not None:
+                self._reject(line, f"ProductType with id {product_type_id} not found.")
+            else:
+                self._reject(line, f"ProductType '{product_type}' not found.")
+            staged -= 1
+        for (line,) in await self.db.execute(deduplicate):
+            self._reject(line, DUPLICATE_ROW.format("part category"))
+            staged -= 1
+        updated = len(set((await self.db.scalars(update)).all()))
+        inserted = len((await self.db.scalars(insert)).all())
+        self._count(PartCategory.__tablename__, staged, inserted, updated)
+
+    async def _merge_part_options(self, staged: int) -> None:
+        resolve, orphans, deduplicate, update, insert = MERGE_PART_OPTIONS
+        await self.db.execute(resolve)
+        for line, part_category_id, product_type, part_category in await self.db.execute(orphans):
+            if part_category_id is not None:
+                self._reject(line, f"PartCategory with id {part_category_id} not found.")
+            else:
+                self._reject(line, f"PartCategory '{part_category}' not found in ProductType '{product_type}'.")
+            staged -= 1
+        for (line,) in await self.db.execute(deduplicate):
+            self._reject(line, DUPLICATE_ROW.format("part option"))
+            staged -= 1
+        updated = len(set((await self.db.scalars(update)).all()))
+        inserted = len((await self.db.scalars(insert)).all())
+        self._count(PartOption.__tablename__, staged, inserted, updated)
+
+async def import_catalog(
+    db: AsyncSession, rows: AsyncIterator[ParsedRow], batch_size: int = settings.CATALOG_IMPORT_BATCH_SIZE
+) -> schemas.CatalogImportSummary:
+    """Imports parsed rows (see `app.catalog_io.parsing.iter_rows`) and returns the summary."""
+    return await CatalogImporter(db, batch_size=batch_size).run(rows)
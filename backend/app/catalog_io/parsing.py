@@ -0,0 +1,157 @@
+"""Incremental parsing of catalog import files.
+
+Files are consumed as an async stream of byte chunks and turned into validated
+rows one record at a time, so memory use is bounded by the longest record, not
+by the file. CSV files need a header row naming the fields; NDJSON files have
+one JSON object per line. Empty CSV cells count as missing fields.
+"""
+import codecs
+import csv
+import json
+from decimal import Decimal
+from typing import AsyncIterator, NamedTuple, Optional, Tuple
+
+from pydantic import TypeAdapter, ValidationError
+
+from app import schemas
+
+FORMATS = ("csv", "ndjson")
+CONTENT_TYPES = {
+    "text/csv": "csv",
+    "application/csv": "csv",
+    "application/x-ndjson": "ndjson",
+    "application/ndjson": "ndjson",
+    "application/jsonl": "ndjson",
+}
+
+MAX_RECORD_CHARS = 1 << 20
+
+# Limits of the catalog columns; rows outside them are rejected up front
+# because a single failing row would abort a whole COPY batch
+MAX_NAME_LENGTH = 100
+MAX_PRICE = Decimal("99999999.99")
+MAX_INT = 2**31 - 1
+
+class ImportFormatError(ValueError):
+    """Raised when the file as a whole cannot be read (as opposed to a bad row)."""
+
+class ParsedRow(NamedTuple):
+    line: int
+    row: Optional[schemas.CatalogImportRow]
+    error: Optional[str]
+
+_row_adapter = TypeAdapter(schemas.CatalogImportRow)
+
+def format_from_content_type(content_type: Optional[str]) -> Optional[str]:
+    media_type = (content_type or "").split(";")[0].strip().lower()
+    return CONTENT_TYPES.get(media_type)
+
+async def _iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[Tuple[int, str]]:
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    pending = ""
+    number = 0
+    try:
+        async for chunk in chunks:
+            pending += decoder.decode(chunk)
+            *lines, pending = pending.split("\n")
+            for line in lines:
+                number += 1
+                yield number, line.rstrip("\r")
+            if len(pending) > MAX_RECORD_CHARS:
+                raise ImportFormatError(f"Line {number + 1} is longer than {MAX_RECORD_CHARS} characters")
+        pending += decoder.decode(b"", final=True)
+    except UnicodeDecodeError as exc:
+        raise ImportFormatError(f"File is not valid UTF-8 (after line {number})") from exc
+    if pending:
+        yield number + 1, pending.rstrip("\r")
+
+async def _iter_ndjson_records(chunks: AsyncIterator[bytes]) -> AsyncIterator[Tuple[int, object]]:
+    async for number, line in _iter_lines(chunks):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError:
+            yield number, "Invalid JSON"
+            continue
+        yield number, record if isinstance(record, dict) else "Expected a JSON object"
+
+async def _iter_csv_records(chunks: AsyncIterator[bytes]) -> AsyncIterator[Tuple[int, object]]:
+    header = None
+    record = ""
+    start = 0
+    async for number, line in _iter_lines(chunks):
+        if not record:
+            start = number
+            record = line
+        else:
+            record += "\n" + line
+        # An odd number of quotes means a quoted field continues on the next line
+        if record.count('"') % 2:
+            if len(record) > MAX_RECORD_CHARS:
+                raise ImportFormatError(f"Record on line {start} is longer than {MAX_RECORD_CHARS} characters")
+            continue
+        text, record = record, ""
+        if not text.strip():
+            continue
+        try:
+            values = next(csv.reader([text]))
+        except csv.Error as exc:
+            yield start, f"Invalid CSV: {exc}"
+            continue
+        if header is None:
+            header = [name.strip() for name in values]
+            continue
+        if len(values) > len(header):
+            yield start, f"Expected at most {len(header)} fields, got {len(values)}"
+            continue
+        yield start, {name: value for name, value in zip(header, values) if name and value != ""}
+    if record:
+        yield start, "Unterminated quoted field"
+    if header is None:
+        raise ImportFormatError("CSV file has no header row")
+
+def _validation_message(exc: ValidationError) -> str:
+    error = exc.errors()[0]
+    location = ".".join(str(part) for part in error["loc"])
+    return f"{location}: {error['msg']}" if location else error["msg"]
+
+def _check_row(row) -> Optional[str]:
+    """Returns why a validated row cannot be stored, if it cannot."""
+    for field in ("name", "description", "product_type", "part_category"):
+        value = getattr(row, field, None)
+        if value is None:
+            continue
+        if "\x00" in value:
+            return f"{field}: NUL characters are not allowed"
+        if field != "description" and len(value) > MAX_NAME_LENGTH:
+            return f"{field}: longer than {MAX_NAME_LENGTH} characters"
+    for field in ("display_order", "product_type_id", "part_category_id"):
+        value = getattr(row, field, None)
+        if value is not None and abs(value) > MAX_INT:
+            return f"{field}: out of range"
+    if row.kind == "part_category" and row.product_type_id is None and not row.product_type:
+        return "product_type_id or product_type is required"
+    if row.kind == "part_option":
+        if abs(row.base_price) > MAX_PRICE:
+            return "base_price: out of range"
+        if row.part_category_id is None and not (row.product_type and row.part_category):
+            return "part_category_id, or product_type and part_category, are required"
+    return None
+
+async def iter_rows(chunks: AsyncIterator[bytes], file_format: str) -> AsyncIterator[ParsedRow]:
+    """Yields every record of the file, validated against the import row schemas."""
+    if file_format not in FORMATS:
+        raise ImportFormatError(f"Unsupported format '{file_format}'")
+    records = _iter_csv_records(chunks) if file_format == "csv" else _iter_ndjson_records(chunks)
+    async for line, record in records:
+        if isinstance(record, str):
+            yield ParsedRow(line, None, record)
+            continue
+        try:
+            row = _row_adapter.validate_python(record)
+        except ValidationError as exc:
+            yield ParsedRow(line, None, _validation_message(exc))
+            continue
+        error = _check_row(row)
+        yield ParsedRow(line, None if error else row, error)
@@ -11,6 +11,10 @@ class Settings(BaseSettings):
     )
 
     DATABASE_URL: str
+    # Optional read replicas, comma-separated; GET/HEAD requests are sent to them
+    DATABASE_REPLICA_URLS: str = ""
+    # Seconds a client keeps reading from the primary after it wrote something
+    READ_YOUR_WRITES_SECONDS: float = 5
     # Add TEST_DATABASE_URL. It will be loaded from .env
     TEST_DATABASE_URL: str | None = None 
 
@@ -18,6 +22,47 @@ class Settings(BaseSettings):
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     ALGORITHM: str = "HS256" # Add JWT algorithm
 
+    # Password hashing (stored hashes are upgraded on login when the cost changes)
+    BCRYPT_ROUNDS: int = 12
+    PASSWORD_HASHING_WORKERS: int = 2
+    PASSWORD_HASHING_MAX_PENDING: int = 32 # Logins beyond this many in flight get a 503
+
+    # In-process caches (entries are product types)
+    CATALOG_CACHE_SIZE: int = 256
+    # Evaluated selections (entries are (product type, option set) pairs)
+    EVALUATION_CACHE_SIZE: int = 4096
+    # Authenticated admin users, per bearer token
+    PRINCIPAL_CACHE_SIZE: int = 1024
+    PRINCIPAL_CACHE_TTL_SECONDS: int = 60
+    # Verified JWT claims, per bearer token (entries expire with the token)
+    TOKEN_CLAIMS_CACHE_SIZE: int = 4096
+
+    # Database connection pool (per worker process)
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30 # Seconds to wait for a free connection
+    DB_POOL_RECYCLE: int = 1800 # Seconds before a connection is replaced
+    DB_STATEMENT_CACHE_SIZE: int = 100 # asyncpg prepared statements kept per connection
+    DB_POOL_WARM_CONNECTIONS: int = 2 # Opened and primed at startup (at most DB_POOL_SIZE)
+
+    # Configuration analytics (memoized states before giving up on an exact count)
+    CONFIGURATION_ANALYTICS_MAX_STATES: int = 1_000_000
+
+    # Serve admin list pages from loaded rows with orjson instead of revalidating them (see app.core.fast_json)
+    FAST_JSON_RESPONSES: bool = False
+
+    # Catalog import (rows written per COPY + merge round)
+    CATALOG_IMPORT_BATCH_SIZE: int = 5000
+
+    # Configurator WebSocket sessions (per worker process)
+    CONFIGURATOR_MAX_SESSIONS: int = 1000
+    CONFIGURATOR_IDLE_TIMEOUT_SECONDS: float = 300 # Closed after this long without a message
+
+    # Server-Sent Events change streams
+    STREAM_MAX_PENDING_EVENTS: int = 256 # Per subscriber; beyond this the client is told to resync
+    STREAM_COALESCE_SECONDS: float = 0.25 # Writes within this window go out as one frame per option
+    STREAM_HEARTBEAT_SECONDS: float = 15 # Comment frame sent when nothing changed, keeps proxies from timing out
+
     @computed_field
     @property
     def POSTGRES_DB(self) -> str:
@@ -27,5 +72,11 @@ class Settings(BaseSettings):
         db_name = parsed_url.path.lstrip('/')
         return db_name
 
+    @computed_field
+    @property
+    def REPLICA_URLS(self) -> list[str]:
+        """Splits DATABASE_REPLICA_URLS into a list."""
+        return [url.strip() for url in self.DATABASE_REPLICA_URLS.split(",") if url.strip()]
+
 # Create a single instance of the settings to be imported
 settings = Settings() 
\ No newline at end of file
@@ -0,0 +1,105 @@
+"""In-process caches on the admin authentication path.
+
+`claims_cache` maps a token digest to the claims of a JWT whose signature has
+already been verified (see app.core.security.verify_token). Entries expire
+with the token's `exp` claim, so an expired token is never served from it.
+
+`principal_cache` maps a (username, token digest) pair to the admin user it was
+resolved to, so steady-state admin requests do not query the database to
+confirm their user still exists. Entries live for PRINCIPAL_CACHE_TTL_SECONDS
+and are dropped as soon as the user is updated or deleted through the ORM (see
+app.crud.crud_admin_user). Caches are per process.
+"""
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from app.config import settings
+
+def token_digest(token: str) -> str:
+    """Stable key for a bearer token that does not keep the token itself in memory."""
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+class ExpiringLRUCache:
+    """Bounded LRU mapping whose entries expire at a per-entry deadline.
+
+    Deadlines are `time.monotonic()` values.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        if entry[0] <= time.monotonic():
+            del self._entries[key]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def put(self, key: Hashable, value: Any, expires_at: float) -> None:
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def discard_where(self, predicate: Callable[[Any], bool]) -> int:
+        """Drops every entry whose value matches; returns how many were dropped."""
+        stale = [key for key, (_, value) in self._entries.items() if predicate(value)]
+        for key in stale:
+            del self._entries[key]
+        return len(stale)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, float]:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+        }
+
+# token digest -> verified JWT claims
+claims_cache = ExpiringLRUCache(maxsize=settings.TOKEN_CLAIMS_CACHE_SIZE)
+
+def cache_claims(token: str, claims: Dict[str, Any]) -> None:
+    """Remembers the verified claims of a token until its `exp` (tokens without one are not cached)."""
+    expires = claims.get("exp")
+    if not isinstance(expires, (int, float)):
+        return
+    # `exp` is wall-clock time; deadlines are monotonic
+    claims_cache.put(token_digest(token), claims, time.monotonic() + (expires - time.time()))
+
+def get_cached_claims(token: str) -> Optional[Dict[str, Any]]:
+    return claims_cache.get(token_digest(token))
+
+# (username, token digest) -> detached models.AdminUser
+principal_cache = ExpiringLRUCache(maxsize=settings.PRINCIPAL_CACHE_SIZE)
+
+def cache_principal(username: str, token: str, user: Any) -> None:
+    principal_cache.put(
+        (username, token_digest(token)), user, time.monotonic() + settings.PRINCIPAL_CACHE_TTL_SECONDS
+    )
+
+def get_cached_principal(username: str, token: str) -> Optional[Any]:
+    return principal_cache.get((username, token_digest(token)))
+
+def invalidate_admin_user(user_id: int) -> int:
+    """Forgets every cached principal of an admin user (after it was changed or deleted)."""
+    return principal_cache.discard_where(lambda user: user.id == user_id)
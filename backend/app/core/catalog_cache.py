@@ -0,0 +1,125 @@
+"""Catalog caching keyed by a monotonically increasing catalog version.
+
+Every catalog write (product types, part categories, part options and rules)
+bumps the catalog version inside its own transaction. Cached entries remember
+the version they were built from and are ignored once it moves on, so
+invalidation is a single integer increment and a reader that loaded rows
+concurrently with a write can never publish stale data.
+
+Versions live in the database (table catalog_versions), so every worker sees
+the same versions and hands out the same ETags. Writers serialize on the row
+of the whole catalog, so versions grow in commit order. A request reads all
+versions with one query before it loads anything, on the server it reads the
+data from (a replica reports its own, possibly older, versions), and keeps
+them for the rest of its session. The caches themselves stay per process.
+"""
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.models.catalog_version import CatalogTableVersion
+
+# Row of catalog_versions holding the version of the whole catalog
+WHOLE_CATALOG = "*"
+
+# Key of the versions read by a session, in AsyncSession.info
+SESSION_INFO_KEY = "catalog_versions"
+
+@dataclass(frozen=True)
+class CatalogVersions:
+    """The catalog versions as read by one session."""
+    current: int = 0 # Version of the whole catalog
+    tables: Dict[str, int] = field(default_factory=dict)
+
+    def table(self, table_name: str) -> int:
+        """Version of a single table, for validators that only depend on that table."""
+        return self.tables.get(table_name, 0)
+
+class CatalogVersion:
+    """Global catalog version plus one change counter per table, stored in the database."""
+
+    async def read(self, db: AsyncSession) -> CatalogVersions:
+        """The versions seen by `db`, read once and then kept until the session bumps them.
+
+        Read before loading the rows a cache entry is built from.
+        """
+        versions = db.info.get(SESSION_INFO_KEY)
+        if versions is None:
+            result = await db.execute(select(CatalogTableVersion.table_name, CatalogTableVersion.version))
+            tables = dict(result.all())
+            versions = CatalogVersions(current=tables.pop(WHOLE_CATALOG, 0), tables=tables)
+            db.info[SESSION_INFO_KEY] = versions
+        return versions
+
+    async def bump(self, db: AsyncSession, *table_names: str) -> int:
+        """Marks every cached catalog entry as stale. Call before the write commits.
+
+        `table_names` lists every table the write touched, including rows removed
+        by cascades. The version becomes visible with the commit and is dropped
+        with a rollback, together with the write.
+        """
+        statement = insert(CatalogTableVersion).values(table_name=WHOLE_CATALOG, version=1)
+        statement = statement.on_conflict_do_update(
+            index_elements=[CatalogTableVersion.table_name],
+            set_={"version": CatalogTableVersion.version + 1},
+        ).returning(CatalogTableVersion.version)
+        # Holds the row lock until commit, so concurrent writers take turns
+        version = await db.scalar(statement)
+        if table_names:
+            statement = insert(CatalogTableVersion).values(
+                [{"table_name": table_name, "version": version} for table_name in sorted(set(table_names))]
+            )
+            statement = statement.on_conflict_do_update(
+                index_elements=[CatalogTableVersion.table_name], set_={"version": statement.excluded.version}
+            )
+            await db.execute(statement)
+        # Later reads in this session must not be served entries from before the write
+        db.info.pop(SESSION_INFO_KEY, None)
+        return version
+
+class VersionedLRUCache:
+    """Bounded LRU mapping whose entries are only valid for one catalog version."""
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Hashable, Tuple[int, Any]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, version: int) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None or entry[0] != version:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def put(self, key: Hashable, value: Any, version: int) -> None:
+        self._entries[key] = (version, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, int]:
+        return {"size": len(self._entries), "maxsize": self.maxsize, "hits": self.hits, "misses": self.misses}
+
+catalog_version = CatalogVersion()
+
+# Product type ID -> schemas.ProductConfiguration (the full category/option tree)
+catalog_cache = VersionedLRUCache(maxsize=settings.CATALOG_CACHE_SIZE)
+
+# (product type ID, frozenset of selected option IDs) -> evaluation result of
+# POST /products/{product_type_id}/evaluate, or the error detail of an invalid selection
+evaluation_cache = VersionedLRUCache(maxsize=settings.EVALUATION_CACHE_SIZE)
@@ -0,0 +1,94 @@
+"""In-process change feeds for streaming catalog updates to clients.
+
+Writers publish an event per changed row to a topic (a product type). Every
+subscriber of the topic gets a bounded queue of pending events keyed by row:
+a newer event for a row replaces the queued one, so a burst of writes to one
+option reaches a slow client as a single update. A subscriber that falls
+more than `max_pending` rows behind has its queue dropped and is told to
+resync (reload the catalog) instead, so memory per subscriber stays bounded.
+Feeds are per process, unlike the catalog version: each worker only sees the
+writes it handled itself.
+"""
+import asyncio
+from typing import Dict, Hashable, List, Optional, Set, Tuple
+
+from app.config import settings
+
+# (event name, JSON data) as sent in a Server-Sent Events frame
+Event = Tuple[str, str]
+
+RESYNC_EVENT: Event = ("resync", "{}")
+
+class Subscription:
+    """Pending events of one subscriber, coalesced per row."""
+
+    def __init__(self, max_pending: int) -> None:
+        self.max_pending = max_pending
+        self.pending: Dict[Hashable, Event] = {}
+        self.resync = False
+        self._ready = asyncio.Event()
+
+    def push(self, key: Hashable, event: Event) -> None:
+        if key not in self.pending and len(self.pending) >= self.max_pending:
+            self.request_resync()
+        self.pending[key] = event
+        self._ready.set()
+
+    def request_resync(self) -> None:
+        """Drops the queued events; the client reloads everything instead."""
+        self.pending.clear()
+        self.resync = True
+        self._ready.set()
+
+    async def wait(self, timeout: float) -> bool:
+        """Waits until events are pending; False if none arrived within `timeout` seconds."""
+        try:
+            await asyncio.wait_for(self._ready.wait(), timeout)
+        except asyncio.TimeoutError:
+            return False
+        return True
+
+    def drain(self) -> List[Event]:
+        events = ([RESYNC_EVENT] if self.resync else []) + list(self.pending.values())
+        self.pending.clear()
+        self.resync = False
+        self._ready.clear()
+        return events
+
+class ChangeFeed:
+    """Fans events out to the subscribers of a topic."""
+
+    def __init__(self, max_pending: int) -> None:
+        self.max_pending = max_pending
+        self._subscribers: Dict[Hashable, Set[Subscription]] = {}
+
+    @property
+    def has_subscribers(self) -> bool:
+        """Lets writers skip building events nobody would receive."""
+        return bool(self._subscribers)
+
+    def subscribe(self, topic: Hashable) -> Subscription:
+        subscription = Subscription(self.max_pending)
+        self._subscribers.setdefault(topic, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, topic: Hashable, subscription: Subscription) -> None:
+        subscribers = self._subscribers.get(topic)
+        if subscribers is not None:
+            subscribers.discard(subscription)
+            if not subscribers:
+                del self._subscribers[topic]
+
+    def publish(self, topic: Hashable, key: Hashable, event: Event) -> None:
+        for subscription in self._subscribers.get(topic, ()):
+            subscription.push(key, event)
+
+    def resync(self, topic: Optional[Hashable] = None) -> None:
+        """Tells the subscribers of `topic` (of every topic if None) to reload."""
+        topics = list(self._subscribers) if topic is None else [topic]
+        for name in topics:
+            for subscription in self._subscribers.get(name, ()):
+                subscription.request_resync()
+
+# Part option changes, per product type
+part_option_feed = ChangeFeed(max_pending=settings.STREAM_MAX_PENDING_EVENTS)
@@ -0,0 +1,57 @@
+"""Opt-in fast JSON responses for lists of trusted ORM rows.
+
+With `response_model=List[schemas.X]`, FastAPI validates every returned ORM
+object into a pydantic model (reading each attribute through SQLAlchemy's
+instrumentation) before serializing it. For rows just loaded from our own
+database that validation cannot fail, yet it dominates the CPU time of a
+100-row page. `RowSerializer` instead copies the schema's fields straight
+from the loaded row state into plain dicts and encodes them with orjson.
+The bytes are the same as the response_model path: fields in schema order,
+compact separators, UTF-8, decimals as strings and enums as their values
+(see benchmarks/fast_json_responses.py, which also checks this).
+
+Enabled with the FAST_JSON_RESPONSES setting.
+"""
+from decimal import Decimal
+from typing import Any, Dict, Iterable, List, Optional, Type
+
+import orjson
+from fastapi import Response
+from pydantic import BaseModel
+
+def _default(value: Any) -> Any:
+    # The only column type orjson does not encode itself; pydantic writes str(decimal) too
+    if isinstance(value, Decimal):
+        return str(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+def dumps(content: Any) -> bytes:
+    return orjson.dumps(content, default=_default)
+
+class RowSerializer:
+    """Serializes ORM rows as `schema` would, without validating them."""
+
+    def __init__(self, schema: Type[BaseModel]) -> None:
+        decorators = schema.__pydantic_decorators__
+        if decorators.field_serializers or decorators.model_serializers or any(
+            field.alias or field.serialization_alias for field in schema.model_fields.values()
+        ):
+            raise TypeError(f"{schema.__name__} customizes serialization; use its response_model instead")
+        self.schema = schema
+        self.fields = list(schema.model_fields)
+
+    def to_dicts(self, rows: Iterable[Any]) -> List[Dict[str, Any]]:
+        fields = self.fields
+        dicts = []
+        for row in rows:
+            # Loaded column values live in the instance dict; anything else (expired) goes through the ORM
+            loaded = row.__dict__
+            dicts.append({field: loaded[field] if field in loaded else getattr(row, field) for field in fields})
+        return dicts
+
+    def response(self, rows: Iterable[Any], response: Optional[Response] = None) -> Response:
+        """A JSON response of `rows`, carrying the headers already set on the endpoint's `response`."""
+        fast_response = Response(content=dumps(self.to_dicts(rows)), media_type="application/json")
+        if response is not None:
+            fast_response.headers.raw.extend(response.headers.raw)
+        return fast_response
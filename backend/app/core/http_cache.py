@@ -0,0 +1,52 @@
+"""HTTP validators (ETag / Last-Modified) for catalog reads.
+
+ETags are derived from the catalog table versions (see app.core.catalog_cache)
+plus the request path and query, so a conditional request can be answered with
+304 after reading the versions alone. The versions are stored in the database,
+so every worker hands out the same tag for the same data.
+"""
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime
+from typing import Dict, Iterable, Optional
+
+# Revalidate on every use; admin responses must not be kept by shared caches
+ADMIN_CACHE_CONTROL = "private, no-cache"
+PUBLIC_CACHE_CONTROL = "public, no-cache"
+
+def make_etag(*parts: object) -> str:
+    """Builds a strong ETag from the values the response depends on."""
+    digest = hashlib.sha256("|".join(map(str, parts)).encode("utf-8")).hexdigest()
+    return f'"{digest[:32]}"'
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against an ETag (RFC 9110 13.1.2)."""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+def cache_headers(etag: str, cache_control: str = ADMIN_CACHE_CONTROL) -> Dict[str, str]:
+    return {"ETag": etag, "Cache-Control": cache_control}
+
+def format_last_modified(timestamps: Iterable[Optional[datetime]]) -> Optional[str]:
+    """HTTP date of the most recent timestamp; naive values are treated as UTC."""
+    latest = max((ts for ts in timestamps if ts is not None), default=None)
+    if latest is None:
+        return None
+    if latest.tzinfo is None:
+        latest = latest.replace(tzinfo=timezone.utc)
+    return format_datetime(latest.astimezone(timezone.utc), usegmt=True)
+
+def set_last_modified(response, rows) -> None:
+    """Sets Last-Modified from the `updated_at` of the returned ORM rows, if any."""
+    last_modified = format_last_modified(row.updated_at for row in rows)
+    if last_modified:
+        response.headers["Last-Modified"] = last_modified
@@ -0,0 +1,70 @@
+"""Keyset (cursor) pagination for list endpoints.
+
+A page is requested with the sort key of the last row already seen instead of
+an offset: `WHERE (a, b) > (:a, :b) ORDER BY a, b LIMIT :limit` is served from
+an index at any depth and does not skip or repeat rows when rows are inserted
+or deleted between two pages. The sort key is handed to clients as an opaque
+URL-safe cursor. Every ordering ends with the primary key so it is total.
+"""
+import base64
+import json
+from typing import Any, List, Optional, Sequence
+
+from sqlalchemy import Select, tuple_
+
+# Response header carrying the cursor of the next page (absent on the last page)
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+class InvalidCursorError(ValueError):
+    """Raised when a cursor was not produced for this ordering."""
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    payload = json.dumps(list(values), separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(payload).decode("ascii").rstrip("=")
+
+def decode_cursor(cursor: str, order_by: Sequence) -> List[Any]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (ValueError, UnicodeError) as exc:
+        raise InvalidCursorError("Malformed cursor") from exc
+    if not isinstance(values, list) or len(values) != len(order_by):
+        raise InvalidCursorError("Cursor does not match this listing")
+    for value, column in zip(values, order_by):
+        if not isinstance(value, column.type.python_type) or isinstance(value, bool):
+            raise InvalidCursorError("Cursor does not match this listing")
+    return values
+
+def paginate(
+    statement: Select,
+    order_by: Sequence,
+    *,
+    cursor: Optional[str] = None,
+    skip: int = 0,
+    limit: Optional[int] = None,
+) -> Select:
+    """Orders `statement` by `order_by` and restricts it to the requested page.
+
+    `skip` is the deprecated offset fallback and is ignored when a cursor is given.
+    """
+    statement = statement.order_by(*order_by)
+    if cursor is not None:
+        statement = statement.where(tuple_(*order_by) > tuple_(*decode_cursor(cursor, order_by)))
+    elif skip:
+        statement = statement.offset(skip)
+    return statement.limit(limit)
+
+def next_cursor(rows: Sequence, order_by: Sequence, limit: Optional[int]) -> Optional[str]:
+    """Cursor of the page after `rows`, or None if `rows` was not a full page."""
+    if not rows or limit is None or len(rows) < limit:
+        return None
+    last = rows[-1]
+    return encode_cursor([getattr(last, column.key) for column in order_by])
+
+def set_next_cursor(response, request, cursor: Optional[str]) -> None:
+    """Advertises the next page as a header and an RFC 8288 `Link: rel="next"`."""
+    if cursor is None:
+        return
+    next_url = request.url.remove_query_params("skip").include_query_params(cursor=cursor)
+    response.headers[NEXT_CURSOR_HEADER] = cursor
+    response.headers["Link"] = f'<{next_url}>; rel="next"'
@@ -1,20 +1,82 @@
+import asyncio
 import bcrypt
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import Any
+from typing import Any, Callable, TypeVar
 from jose import jwt, JWTError
 from fastapi import HTTPException, status
 from app.config import settings
+from app.core.auth_cache import cache_claims, get_cached_claims
 
-def hash_password(plain_password: str) -> str:
-    """Hashes a plain text password using bcrypt."""
+T = TypeVar("T")
+
+def hash_password(plain_password: str, rounds: int | None = None) -> str:
+    """Hashes a plain text password using bcrypt (cost factor BCRYPT_ROUNDS by default)."""
     # Generate a salt and hash the password
-    hashed_bytes = bcrypt.hashpw(plain_password.encode('utf-8'), bcrypt.gensalt())
+    salt = bcrypt.gensalt(rounds=rounds or settings.BCRYPT_ROUNDS)
+    hashed_bytes = bcrypt.hashpw(plain_password.encode('utf-8'), salt)
     return hashed_bytes.decode('utf-8') # Return the hash as a string
 
 def check_password(plain_password: str, hashed_password: str) -> bool:
     """Verifies a plain text password against a stored bcrypt hash."""
     return bcrypt.checkpw(plain_password.encode('utf-8'), hashed_password.encode('utf-8'))
 
+def password_needs_rehash(hashed_password: str) -> bool:
+    """True if a stored hash was made with a different cost factor than BCRYPT_ROUNDS."""
+    # bcrypt hashes look like $2b$12$<salt and hash>
+    try:
+        rounds = int(hashed_password.split("$")[2])
+    except (IndexError, ValueError):
+        return True
+    return rounds != settings.BCRYPT_ROUNDS
+
+# --- Password hashing off the event loop ---
+class PasswordHashingBusyError(Exception):
+    """Raised when too many hashing jobs are already queued."""
+
+class PasswordHashingPool:
+    """Runs bcrypt on a small dedicated thread pool (bcrypt releases the GIL).
+
+    Hashing never blocks the event loop and never competes with the default
+    threadpool used for other work. At most `max_pending` jobs may be running or
+    queued; beyond that callers are turned away immediately instead of waiting,
+    so a burst of logins cannot build an unbounded backlog.
+    """
+
+    def __init__(self, workers: int, max_pending: int) -> None:
+        self.workers = workers
+        self.max_pending = max_pending
+        self.pending = 0
+        self.rejected = 0
+        self._executor: ThreadPoolExecutor | None = None
+
+    async def run(self, func: Callable[..., T], *args: Any) -> T:
+        if self.pending >= self.max_pending:
+            self.rejected += 1
+            raise PasswordHashingBusyError()
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="password-hashing")
+        self.pending += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+        finally:
+            self.pending -= 1
+
+    async def check_password(self, plain_password: str, hashed_password: str) -> bool:
+        return await self.run(check_password, plain_password, hashed_password)
+
+    async def hash_password(self, plain_password: str) -> str:
+        return await self.run(hash_password, plain_password)
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+password_hashing = PasswordHashingPool(
+    workers=settings.PASSWORD_HASHING_WORKERS, max_pending=settings.PASSWORD_HASHING_MAX_PENDING
+)
+
 # --- JWT Token functions --- 
 def create_access_token(subject: str | Any, expires_delta: timedelta | None = None) -> str:
     """Creates a JWT access token."""
@@ -30,7 +92,15 @@ def create_access_token(subject: str | Any, expires_delta: timedelta | None = No
 
 # Function to decode/verify token will be needed in middleware (STORY-203)
 def verify_token(token: str, credentials_exception: HTTPException) -> str:
-    """Verifies a JWT token and returns the subject (e.g., username)."""
+    """Verifies a JWT token and returns the subject (e.g., username).
+
+    Claims of tokens that passed verification are cached until the token
+    expires, so repeated calls with the same token skip decoding and the
+    signature check.
+    """
+    payload = get_cached_claims(token)
+    if payload is not None:
+        return payload["sub"]
     try:
         payload = jwt.decode(
             token,
@@ -41,6 +111,7 @@ def verify_token(token: str, credentials_exception: HTTPException) -> str:
         if username is None:
             raise credentials_exception
         # Optionally, add more validation here (e.g., check token scope/type)
+        cache_claims(token, payload)
         return username
     except JWTError:
         raise credentials_exception 
\ No newline at end of file
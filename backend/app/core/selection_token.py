@@ -0,0 +1,62 @@
+"""Signed selection state for incremental configurator evaluation.
+
+The configurator changes one category per click. Instead of re-sending the
+whole selection, clients keep the compact token returned with the last
+evaluation and send it back together with the one change. The token carries
+the product type, the catalog version it was evaluated against and the
+selected option IDs, signed with an HMAC of SECRET_KEY, so the server stays
+stateless and clients cannot alter the selection the change applies to.
+"""
+import base64
+import hashlib
+import hmac
+import json
+from dataclasses import dataclass
+from typing import List, Sequence
+
+from app.config import settings
+
+# Truncated HMAC-SHA256; 128 bits are plenty against forgery and keep the token short
+SIGNATURE_BYTES = 16
+
+class InvalidSelectionTokenError(ValueError):
+    """Raised when a selection token is malformed or was not signed by this server."""
+
+@dataclass(frozen=True)
+class SelectionState:
+    product_type_id: int
+    version: int # Catalog version the selection was evaluated against
+    selected_options: List[int] # In display order
+
+def _b64encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).decode("ascii").rstrip("=")
+
+def _b64decode(data: str) -> bytes:
+    return base64.urlsafe_b64decode((data + "=" * (-len(data) % 4)).encode("ascii"))
+
+def _sign(payload: str) -> bytes:
+    key = settings.SECRET_KEY.encode("utf-8")
+    return hmac.new(key, b"selection:" + payload.encode("ascii"), hashlib.sha256).digest()[:SIGNATURE_BYTES]
+
+def encode_selection_token(product_type_id: int, version: int, selected_options: Sequence[int]) -> str:
+    values = [product_type_id, version, list(selected_options)]
+    payload = _b64encode(json.dumps(values, separators=(",", ":")).encode("utf-8"))
+    return f"{payload}.{_b64encode(_sign(payload))}"
+
+def decode_selection_token(token: str) -> SelectionState:
+    payload, _, signature = token.partition(".")
+    try:
+        valid = hmac.compare_digest(_b64decode(signature), _sign(payload))
+        values = json.loads(_b64decode(payload)) if valid else None
+    except (ValueError, UnicodeError) as exc:
+        raise InvalidSelectionTokenError("Malformed selection token") from exc
+    if values is None:
+        raise InvalidSelectionTokenError("Invalid selection token signature")
+    if (
+        not isinstance(values, list)
+        or len(values) != 3
+        or not isinstance(values[2], list)
+        or not all(type(value) is int for value in values[:2] + values[2])
+    ):
+        raise InvalidSelectionTokenError("Malformed selection token")
+    return SelectionState(product_type_id=values[0], version=values[1], selected_options=values[2])
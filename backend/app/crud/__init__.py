@@ -1,22 +1,57 @@
 from .crud_admin_user import get_admin_user_by_username, authenticate_admin_user
 from .crud_product_type import (
+    PRODUCT_TYPE_ORDER,
     get_product_type,
     get_product_types,
     create_product_type,
     update_product_type,
     remove_product_type,
+    remove_product_types,
 )
 from .crud_part_category import (
+    PART_CATEGORY_ORDER,
     get_part_category,
     get_part_categories_by_product_type,
+    get_existing_part_category_ids,
     create_part_category,
     update_part_category,
     remove_part_category,
 )
 from .crud_part_option import (
+    PART_OPTION_ORDER,
     get_part_option,
     get_part_options_by_category,
+    get_part_options_by_product_type,
+    get_part_options_in_product_type,
+    get_existing_part_option_ids,
     create_part_option,
+    create_part_options,
     update_part_option,
+    update_part_options,
+    set_part_options_stock,
     remove_part_option,
-) 
\ No newline at end of file
+)
+from .crud_compatibility_rule import (
+    COMPATIBILITY_RULE_ORDER,
+    get_compatibility_rule,
+    get_compatibility_rules_by_product_type,
+    create_compatibility_rule,
+    update_compatibility_rule,
+    remove_compatibility_rule,
+)
+from .crud_pricing_rule import (
+    PRICING_RULE_ORDER,
+    get_pricing_rule,
+    get_pricing_rules_by_product_type,
+    create_pricing_rule,
+    update_pricing_rule,
+    remove_pricing_rule,
+)
+from .crud_cart import (
+    get_cart_by_token,
+    create_cart,
+    add_cart_item,
+    get_cart_items,
+    remove_cart_item,
+    remove_cart,
+)
@@ -1,20 +1,53 @@
-from sqlalchemy.orm import Session
-from sqlalchemy import select
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, object_session
 from typing import Optional
 
 from app.models.admin_user import AdminUser
-from app.core.security import check_password
+from app.core.security import password_hashing, password_needs_rehash
+from app.core.auth_cache import invalidate_admin_user
 
-def get_admin_user_by_username(db: Session, username: str) -> Optional[AdminUser]:
+async def get_admin_user_by_username(db: AsyncSession, username: str) -> Optional[AdminUser]:
     """Fetches an admin user by username."""
     statement = select(AdminUser).where(AdminUser.username == username)
-    return db.scalars(statement).first()
+    result = await db.scalars(statement)
+    return result.first()
 
-def authenticate_admin_user(db: Session, username: str, password: str) -> Optional[AdminUser]:
-    """Authenticates an admin user by username and password."""
-    user = get_admin_user_by_username(db, username=username)
+async def authenticate_admin_user(db: AsyncSession, username: str, password: str) -> Optional[AdminUser]:
+    """Authenticates an admin user by username and password.
+
+    bcrypt runs on the password hashing pool and may raise
+    PasswordHashingBusyError. A hash made with an outdated cost factor is
+    replaced after a successful login.
+    """
+    user = await get_admin_user_by_username(db, username=username)
     if not user:
         return None
-    if not check_password(password, user.password_hash):
+    if not await password_hashing.check_password(password, user.password_hash):
         return None
-    return user 
\ No newline at end of file
+    if password_needs_rehash(user.password_hash):
+        user.password_hash = await password_hashing.hash_password(password)
+        await db.commit()
+    return user
+
+# Keep the principal cache coherent with ORM writes to admin users: forget the
+# user at flush time and again once the transaction commits, so a request that
+# re-cached the old row in between cannot keep it.
+_CHANGED_ADMIN_USERS = "changed_admin_user_ids"
+
+@event.listens_for(AdminUser, "after_update")
+@event.listens_for(AdminUser, "after_delete")
+def _forget_changed_admin_user(mapper, connection, target: AdminUser) -> None:
+    invalidate_admin_user(target.id)
+    session = object_session(target)
+    if session is not None:
+        session.info.setdefault(_CHANGED_ADMIN_USERS, set()).add(target.id)
+
+@event.listens_for(Session, "after_commit")
+def _forget_committed_admin_users(session: Session) -> None:
+    for user_id in session.info.pop(_CHANGED_ADMIN_USERS, ()):
+        invalidate_admin_user(user_id)
+
+@event.listens_for(Session, "after_rollback")
+def _drop_rolled_back_admin_users(session: Session) -> None:
+    session.info.pop(_CHANGED_ADMIN_USERS, None)
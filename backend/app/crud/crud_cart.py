@@ -0,0 +1,71 @@
+import secrets
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import delete, func, select
+from sqlalchemy.dialects.postgresql import insert
+from typing import List, Optional
+
+from app.models.cart import Cart, CartItem, canonical_configuration, configuration_hash
+from app.schemas.cart import MAX_CART_ITEM_QUANTITY, CartItemCreate
+
+async def get_cart_by_token(db: AsyncSession, token: str) -> Optional[Cart]:
+    """Get a cart by the token its customer holds."""
+    result = await db.scalars(select(Cart).where(Cart.token == token))
+    return result.first()
+
+async def create_cart(db: AsyncSession) -> Cart:
+    """Create an empty cart with a fresh random token."""
+    db_cart = Cart(token=secrets.token_urlsafe(32))
+    db.add(db_cart)
+    await db.commit()
+    await db.refresh(db_cart)
+    return db_cart
+
+async def add_cart_item(db: AsyncSession, cart_id: int, cart_item_in: CartItemCreate) -> int:
+    """Add a configuration to a cart, or raise its quantity (up to the maximum) if the cart already holds it.
+
+    Returns the cart item ID. The configuration is expected to be validated.
+    """
+    part_option_ids = canonical_configuration(cart_item_in.selected_options)
+    statement = insert(CartItem).values(
+        cart_id=cart_id,
+        product_type_id=cart_item_in.product_type_id,
+        part_option_ids=part_option_ids,
+        configuration_hash=configuration_hash(cart_item_in.product_type_id, part_option_ids),
+        quantity=cart_item_in.quantity,
+    )
+    statement = statement.on_conflict_do_update(
+        constraint="uq_cart_items_cart_id_configuration_hash",
+        set_={
+            "quantity": func.least(CartItem.quantity + statement.excluded.quantity, MAX_CART_ITEM_QUANTITY),
+            "updated_at": func.now(),
+        },
+    ).returning(CartItem.id)
+    cart_item_id = await db.scalar(statement)
+    await db.commit()
+    return cart_item_id
+
+async def get_cart_items(db: AsyncSession, cart_id: int) -> List[CartItem]:
+    """Get a cart's items in the order they were added.
+
+    Read through the (cart_id, configuration_hash) index; pricing and
+    availability come from the compiled product types (see the cart endpoints).
+    """
+    statement = select(CartItem).where(CartItem.cart_id == cart_id).order_by(CartItem.id)
+    result = await db.scalars(statement)
+    return list(result.all())
+
+async def remove_cart_item(db: AsyncSession, cart_id: int, cart_item_id: int) -> bool:
+    """Delete one item of a cart; returns whether it existed."""
+    statement = (
+        delete(CartItem)
+        .where(CartItem.id == cart_item_id, CartItem.cart_id == cart_id)
+        .returning(CartItem.id)
+    )
+    deleted = await db.scalar(statement)
+    await db.commit()
+    return deleted is not None
+
+async def remove_cart(db: AsyncSession, cart: Cart) -> None:
+    """Delete a cart; its items go with it (ON DELETE CASCADE)."""
+    await db.delete(cart)
+    await db.commit()
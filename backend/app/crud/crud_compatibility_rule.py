@@ -0,0 +1,67 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select
+from typing import List, Optional
+
+from app.models.compatibility_rule import CompatibilityRule
+from app.schemas.compatibility_rule import CompatibilityRuleCreate, CompatibilityRuleUpdate
+from app.core.catalog_cache import catalog_version
+from app.core.pagination import paginate
+
+# Sort key of compatibility rule listings (see app.core.pagination)
+COMPATIBILITY_RULE_ORDER = (CompatibilityRule.id,)
+
+async def get_compatibility_rule(db: AsyncSession, compatibility_rule_id: int) -> Optional[CompatibilityRule]:
+    """Get a single compatibility rule by ID."""
+    return await db.get(CompatibilityRule, compatibility_rule_id)
+
+async def get_compatibility_rules_by_product_type(
+    db: AsyncSession,
+    product_type_id: int,
+    skip: int = 0,
+    limit: int | None = 100,
+    cursor: Optional[str] = None,
+) -> List[CompatibilityRule]:
+    """Get the compatibility rules scoped to a product type ordered by ID, after `cursor` if given
+    (all of them if limit is None; `skip` is deprecated)."""
+    statement = paginate(
+        select(CompatibilityRule).where(CompatibilityRule.product_type_id == product_type_id),
+        COMPATIBILITY_RULE_ORDER,
+        cursor=cursor,
+        skip=skip,
+        limit=limit,
+    )
+    result = await db.scalars(statement)
+    return list(result.all())
+
+async def create_compatibility_rule(
+    db: AsyncSession, compatibility_rule_in: CompatibilityRuleCreate
+) -> CompatibilityRule:
+    """Create a new compatibility rule for a product type."""
+    db_rule = CompatibilityRule(**compatibility_rule_in.model_dump(mode="json"))
+    db.add(db_rule)
+    await catalog_version.bump(db, CompatibilityRule.__tablename__)
+    await db.commit()
+    await db.refresh(db_rule)
+    return db_rule
+
+async def update_compatibility_rule(
+    db: AsyncSession, db_obj: CompatibilityRule, compatibility_rule_in: CompatibilityRuleUpdate
+) -> CompatibilityRule:
+    """Update an existing compatibility rule."""
+    update_data = compatibility_rule_in.model_dump(mode="json", exclude_unset=True)
+    for field, value in update_data.items():
+        setattr(db_obj, field, value)
+    db.add(db_obj)
+    await catalog_version.bump(db, CompatibilityRule.__tablename__)
+    await db.commit()
+    await db.refresh(db_obj)
+    return db_obj
+
+async def remove_compatibility_rule(db: AsyncSession, compatibility_rule_id: int) -> Optional[CompatibilityRule]:
+    """Delete a compatibility rule by ID."""
+    db_obj = await db.get(CompatibilityRule, compatibility_rule_id)
+    if db_obj:
+        await db.delete(db_obj)
+        await catalog_version.bump(db, CompatibilityRule.__tablename__)
+        await db.commit()
+    return db_obj
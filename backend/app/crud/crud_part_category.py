@@ -1,35 +1,62 @@
-from sqlalchemy.orm import Session
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from typing import List, Optional
+from sqlalchemy import delete, select
+from typing import Iterable, List, Optional, Set
 
 from app.models.part_category import PartCategory
+from app.models.part_option import PartOption
+from app.models.compatibility_rule import CompatibilityRule
+from app.models.pricing_rule import PricingRule
 from app.schemas.part_category import PartCategoryCreate, PartCategoryUpdate
+from app.core.catalog_cache import catalog_version
+from app.core.change_feed import part_option_feed
+from app.core.pagination import paginate
+
+# Tables whose rows go away with a part category
+CASCADED_TABLES = (
+    PartCategory.__tablename__,
+    PartOption.__tablename__,
+    CompatibilityRule.__tablename__,
+    PricingRule.__tablename__,
+)
+
+# Sort key of part category listings (see app.core.pagination)
+PART_CATEGORY_ORDER = (PartCategory.display_order, PartCategory.id)
 
 async def get_part_category(db: AsyncSession, part_category_id: int) -> Optional[PartCategory]:
     """Get a single part category by ID."""
     return await db.get(PartCategory, part_category_id)
 
 async def get_part_categories_by_product_type(
-    db: AsyncSession, product_type_id: int, skip: int = 0, limit: int = 100
+    db: AsyncSession,
+    product_type_id: int,
+    skip: int = 0,
+    limit: int | None = 100,
+    cursor: Optional[str] = None,
 ) -> List[PartCategory]:
-    """Get a list of part categories for a specific product type."""
-    statement = (
-        select(PartCategory)
-        .where(PartCategory.product_type_id == product_type_id)
-        .order_by(PartCategory.display_order) # Order by display_order
-        .offset(skip)
-        .limit(limit)
+    """Get a page of part categories for a specific product type in display order (all of them if limit is None)."""
+    statement = paginate(
+        select(PartCategory).where(PartCategory.product_type_id == product_type_id),
+        PART_CATEGORY_ORDER,
+        cursor=cursor,
+        skip=skip,
+        limit=limit,
     )
     result = await db.scalars(statement)
     return list(result.all())
 
+async def get_existing_part_category_ids(db: AsyncSession, part_category_ids: Iterable[int]) -> Set[int]:
+    """Return which of the given part category IDs exist (one query)."""
+    statement = select(PartCategory.id).where(PartCategory.id.in_(set(part_category_ids)))
+    result = await db.scalars(statement)
+    return set(result.all())
+
 async def create_part_category(db: AsyncSession, part_category_in: PartCategoryCreate) -> PartCategory:
     """Create a new part category linked to a product type."""
     # Ensure product_type_id exists? Or rely on DB foreign key constraint?
     # Relying on FK constraint for now.
     db_part_category = PartCategory(**part_category_in.model_dump())
     db.add(db_part_category)
+    await catalog_version.bump(db, PartCategory.__tablename__)
     await db.commit()
     await db.refresh(db_part_category)
     return db_part_category
@@ -43,15 +70,23 @@ async def update_part_category(
     for field, value in update_data.items():
         setattr(db_obj, field, value)
     db.add(db_obj)
+    await catalog_version.bump(db, PartCategory.__tablename__)
     await db.commit()
     await db.refresh(db_obj)
     return db_obj
 
 async def remove_part_category(db: AsyncSession, part_category_id: int) -> Optional[PartCategory]:
-    """Delete a part category by ID."""
-    # Note: Cascade delete should handle removing associated PartOptions
-    db_obj = await db.get(PartCategory, part_category_id)
+    """Delete a part category by ID with one DELETE ... RETURNING.
+
+    Its options, and the rules referencing them, are removed by the database
+    (ON DELETE CASCADE) instead of being loaded into the session first.
+    """
+    statement = delete(PartCategory).where(PartCategory.id == part_category_id).returning(PartCategory)
+    db_obj = await db.scalar(statement)
+    if db_obj:
+        await catalog_version.bump(db, *CASCADED_TABLES)
+    await db.commit()
     if db_obj:
-        await db.delete(db_obj)
-        await db.commit()
-    return db_obj 
\ No newline at end of file
+        db.expunge(db_obj) # The row is gone; keep it out of the identity map
+        part_option_feed.resync(db_obj.product_type_id) # Its options went with it
+    return db_obj
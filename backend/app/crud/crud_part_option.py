@@ -1,10 +1,46 @@
-from sqlalchemy.orm import Session # Keep for potential sync usage elsewhere? Or remove if fully async
+import json
 from sqlalchemy.ext.asyncio import AsyncSession # Import AsyncSession
-from sqlalchemy import select
-from typing import List, Optional
+from sqlalchemy import any_, bindparam, insert, select, update
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.exc import DataError, IntegrityError
+from sqlalchemy.types import Integer
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
 
 from app.models.part_option import PartOption
-from app.schemas.part_option import PartOptionCreate, PartOptionUpdate
+from app.models.part_category import PartCategory
+from app.models.compatibility_rule import CompatibilityRule
+from app.models.pricing_rule import PricingRule
+from app.schemas.part_option import PartOption as PartOptionRead
+from app.schemas.part_option import PartOptionBulkUpdateItem, PartOptionCreate, PartOptionUpdate
+from app.core.catalog_cache import catalog_version
+from app.core.change_feed import part_option_feed
+from app.core.pagination import paginate
+
+# Tables whose rows go away with a part option (rules cascade at the database level)
+CASCADED_TABLES = (PartOption.__tablename__, CompatibilityRule.__tablename__, PricingRule.__tablename__)
+
+# Sort key of part option listings (see app.core.pagination)
+PART_OPTION_ORDER = (PartOption.name, PartOption.id)
+
+async def _publish_changes(db: AsyncSession, part_options: Iterable[PartOption], deleted: bool = False) -> None:
+    """Publish written part options to the change feed of their product types (see app.core.change_feed).
+
+    Costs one query to find the product types, and nothing while no client is subscribed.
+    """
+    part_options = list(part_options)
+    if not part_options or not part_option_feed.has_subscribers:
+        return
+    statement = select(PartCategory.id, PartCategory.product_type_id).where(
+        PartCategory.id.in_({part_option.part_category_id for part_option in part_options})
+    )
+    product_type_ids = dict((await db.execute(statement)).all())
+    for part_option in part_options:
+        if deleted:
+            data = json.dumps({"id": part_option.id, "part_category_id": part_option.part_category_id})
+            event = ("part_option_deleted", data)
+        else:
+            event = ("part_option", PartOptionRead.model_validate(part_option).model_dump_json())
+        part_option_feed.publish(product_type_ids.get(part_option.part_category_id), part_option.id, event)
 
 # Use AsyncSession and make functions async
 async def get_part_option(db: AsyncSession, part_option_id: int) -> Optional[PartOption]:
@@ -13,29 +49,68 @@ async def get_part_option(db: AsyncSession, part_option_id: int) -> Optional[Par
     return await db.get(PartOption, part_option_id)
 
 async def get_part_options_by_category(
-    db: AsyncSession, part_category_id: int, skip: int = 0, limit: int = 100
+    db: AsyncSession,
+    part_category_id: int,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    in_stock_only: bool = False,
+) -> List[PartOption]:
+    """Get a page of part options for a specific category ordered by name, after `cursor` if given."""
+    statement = select(PartOption).where(PartOption.part_category_id == part_category_id)
+    if in_stock_only:
+        # Spelled like the predicate of the partial index ix_part_options_part_category_id_name_id_in_stock
+        statement = statement.where(PartOption.is_in_stock)
+    statement = paginate(
+        statement,
+        PART_OPTION_ORDER,
+        cursor=cursor,
+        skip=skip,
+        limit=limit,
+    )
+    # Use await db.scalars for async execution
+    result = await db.scalars(statement)
+    return list(result.all())
+
+async def get_part_options_by_product_type(db: AsyncSession, product_type_id: int) -> List[PartOption]:
+    """Get every part option of a product type in a single query (used to compile its rules)."""
+    statement = (
+        select(PartOption)
+        .join(PartCategory, PartOption.part_category_id == PartCategory.id)
+        .where(PartCategory.product_type_id == product_type_id)
+        .order_by(PartOption.part_category_id, PartOption.name)
+    )
+    result = await db.scalars(statement)
+    return list(result.all())
+
+async def get_part_options_in_product_type(
+    db: AsyncSession, product_type_id: int, part_option_ids: Iterable[int]
 ) -> List[PartOption]:
-    """Get a list of part options for a specific category."""
+    """Get the part options among the given IDs that belong to a product type."""
     statement = (
         select(PartOption)
-        .where(PartOption.part_category_id == part_category_id)
-        # Consider adding an order_by, e.g., by name or id
-        .order_by(PartOption.name)
-        .offset(skip)
-        .limit(limit)
+        .join(PartCategory, PartOption.part_category_id == PartCategory.id)
+        .where(PartCategory.product_type_id == product_type_id, PartOption.id.in_(list(part_option_ids)))
     )
-    # Use await db.scalars for async execution
     result = await db.scalars(statement)
     return list(result.all())
 
+async def get_existing_part_option_ids(db: AsyncSession, part_option_ids: Iterable[int]) -> Set[int]:
+    """Return which of the given part option IDs exist (one query)."""
+    statement = select(PartOption.id).where(PartOption.id.in_(set(part_option_ids)))
+    result = await db.scalars(statement)
+    return set(result.all())
+
 async def create_part_option(db: AsyncSession, part_option_in: PartOptionCreate) -> PartOption:
     """Create a new part option linked to a category."""
     # Relying on FK constraint for part_category_id validation
     db_part_option = PartOption(**part_option_in.model_dump())
     db.add(db_part_option)
+    await catalog_version.bump(db, PartOption.__tablename__)
     # Use await for commit and refresh
     await db.commit()
     await db.refresh(db_part_option)
+    await _publish_changes(db, [db_part_option])
     return db_part_option
 
 async def update_part_option(
@@ -46,9 +121,11 @@ async def update_part_option(
     for field, value in update_data.items():
         setattr(db_obj, field, value)
     db.add(db_obj)
+    await catalog_version.bump(db, PartOption.__tablename__)
     # Use await for commit and refresh
     await db.commit()
     await db.refresh(db_obj)
+    await _publish_changes(db, [db_obj])
     return db_obj
 
 async def remove_part_option(db: AsyncSession, part_option_id: int) -> Optional[PartOption]:
@@ -57,5 +134,131 @@ async def remove_part_option(db: AsyncSession, part_option_id: int) -> Optional[
     if db_obj:
         # Use await for delete and commit
         await db.delete(db_obj)
+        await catalog_version.bump(db, *CASCADED_TABLES)
         await db.commit()
-    return db_obj 
\ No newline at end of file
+        await _publish_changes(db, [db_obj], deleted=True)
+    return db_obj
+
+async def _execute_rows(
+    db: AsyncSession, statement, rows: List[Dict[str, Any]], failure: str, returning: bool = False
+) -> Tuple[Dict[int, Any], Dict[int, str]]:
+    """Run `statement` once for all rows (executemany); if the batch is rejected,
+    retry the rows one by one in savepoints so only the offending rows fail.
+
+    Returns the RETURNING rows (or the parameters of the written rows) and the
+    errors, both keyed by row position.
+    """
+    try:
+        async with db.begin_nested():
+            result = await db.execute(statement, rows)
+            return dict(enumerate(result.scalars().all() if returning else rows)), {}
+    except (IntegrityError, DataError):
+        pass
+    written: Dict[int, Any] = {}
+    errors: Dict[int, str] = {}
+    for position, row in enumerate(rows):
+        try:
+            async with db.begin_nested():
+                result = await db.execute(statement, [row])
+                written[position] = result.scalars().one() if returning else row
+        except (IntegrityError, DataError):
+            errors[position] = failure
+    return written, errors
+
+async def create_part_options(
+    db: AsyncSession, part_options_in: Sequence[PartOptionCreate]
+) -> Tuple[Dict[int, PartOption], Dict[int, str]]:
+    """Create many part options with one INSERT ... RETURNING and a single commit.
+
+    Categories are expected to have been validated by the caller. Results and
+    per-row errors are keyed by position in `part_options_in`.
+    """
+    if not part_options_in:
+        return {}, {}
+    statement = insert(PartOption).returning(PartOption, sort_by_parameter_order=True)
+    created, errors = await _execute_rows(
+        db,
+        statement,
+        [part_option_in.model_dump() for part_option_in in part_options_in],
+        "Part option creation failed. Check constraints.",
+        returning=True,
+    )
+    if created:
+        await catalog_version.bump(db, PartOption.__tablename__)
+    await db.commit()
+    if created:
+        await _publish_changes(db, created.values())
+    return created, errors
+
+async def update_part_options(
+    db: AsyncSession, part_options_in: Sequence[PartOptionBulkUpdateItem]
+) -> Tuple[Dict[int, PartOption], Dict[int, str]]:
+    """Update many existing part options with one executemany UPDATE and a single commit.
+
+    Only the fields set on each row are written. The updated rows are read back
+    with one query; rows deleted concurrently are reported as errors. Results
+    and per-row errors are keyed by position in `part_options_in`.
+    """
+    if not part_options_in:
+        return {}, {}
+    updated, errors = await _execute_rows(
+        db,
+        update(PartOption),
+        [part_option_in.model_dump(exclude_unset=True) | {"id": part_option_in.id} for part_option_in in part_options_in],
+        "Part option update failed. Check constraints.",
+    )
+    if not updated:
+        await db.commit()
+        return {}, errors
+    await catalog_version.bump(db, PartOption.__tablename__)
+    await db.commit()
+    statement = (
+        select(PartOption)
+        .where(PartOption.id.in_([row["id"] for row in updated.values()]))
+        .execution_options(populate_existing=True)
+    )
+    by_id = {part_option.id: part_option for part_option in (await db.scalars(statement)).all()}
+    await _publish_changes(db, by_id.values())
+    results: Dict[int, PartOption] = {}
+    for position, row in updated.items():
+        if row["id"] in by_id:
+            results[position] = by_id[row["id"]]
+        else:
+            # Deleted after the caller checked it existed: the UPDATE matched no row
+            errors[position] = f"PartOption with id {row['id']} not found."
+    return results, errors
+
+async def set_part_options_stock(
+    db: AsyncSession,
+    is_in_stock: bool,
+    part_option_ids: Optional[Sequence[int]] = None,
+    part_category_id: Optional[int] = None,
+    name_contains: Optional[str] = None,
+) -> List[int]:
+    """Set the stock flag of every option matching all given filters in one statement.
+
+    Options already in the requested state are left alone, so the returned IDs
+    are exactly the options that changed.
+    """
+    statement = update(PartOption).where(PartOption.is_in_stock.is_distinct_from(is_in_stock))
+    if part_option_ids is not None:
+        # One array parameter instead of an expanded IN list keeps a single prepared statement
+        statement = statement.where(
+            PartOption.id == any_(bindparam("part_option_ids", list(part_option_ids), type_=ARRAY(Integer)))
+        )
+    if part_category_id is not None:
+        statement = statement.where(PartOption.part_category_id == part_category_id)
+    if name_contains:
+        statement = statement.where(PartOption.name.icontains(name_contains, autoescape=True))
+    statement = (
+        statement.values(is_in_stock=is_in_stock)
+        .returning(PartOption)
+        .execution_options(synchronize_session=False, populate_existing=True)
+    )
+    changed = list((await db.scalars(statement)).all())
+    if changed:
+        await catalog_version.bump(db, PartOption.__tablename__)
+    await db.commit()
+    if changed:
+        await _publish_changes(db, changed)
+    return sorted(part_option.id for part_option in changed)
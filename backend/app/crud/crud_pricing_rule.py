@@ -0,0 +1,65 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select
+from typing import List, Optional
+
+from app.models.pricing_rule import PricingRule
+from app.schemas.pricing_rule import PricingRuleCreate, PricingRuleUpdate
+from app.core.catalog_cache import catalog_version
+from app.core.pagination import paginate
+
+# Sort key of pricing rule listings (see app.core.pagination)
+PRICING_RULE_ORDER = (PricingRule.id,)
+
+async def get_pricing_rule(db: AsyncSession, pricing_rule_id: int) -> Optional[PricingRule]:
+    """Get a single pricing rule by ID."""
+    return await db.get(PricingRule, pricing_rule_id)
+
+async def get_pricing_rules_by_product_type(
+    db: AsyncSession,
+    product_type_id: int,
+    skip: int = 0,
+    limit: int | None = 100,
+    cursor: Optional[str] = None,
+) -> List[PricingRule]:
+    """Get the pricing rules scoped to a product type ordered by ID, after `cursor` if given
+    (all of them if limit is None; `skip` is deprecated)."""
+    statement = paginate(
+        select(PricingRule).where(PricingRule.product_type_id == product_type_id),
+        PRICING_RULE_ORDER,
+        cursor=cursor,
+        skip=skip,
+        limit=limit,
+    )
+    result = await db.scalars(statement)
+    return list(result.all())
+
+async def create_pricing_rule(db: AsyncSession, pricing_rule_in: PricingRuleCreate) -> PricingRule:
+    """Create a new pricing rule for a product type."""
+    db_rule = PricingRule(**pricing_rule_in.model_dump())
+    db.add(db_rule)
+    await catalog_version.bump(db, PricingRule.__tablename__)
+    await db.commit()
+    await db.refresh(db_rule)
+    return db_rule
+
+async def update_pricing_rule(
+    db: AsyncSession, db_obj: PricingRule, pricing_rule_in: PricingRuleUpdate
+) -> PricingRule:
+    """Update an existing pricing rule."""
+    update_data = pricing_rule_in.model_dump(exclude_unset=True)
+    for field, value in update_data.items():
+        setattr(db_obj, field, value)
+    db.add(db_obj)
+    await catalog_version.bump(db, PricingRule.__tablename__)
+    await db.commit()
+    await db.refresh(db_obj)
+    return db_obj
+
+async def remove_pricing_rule(db: AsyncSession, pricing_rule_id: int) -> Optional[PricingRule]:
+    """Delete a pricing rule by ID."""
+    db_obj = await db.get(PricingRule, pricing_rule_id)
+    if db_obj:
+        await db.delete(db_obj)
+        await catalog_version.bump(db, PricingRule.__tablename__)
+        await db.commit()
+    return db_obj
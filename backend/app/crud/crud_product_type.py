@@ -1,18 +1,40 @@
-from sqlalchemy.orm import Session
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update as sql_update, delete as sql_delete
-from typing import List, Optional
+from sqlalchemy import any_, bindparam, select, update as sql_update, delete as sql_delete
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.types import Integer
+from typing import List, Optional, Sequence
 
 from app.models.product_type import ProductType
+from app.models.part_category import PartCategory
+from app.models.part_option import PartOption
+from app.models.compatibility_rule import CompatibilityRule
+from app.models.pricing_rule import PricingRule
 from app.schemas.product_type import ProductTypeCreate, ProductTypeUpdate
+from app.core.catalog_cache import catalog_version
+from app.core.change_feed import part_option_feed
+from app.core.pagination import paginate
+
+# Tables whose rows go away with a product type
+CASCADED_TABLES = (
+    ProductType.__tablename__,
+    PartCategory.__tablename__,
+    PartOption.__tablename__,
+    CompatibilityRule.__tablename__,
+    PricingRule.__tablename__,
+)
+
+# Sort key of product type listings (see app.core.pagination)
+PRODUCT_TYPE_ORDER = (ProductType.id,)
 
 async def get_product_type(db: AsyncSession, product_type_id: int) -> Optional[ProductType]:
     """Get a single product type by ID."""
     return await db.get(ProductType, product_type_id)
 
-async def get_product_types(db: AsyncSession, skip: int = 0, limit: int = 100) -> List[ProductType]:
-    """Get a list of product types with pagination."""
-    statement = select(ProductType).offset(skip).limit(limit)
+async def get_product_types(
+    db: AsyncSession, skip: int = 0, limit: int = 100, cursor: Optional[str] = None
+) -> List[ProductType]:
+    """Get a page of product types ordered by ID, after `cursor` if given (`skip` is deprecated)."""
+    statement = paginate(select(ProductType), PRODUCT_TYPE_ORDER, cursor=cursor, skip=skip, limit=limit)
     result = await db.scalars(statement)
     return list(result.all())
 
@@ -20,6 +42,7 @@ async def create_product_type(db: AsyncSession, product_type_in: ProductTypeCrea
     """Create a new product type."""
     db_product_type = ProductType(**product_type_in.model_dump())
     db.add(db_product_type)
+    await catalog_version.bump(db, ProductType.__tablename__)
     await db.commit()
     await db.refresh(db_product_type)
     return db_product_type
@@ -32,14 +55,42 @@ async def update_product_type(
     for field, value in update_data.items():
         setattr(db_obj, field, value)
     db.add(db_obj)
+    await catalog_version.bump(db, ProductType.__tablename__)
     await db.commit()
     await db.refresh(db_obj)
     return db_obj
 
 async def remove_product_type(db: AsyncSession, product_type_id: int) -> Optional[ProductType]:
-    """Delete a product type by ID."""
-    db_obj = await db.get(ProductType, product_type_id)
+    """Delete a product type by ID with one DELETE ... RETURNING.
+
+    Its categories, options and rules are removed by the database (ON DELETE
+    CASCADE) instead of being loaded into the session first.
+    """
+    statement = sql_delete(ProductType).where(ProductType.id == product_type_id).returning(ProductType)
+    db_obj = await db.scalar(statement)
+    if db_obj:
+        await catalog_version.bump(db, *CASCADED_TABLES)
+    await db.commit()
     if db_obj:
-        await db.delete(db_obj)
-        await db.commit()
-    return db_obj 
\ No newline at end of file
+        db.expunge(db_obj) # The row is gone; keep it out of the identity map
+        part_option_feed.resync(db_obj.id) # Its options went with it
+    return db_obj
+
+async def remove_product_types(db: AsyncSession, product_type_ids: Sequence[int]) -> List[int]:
+    """Delete many product types (and, by ON DELETE CASCADE, everything below them) with one statement.
+
+    Returns the IDs that existed and were deleted.
+    """
+    statement = (
+        sql_delete(ProductType)
+        # One array parameter instead of an expanded IN list keeps a single prepared statement
+        .where(ProductType.id == any_(bindparam("product_type_ids", list(product_type_ids), type_=ARRAY(Integer))))
+        .returning(ProductType.id)
+    )
+    deleted_ids = list((await db.scalars(statement)).all())
+    if deleted_ids:
+        await catalog_version.bump(db, *CASCADED_TABLES)
+    await db.commit()
+    for product_type_id in deleted_ids:
+        part_option_feed.resync(product_type_id)
+    return sorted(deleted_ids)
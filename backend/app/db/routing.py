@@ -0,0 +1,64 @@
+"""Routing reads to replica databases.
+
+Requests with a safe method (GET, HEAD, OPTIONS) are served from a replica
+when DATABASE_REPLICA_URLS is set; everything else goes to the primary. The
+replica with the fewest checked-out connections is picked, ties going round
+robin.
+
+Replicas lag behind the primary, so after a write (a commit through the
+request's session, see app.db.session.get_db) two things keep reads on the
+primary for READ_YOUR_WRITES_SECONDS:
+
+* the writing client gets a short-lived cookie, so its own next reads see
+  the write whichever worker serves them;
+* the worker that handled the write reads from the primary too, so its
+  in-process catalog caches, which are refreshed by the first read after a
+  write, are not refilled with the older rows (and catalog versions) of a
+  replica that has not caught up yet.
+"""
+import math
+import time
+from typing import Optional, Sequence
+
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+PRIMARY_PIN_COOKIE = "db_primary_pin"
+
+class ReplicaRouter:
+    """Picks the engine a request should read from (None meaning the primary)."""
+
+    def __init__(self, replicas: Sequence[AsyncEngine], pin_seconds: float) -> None:
+        self.replicas = list(replicas)
+        self.pin_seconds = pin_seconds
+        self._next = 0
+        self._primary_until = 0.0 # time.monotonic() deadline
+
+    @property
+    def pin_max_age(self) -> int:
+        """Lifetime of the pin cookie, in whole seconds."""
+        return math.ceil(self.pin_seconds)
+
+    def record_write(self) -> None:
+        self._primary_until = time.monotonic() + self.pin_seconds
+
+    def pinned_to_primary(self) -> bool:
+        return time.monotonic() < self._primary_until
+
+    def choose_replica(self) -> AsyncEngine:
+        """Least busy replica, starting the search after the previously chosen one."""
+        count = len(self.replicas)
+        start = self._next
+        best = min(
+            range(start, start + count),
+            key=lambda index: self.replicas[index % count].pool.checkedout(),
+        ) % count
+        self._next = (best + 1) % count
+        return self.replicas[best]
+
+    def engine_for(self, method: str, client_pinned: bool = False) -> Optional[AsyncEngine]:
+        if not self.replicas or method not in SAFE_METHODS:
+            return None
+        if client_pinned or self.pinned_to_primary():
+            return None
+        return self.choose_replica()
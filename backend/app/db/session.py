@@ -1,25 +1,60 @@
-from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
-from typing import AsyncGenerator # Import AsyncGenerator
+from fastapi import Request, Response
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine, async_sessionmaker, AsyncSession
+from sqlalchemy.orm import Session
+from typing import AsyncGenerator, List # Import AsyncGenerator
 from app.config import settings
+from app.db.routing import PRIMARY_PIN_COOKIE, ReplicaRouter
 
-# Ensure the DATABASE_URL uses the asyncpg driver for the async engine
-DATABASE_URL_ASYNC = settings.DATABASE_URL
-if DATABASE_URL_ASYNC and not DATABASE_URL_ASYNC.startswith("postgresql+asyncpg"):
-    DATABASE_URL_ASYNC = DATABASE_URL_ASYNC.replace("postgresql://", "postgresql+asyncpg://")
+def _async_url(url: str) -> str:
+    # Ensure the URL uses the asyncpg driver for the async engine
+    if url and not url.startswith("postgresql+asyncpg"):
+        url = url.replace("postgresql://", "postgresql+asyncpg://")
+    return url
 
-# Create the SQLAlchemy async engine
-async_engine = create_async_engine(DATABASE_URL_ASYNC, pool_pre_ping=True, echo=False) # echo=False generally good for prod
+def _create_engine(url: str) -> AsyncEngine:
+    return create_async_engine(
+        _async_url(url),
+        pool_pre_ping=True,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        connect_args={"prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE},
+        echo=False, # echo=False generally good for prod
+    )
+
+DATABASE_URL_ASYNC = _async_url(settings.DATABASE_URL)
+
+# Create the SQLAlchemy async engine (the primary) and one per read replica
+async_engine = _create_engine(settings.DATABASE_URL)
+replica_engines: List[AsyncEngine] = [_create_engine(url) for url in settings.REPLICA_URLS]
+replica_router = ReplicaRouter(replica_engines, pin_seconds=settings.READ_YOUR_WRITES_SECONDS)
 
 # Create a configured "AsyncSession" class
 AsyncSessionLocal = async_sessionmaker(async_engine, expire_on_commit=False, class_=AsyncSession)
 
 # Dependency to get async DB session (used in API endpoints)
-async def get_db() -> AsyncGenerator[AsyncSession, None]: # Make it async
-    async with AsyncSessionLocal() as session:
+async def get_db(request: Request, response: Response) -> AsyncGenerator[AsyncSession, None]: # Make it async
+    """Yields a session on a replica for safe methods (see app.db.routing), on the primary otherwise.
+
+    Only a commit through the session counts as a write: read-only POSTs such
+    as /evaluate never pin the worker or the client to the primary.
+    """
+    def pin_to_primary(_session: Session) -> None:
+        replica_router.record_write()
+        if replica_router.replicas:
+            response.set_cookie(
+                PRIMARY_PIN_COOKIE, "1", max_age=replica_router.pin_max_age, httponly=True, samesite="lax"
+            )
+
+    replica = replica_router.engine_for(request.method, client_pinned=PRIMARY_PIN_COOKIE in request.cookies)
+    async with AsyncSessionLocal(bind=replica or async_engine) as session:
+        event.listen(session.sync_session, "after_commit", pin_to_primary)
         try:
             yield session
         except Exception:
             await session.rollback() # Rollback on exception within endpoint
             raise
         finally:
-            await session.close() # Ensure session is closed 
\ No newline at end of file
+            await session.close() # Ensure session is closed
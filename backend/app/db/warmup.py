@@ -0,0 +1,60 @@
+"""Opening and priming pool connections before the first request.
+
+A fresh worker otherwise pays for the TCP/TLS handshake, authentication and
+statement preparation on its first requests, which shows up as a latency
+spike after every deploy. `warm_up_pool` opens connections concurrently (so
+each is a distinct pool member), runs the hot catalog and auth queries on
+each one so asyncpg has them prepared, and returns them to the pool.
+"""
+import asyncio
+import logging
+from contextlib import AsyncExitStack
+from typing import Awaitable, Callable, List
+
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, AsyncSession
+
+from app import crud
+from app.core.catalog_cache import catalog_version
+
+logger = logging.getLogger(__name__)
+
+# Queries on the request hot path, called the way the endpoints call them so
+# the SQL (and therefore the prepared statement) is identical. ID 0 never
+# matches a row.
+HOT_QUERIES: List[Callable[[AsyncSession], Awaitable]] = [
+    lambda db: catalog_version.read(db),
+    lambda db: crud.get_admin_user_by_username(db, username=""),
+    lambda db: crud.get_product_types(db),
+    lambda db: crud.get_product_type(db, product_type_id=0),
+    lambda db: crud.get_part_categories_by_product_type(db, product_type_id=0, limit=None),
+    lambda db: crud.get_part_options_by_product_type(db, product_type_id=0),
+    lambda db: crud.get_compatibility_rules_by_product_type(db, product_type_id=0, limit=None),
+    lambda db: crud.get_pricing_rules_by_product_type(db, product_type_id=0, limit=None),
+]
+
+async def _prime(connection: AsyncConnection) -> None:
+    async with AsyncSession(bind=connection) as db:
+        for query in HOT_QUERIES:
+            await query(db)
+        await db.rollback()
+
+async def warm_up_pool(engine: AsyncEngine, connections: int) -> int:
+    """Opens and primes up to `connections` pool connections; returns how many were warmed.
+
+    Failures are logged rather than raised, so an unreachable database does
+    not stop the application from starting (requests will retry on their own).
+    """
+    connections = min(connections, engine.pool.size())
+    if connections <= 0:
+        return 0
+    try:
+        async with AsyncExitStack() as stack:
+            opened = await asyncio.gather(
+                *(stack.enter_async_context(engine.connect()) for _ in range(connections))
+            )
+            await asyncio.gather(*(_prime(connection) for connection in opened))
+    except (OSError, SQLAlchemyError) as exc:
+        logger.warning("Could not warm up the database pool: %s", exc)
+        return 0
+    return connections
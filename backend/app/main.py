@@ -1,21 +1,29 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from app.api.v1.api import api_router
 from app.config import settings
+from app.core.security import password_hashing
+from app.db.session import async_engine, replica_engines
+from app.db.warmup import warm_up_pool
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    engines = [async_engine, *replica_engines]
+    # Open and prime pool connections before taking traffic
+    for engine in engines:
+        await warm_up_pool(engine, settings.DB_POOL_WARM_CONNECTIONS)
+    yield
+    # Draining: stop hashing workers and close every pooled connection
+    password_hashing.shutdown()
+    for engine in engines:
+        await engine.dispose()
 
-app = FastAPI(title="Marcus's Bicycle E-commerce API")
+app = FastAPI(title="Marcus's Bicycle E-commerce API", lifespan=lifespan)
 
 # Include the V1 API router
 app.include_router(api_router, prefix="/api/v1")
 
 @app.get("/")
-def read_root():
+async def read_root():
     return {"message": "Welcome to Marcus's Bicycle E-commerce API"}
-
-# Add startup/shutdown events later if needed for DB connection pools, etc.
-# @app.on_event("startup")
-# async def startup_event():
-#     pass
-
-# @app.on_event("shutdown")
-# async def shutdown_event():
-#     pass 
\ No newline at end of file
@@ -1,4 +1,8 @@
 from .product_type import ProductType
 from .part_category import PartCategory
 from .part_option import PartOption
-from .admin_user import AdminUser 
\ No newline at end of file
+from .admin_user import AdminUser
+from .compatibility_rule import CompatibilityRule, CompatibilityRuleType
+from .pricing_rule import PricingRule
+from .cart import Cart, CartItem, canonical_configuration, configuration_hash
+from .catalog_version import CatalogTableVersion
@@ -0,0 +1,60 @@
+import hashlib
+from sqlalchemy import Integer, String, ForeignKey, UniqueConstraint, func
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+from datetime import datetime
+from typing import Iterable, List
+
+from app.db.base import Base
+
+def canonical_configuration(part_option_ids: Iterable[int]) -> List[int]:
+    """The stored form of a configuration: its part option IDs, deduplicated and sorted."""
+    return sorted(set(part_option_ids))
+
+def configuration_hash(product_type_id: int, part_option_ids: List[int]) -> str:
+    """Digest of a canonical configuration, unique per cart."""
+    key = f"{product_type_id}:{','.join(map(str, part_option_ids))}"
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+class Cart(Base):
+    __tablename__ = "carts"
+
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    # Opaque token the customer identifies the cart with (X-Cart-Token header)
+    token: Mapped[str] = mapped_column(String(64), unique=True, index=True, nullable=False)
+
+    created_at: Mapped[datetime] = mapped_column(default=func.now())
+    updated_at: Mapped[datetime] = mapped_column(default=func.now(), onupdate=func.now())
+
+    # Relationships
+    items: Mapped[List["CartItem"]] = relationship(back_populates="cart", cascade="all, delete-orphan", passive_deletes=True)
+
+    def __repr__(self) -> str:
+        return f"<Cart(id={self.id})>"
+
+class CartItem(Base):
+    __tablename__ = "cart_items"
+    # Identical configurations in a cart share a row; the unique index also
+    # serves fetching a cart's items (cart_id is its leading column)
+    __table_args__ = (UniqueConstraint("cart_id", "configuration_hash", name="uq_cart_items_cart_id_configuration_hash"),)
+
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    # Part option IDs of the configuration, see canonical_configuration()
+    part_option_ids: Mapped[List[int]] = mapped_column(ARRAY(Integer), nullable=False)
+    configuration_hash: Mapped[str] = mapped_column(String(64), nullable=False)
+    quantity: Mapped[int] = mapped_column(Integer, default=1)
+
+    cart_id: Mapped[int] = mapped_column(ForeignKey("carts.id", ondelete="CASCADE"))
+    product_type_id: Mapped[int] = mapped_column(ForeignKey("product_types.id", ondelete="CASCADE"))
+
+    created_at: Mapped[datetime] = mapped_column(default=func.now())
+    updated_at: Mapped[datetime] = mapped_column(default=func.now(), onupdate=func.now())
+
+    # Relationships
+    cart: Mapped["Cart"] = relationship(back_populates="items")
+
+    def __repr__(self) -> str:
+        return (
+            f"<CartItem(id={self.id}, cart_id={self.cart_id}, product_type_id={self.product_type_id}, "
+            f"part_option_ids={self.part_option_ids}, quantity={self.quantity})>"
+        )
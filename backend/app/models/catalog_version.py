@@ -0,0 +1,15 @@
+from sqlalchemy import BigInteger, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+class CatalogTableVersion(Base):
+    """Catalog versions shared by every worker (see app.core.catalog_cache)."""
+    __tablename__ = "catalog_versions"
+
+    # A catalog table name, or "*" for the version of the whole catalog
+    table_name: Mapped[str] = mapped_column(String(63), primary_key=True)
+    version: Mapped[int] = mapped_column(BigInteger, nullable=False)
+
+    def __repr__(self) -> str:
+        return f"<CatalogTableVersion(table_name='{self.table_name}', version={self.version})>"
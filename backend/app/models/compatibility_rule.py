@@ -0,0 +1,33 @@
+import enum
+from sqlalchemy import String, Text, ForeignKey, func
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+from datetime import datetime
+
+from app.db.base import Base
+
+class CompatibilityRuleType(str, enum.Enum):
+    EXCLUDES = "EXCLUDES" # If trigger is selected, target is unavailable
+    REQUIRES = "REQUIRES" # If trigger is selected, target must be selected in its category
+
+class CompatibilityRule(Base):
+    __tablename__ = "compatibility_rules"
+
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    rule_type: Mapped[str] = mapped_column(String(20), nullable=False, default=CompatibilityRuleType.EXCLUDES.value)
+    description: Mapped[str | None] = mapped_column(Text)
+
+    product_type_id: Mapped[int] = mapped_column(ForeignKey("product_types.id", ondelete="CASCADE"), index=True)
+    trigger_option_id: Mapped[int] = mapped_column(ForeignKey("part_options.id", ondelete="CASCADE"), index=True)
+    target_option_id: Mapped[int] = mapped_column(ForeignKey("part_options.id", ondelete="CASCADE"), index=True)
+
+    created_at: Mapped[datetime] = mapped_column(default=func.now())
+    updated_at: Mapped[datetime] = mapped_column(default=func.now(), onupdate=func.now())
+
+    # Relationships
+    product_type: Mapped["ProductType"] = relationship(back_populates="compatibility_rules")
+
+    def __repr__(self) -> str:
+        return (
+            f"<CompatibilityRule(id={self.id}, {self.trigger_option_id} {self.rule_type} "
+            f"{self.target_option_id}, product_type_id={self.product_type_id})>"
+        )
@@ -1,4 +1,4 @@
-from sqlalchemy import String, Boolean, Numeric, ForeignKey, func
+from sqlalchemy import String, Boolean, Numeric, ForeignKey, Index, func, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from datetime import datetime
 
@@ -6,13 +6,24 @@ from app.db.base import Base
 
 class PartOption(Base):
     __tablename__ = "part_options"
+    __table_args__ = (
+        # Serve listings by category ordered by name, including keyset pages; the partial one only in-stock options
+        Index("ix_part_options_part_category_id_name_id", "part_category_id", "name", "id"),
+        Index(
+            "ix_part_options_part_category_id_name_id_in_stock",
+            "part_category_id",
+            "name",
+            "id",
+            postgresql_where=text("is_in_stock"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     name: Mapped[str] = mapped_column(String(100), nullable=False)
     base_price: Mapped[float] = mapped_column(Numeric(10, 2), nullable=False)
     is_in_stock: Mapped[bool] = mapped_column(Boolean, default=True)
 
-    part_category_id: Mapped[int] = mapped_column(ForeignKey("part_categories.id"))
+    part_category_id: Mapped[int] = mapped_column(ForeignKey("part_categories.id", ondelete="CASCADE"))
 
     created_at: Mapped[datetime] = mapped_column(default=func.now())
     updated_at: Mapped[datetime] = mapped_column(default=func.now(), onupdate=func.now())
@@ -0,0 +1,32 @@
+from sqlalchemy import Integer, Numeric, Text, ForeignKey, func
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+from datetime import datetime
+from typing import List
+
+from app.db.base import Base
+
+class PricingRule(Base):
+    __tablename__ = "pricing_rules"
+
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    # Part option IDs that must all be selected for the rule to apply
+    condition_options: Mapped[List[int]] = mapped_column(ARRAY(Integer), nullable=False, default=list)
+    new_price: Mapped[float] = mapped_column(Numeric(10, 2), nullable=False)
+    priority: Mapped[int] = mapped_column(Integer, default=0) # Higher priority wins on conflicts
+    description: Mapped[str | None] = mapped_column(Text)
+
+    product_type_id: Mapped[int] = mapped_column(ForeignKey("product_types.id", ondelete="CASCADE"), index=True)
+    target_option_id: Mapped[int] = mapped_column(ForeignKey("part_options.id", ondelete="CASCADE"), index=True)
+
+    created_at: Mapped[datetime] = mapped_column(default=func.now())
+    updated_at: Mapped[datetime] = mapped_column(default=func.now(), onupdate=func.now())
+
+    # Relationships
+    product_type: Mapped["ProductType"] = relationship(back_populates="pricing_rules")
+
+    def __repr__(self) -> str:
+        return (
+            f"<PricingRule(id={self.id}, target_option_id={self.target_option_id}, "
+            f"new_price={self.new_price}, priority={self.priority})>"
+        )
@@ -16,7 +16,9 @@ class ProductType(Base):
     updated_at: Mapped[datetime] = mapped_column(default=func.now(), onupdate=func.now())
 
     # Relationships
-    part_categories: Mapped[List["PartCategory"]] = relationship(back_populates="product_type", cascade="all, delete-orphan")
+    part_categories: Mapped[List["PartCategory"]] = relationship(back_populates="product_type", cascade="all, delete-orphan", passive_deletes=True)
+    compatibility_rules: Mapped[List["CompatibilityRule"]] = relationship(back_populates="product_type", cascade="all, delete-orphan", passive_deletes=True)
+    pricing_rules: Mapped[List["PricingRule"]] = relationship(back_populates="product_type", cascade="all, delete-orphan", passive_deletes=True)
 
     def __repr__(self) -> str:
         return f"<ProductType(id={self.id}, name='{self.name}')>" 
\ No newline at end of file
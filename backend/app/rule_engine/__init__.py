@@ -0,0 +1,16 @@
+from .compatibility import (
+    CategoryEvaluation,
+    CompiledCompatibility,
+    InvalidSelectionError,
+    compile_compatibility,
+)
+from .analytics import AnalysisTooComplexError, ConfigurationAnalysis, analyze_configurations
+from .completion import CompiledCompletion, compile_completion
+from .pricing import (
+    CompiledPricingRule,
+    PriceBreakdown,
+    PriceLine,
+    PricingMatcher,
+    compile_pricing,
+)
+from .registry import CompiledProductType, RuleEngine, rule_engine
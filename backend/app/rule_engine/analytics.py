@@ -0,0 +1,184 @@
+"""Counting the valid configurations of a compiled product type.
+
+A configuration picks one in-stock option in every category such that no two
+picked options conflict. Enumerating them is exponential in the number of
+categories (20 options in 10 categories are 20^10 candidates), so they are
+counted on the compiled bitsets instead:
+
+1. Constraint propagation (arc consistency): an option that conflicts with
+   every remaining option of some other category can never be part of a
+   configuration and is pruned; pruning repeats until nothing changes.
+2. Decomposition: categories whose options share no conflicts are
+   independent, so they are split into connected components whose counts
+   multiply.
+3. Memoized DP: within a component categories are placed one after another,
+   and all the choices made so far tell the later categories is which of
+   their options are blocked. Completions are memoized on (position, blocked
+   mask of the later categories), so choices that block the same options are
+   counted once. Categories are placed in an order that keeps that mask small.
+
+Per-option frequencies come from the same memo: the configurations through an
+option are the partial configurations reaching a state times the completions
+after picking the option there.
+
+Counting is #P-hard in general; with many rules spread across all categories
+the number of states can still explode, so it is capped.
+"""
+from dataclasses import dataclass
+from typing import Dict, List, Tuple
+
+from app.rule_engine.compatibility import CompiledCompatibility, iter_bits
+
+DEFAULT_MAX_STATES = 1_000_000
+
+class AnalysisTooComplexError(ValueError):
+    """Raised when counting would need more than the allowed number of DP states."""
+
+@dataclass(frozen=True)
+class ConfigurationAnalysis:
+    total_configurations: int
+    option_frequencies: Dict[int, int] # Part option ID -> configurations that include it
+    dead_options: List[Tuple[int, str]] # (option_id, reason), in display order
+
+def propagate(conflicts: List[int], domains: List[int]) -> List[int]:
+    """Prunes options without a compatible option in some other category, to a fixpoint."""
+    domains = list(domains)
+    categories = range(len(domains))
+    changed = True
+    while changed:
+        changed = False
+        for index in categories:
+            domain = domains[index]
+            for bit in iter_bits(domain):
+                if any(domains[other] & ~conflicts[bit] == 0 for other in categories if other != index):
+                    domain &= ~(1 << bit)
+            if domain != domains[index]:
+                domains[index] = domain
+                changed = True
+    return domains
+
+def _reach(conflicts: List[int], domain: int) -> int:
+    """Mask of every option that conflicts with some option of `domain`."""
+    reach = 0
+    for bit in iter_bits(domain):
+        reach |= conflicts[bit]
+    return reach
+
+def _components(conflicts: List[int], domains: List[int]) -> List[List[int]]:
+    """Splits category indexes into groups connected by conflicts between their options."""
+    reach = [_reach(conflicts, domain) for domain in domains]
+    unvisited = set(range(len(domains)))
+    components = []
+    while unvisited:
+        stack = [min(unvisited)]
+        unvisited.discard(stack[0])
+        members = []
+        while stack:
+            index = stack.pop()
+            members.append(index)
+            linked = [other for other in unvisited if reach[index] & domains[other] or reach[other] & domains[index]]
+            unvisited.difference_update(linked)
+            stack.extend(linked)
+        components.append(sorted(members))
+    return components
+
+def _placement_order(conflicts: List[int], domains: List[int], members: List[int]) -> List[int]:
+    """Orders a component's categories to keep the DP state small.
+
+    The state after placing some categories is the set of options they block in
+    the others, so each step places the category that leaves the fewest
+    unplaced options within reach of the placed ones.
+    """
+    reach = {index: _reach(conflicts, domains[index]) for index in members}
+    order, placed_reach, unplaced = [], 0, set(members)
+
+    def frontier(index: int) -> int:
+        rest = 0
+        for other in unplaced:
+            if other != index:
+                rest |= domains[other]
+        return bin((placed_reach | reach[index]) & rest).count("1")
+
+    while unplaced:
+        index = min(sorted(unplaced), key=frontier)
+        order.append(index)
+        unplaced.discard(index)
+        placed_reach |= reach[index]
+    return order
+
+def _count_component(
+    conflicts: List[int], domains: List[int], order: List[int], max_states: int
+) -> Tuple[int, Dict[int, int]]:
+    """Counts the configurations of one component and how many of them include each option bit."""
+    # later[position]: every option of the categories placed after `position`
+    later = [0] * len(order)
+    for position in range(len(order) - 2, -1, -1):
+        later[position] = later[position + 1] | domains[order[position + 1]]
+
+    memo: Dict[Tuple[int, int], int] = {}
+
+    def completions(position: int, blocked: int) -> int:
+        if position == len(order):
+            return 1
+        key = (position, blocked)
+        cached = memo.get(key)
+        if cached is None:
+            cached = 0
+            for bit in iter_bits(domains[order[position]] & ~blocked):
+                cached += completions(position + 1, (blocked | conflicts[bit]) & later[position])
+            memo[key] = cached
+            if len(memo) > max_states:
+                raise AnalysisTooComplexError(
+                    f"Counting needs more than {max_states} states; the rules interact too much to count exactly."
+                )
+        return cached
+
+    total = completions(0, 0)
+    frequencies: Dict[int, int] = {}
+    prefixes = {0: 1} # Blocked mask -> partial configurations leading to it
+    for position, index in enumerate(order):
+        reached: Dict[int, int] = {}
+        for blocked, count in prefixes.items():
+            for bit in iter_bits(domains[index] & ~blocked):
+                following = (blocked | conflicts[bit]) & later[position]
+                through = completions(position + 1, following)
+                if through:
+                    frequencies[bit] = frequencies.get(bit, 0) + count * through
+                    reached[following] = reached.get(following, 0) + count
+        prefixes = reached
+    return total, frequencies
+
+def analyze_configurations(
+    compatibility: CompiledCompatibility, max_states: int = DEFAULT_MAX_STATES
+) -> ConfigurationAnalysis:
+    """Counts valid configurations and how often every option appears in them."""
+    in_stock = [mask & ~compatibility.out_of_stock_mask for mask in compatibility.category_masks]
+    domains = propagate(compatibility.conflicts, in_stock)
+
+    total = 0
+    frequencies: Dict[int, int] = {}
+    # Nothing can be built without categories, or when one has no usable option left
+    if domains and all(domains):
+        conflicts = compatibility.conflicts
+        counts = [
+            _count_component(conflicts, domains, _placement_order(conflicts, domains, members), max_states)
+            for members in _components(conflicts, domains)
+        ]
+        total = 1
+        for count, _ in counts:
+            total *= count
+        # Scale each component's frequencies by the configurations of the other components
+        for count, component_frequencies in counts:
+            others = total // count if count else 0
+            for bit, through in component_frequencies.items():
+                frequencies[bit] = through * others
+
+    option_frequencies = {option_id: frequencies.get(bit, 0) for bit, option_id in enumerate(compatibility.option_ids)}
+    dead_options = [
+        (option_id, "out_of_stock" if compatibility.out_of_stock_mask >> bit & 1 else "incompatible")
+        for bit, option_id in enumerate(compatibility.option_ids)
+        if not option_frequencies[option_id]
+    ]
+    return ConfigurationAnalysis(
+        total_configurations=total, option_frequencies=option_frequencies, dead_options=dead_options
+    )
@@ -0,0 +1,203 @@
+"""Bitset compilation and evaluation of compatibility rules.
+
+Every part option of a product type is assigned one bit. Options are laid out
+category by category (in display order), so each category owns a contiguous
+range of bits. Compatibility rules are compiled once into a per-option
+"conflicts" mask, after which evaluating a selection is a handful of integer
+ORs/ANDs and does not touch the database.
+"""
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from app.models.compatibility_rule import CompatibilityRuleType
+
+class InvalidSelectionError(ValueError):
+    """Raised when a selection cannot be evaluated against a product type."""
+
+def iter_bits(mask: int) -> Iterable[int]:
+    """Yields the indexes of the set bits of a mask, lowest first."""
+    while mask:
+        low_bit = mask & -mask
+        yield low_bit.bit_length() - 1
+        mask ^= low_bit
+
+@dataclass(frozen=True)
+class CategoryEvaluation:
+    category_id: int
+    available_options: List[int]
+    disabled_options: List[Tuple[int, str]] # (option_id, reason)
+
+@dataclass
+class CompiledCompatibility:
+    category_ids: List[int]
+    category_masks: List[int] # Category index -> mask of its options
+    option_ids: List[int] # Bit -> part option ID
+    option_bits: Dict[int, int] # Part option ID -> bit
+    option_categories: List[int] # Bit -> category index
+    conflicts: List[int] # Bit -> mask of options that cannot be combined with it
+    out_of_stock_mask: int
+
+    def selection_bits(self, selected_option_ids: Iterable[int]) -> List[int]:
+        """Validates a selection and returns its bits ordered by category."""
+        bits_by_category: Dict[int, int] = {}
+        unknown = []
+        for option_id in selected_option_ids:
+            bit = self.option_bits.get(option_id)
+            if bit is None:
+                unknown.append(option_id)
+                continue
+            category_index = self.option_categories[bit]
+            previous = bits_by_category.setdefault(category_index, bit)
+            if previous != bit:
+                raise InvalidSelectionError(
+                    f"Only one option can be selected in part category {self.category_ids[category_index]}."
+                )
+        if unknown:
+            raise InvalidSelectionError(
+                f"Part options {sorted(unknown)} do not belong to this product type."
+            )
+        return [bits_by_category[index] for index in sorted(bits_by_category)]
+
+    def check_configuration(self, selected_option_ids: Iterable[int]) -> None:
+        """Raises InvalidSelectionError unless the selection is a complete, orderable configuration."""
+        selected_bits = self.selection_bits(selected_option_ids)
+        if len(selected_bits) != len(self.category_ids):
+            chosen = {self.option_categories[bit] for bit in selected_bits}
+            missing = [self.category_ids[index] for index in range(len(self.category_ids)) if index not in chosen]
+            raise InvalidSelectionError(f"An option must be selected in part categories {missing}.")
+        blocked = 0
+        for bit in selected_bits:
+            blocked |= self.conflicts[bit]
+        incompatible = [self.option_ids[bit] for bit in selected_bits if blocked >> bit & 1]
+        if incompatible:
+            raise InvalidSelectionError(f"Part options {incompatible} cannot be combined.")
+        out_of_stock = [self.option_ids[bit] for bit in selected_bits if self.out_of_stock_mask >> bit & 1]
+        if out_of_stock:
+            raise InvalidSelectionError(f"Part options {out_of_stock} are out of stock.")
+
+    def blocked_masks(self, selected_bits: Sequence[int]) -> List[int]:
+        """Returns, per category, the options blocked by the selections made in *other* categories.
+
+        A category never blocks its own options, so the customer can always switch
+        the current choice. Prefix/suffix ORs keep this linear in the selection size.
+        """
+        count = len(selected_bits)
+        prefix = [0] * (count + 1)
+        for i, bit in enumerate(selected_bits):
+            prefix[i + 1] = prefix[i] | self.conflicts[bit]
+        suffix = [0] * (count + 1)
+        for i in range(count - 1, -1, -1):
+            suffix[i] = suffix[i + 1] | self.conflicts[selected_bits[i]]
+
+        blocked = [prefix[count]] * len(self.category_ids)
+        for i, bit in enumerate(selected_bits):
+            blocked[self.option_categories[bit]] = prefix[i] | suffix[i + 1]
+        return blocked
+
+    def evaluate(self, selected_option_ids: Iterable[int]) -> List[CategoryEvaluation]:
+        """Computes the available and disabled options of every category for a selection."""
+        blocked = self.blocked_masks(self.selection_bits(selected_option_ids))
+        return [self.evaluate_category(index, blocked[index]) for index in range(len(self.category_ids))]
+
+    def evaluate_change(
+        self, selected_option_ids: Iterable[int], category_id: int, option_id: Optional[int]
+    ) -> Tuple[List[int], List[CategoryEvaluation]]:
+        """Replaces the choice in one category (None clears it) and re-evaluates only what it affects.
+
+        Returns the new selection's option IDs in display order and the
+        categories whose blocked options changed. The changed category itself
+        never is: a category's own choice does not block its options.
+        """
+        try:
+            category_index = self.category_ids.index(category_id)
+        except ValueError:
+            raise InvalidSelectionError(f"Part category {category_id} does not belong to this product type.")
+        previous_bits = self.selection_bits(selected_option_ids)
+        bits = [bit for bit in previous_bits if self.option_categories[bit] != category_index]
+        if option_id is not None:
+            bit = self.option_bits.get(option_id)
+            if bit is None or self.option_categories[bit] != category_index:
+                raise InvalidSelectionError(f"Part option {option_id} does not belong to part category {category_id}.")
+            bits = sorted(bits + [bit])
+
+        previous_blocked = self.blocked_masks(previous_bits)
+        blocked = self.blocked_masks(bits)
+        changed = [
+            self.evaluate_category(index, blocked[index])
+            for index, category_mask in enumerate(self.category_masks)
+            if (previous_blocked[index] ^ blocked[index]) & category_mask
+        ]
+        return [self.option_ids[bit] for bit in bits], changed
+
+    def evaluate_category(self, category_index: int, blocked_mask: int) -> CategoryEvaluation:
+        """Splits a category's options given the mask of options blocked for it."""
+        category_mask = self.category_masks[category_index]
+        incompatible = category_mask & blocked_mask
+        out_of_stock = category_mask & self.out_of_stock_mask & ~incompatible
+        available = category_mask & ~incompatible & ~out_of_stock
+
+        disabled = [(self.option_ids[bit], "incompatible") for bit in iter_bits(incompatible)]
+        disabled += [(self.option_ids[bit], "out_of_stock") for bit in iter_bits(out_of_stock)]
+        disabled.sort(key=lambda item: self.option_bits[item[0]]) # Keep display order
+        return CategoryEvaluation(
+            category_id=self.category_ids[category_index],
+            available_options=[self.option_ids[bit] for bit in iter_bits(available)],
+            disabled_options=disabled,
+        )
+
+def compile_compatibility(categories, options, compatibility_rules) -> CompiledCompatibility:
+    """Compiles a product type's categories, options and rules into bitsets.
+
+    `categories` must be in display order. Options are ordered by name within
+    their category, matching the admin listing. Rules that reference options
+    outside the product type are ignored.
+    """
+    category_ids = [category.id for category in categories]
+
+    options_by_category: Dict[int, list] = {category_id: [] for category_id in category_ids}
+    for option in options:
+        if option.part_category_id in options_by_category:
+            options_by_category[option.part_category_id].append(option)
+
+    option_ids: List[int] = []
+    option_categories: List[int] = []
+    category_masks: List[int] = []
+    out_of_stock_mask = 0
+    for index, category_id in enumerate(category_ids):
+        start = len(option_ids)
+        for option in sorted(options_by_category[category_id], key=lambda o: (o.name, o.id)):
+            if option.is_in_stock is False:
+                out_of_stock_mask |= 1 << len(option_ids)
+            option_ids.append(option.id)
+            option_categories.append(index)
+        category_masks.append(((1 << len(option_ids)) - 1) ^ ((1 << start) - 1))
+    option_bits = {option_id: bit for bit, option_id in enumerate(option_ids)}
+
+    conflicts = [0] * len(option_ids)
+    for rule in compatibility_rules:
+        trigger = option_bits.get(rule.trigger_option_id)
+        target = option_bits.get(rule.target_option_id)
+        if trigger is None or target is None or trigger == target:
+            continue
+        if rule.rule_type == CompatibilityRuleType.REQUIRES:
+            target_category = option_categories[target]
+            if option_categories[trigger] == target_category:
+                continue # Two options of one category can never be selected together anyway
+            # Requiring the target is the same as excluding its siblings
+            excluded = category_masks[target_category] & ~(1 << target)
+        else:
+            excluded = 1 << target
+        # Exclusions are symmetric: picking either side blocks the other
+        conflicts[trigger] |= excluded
+        for bit in iter_bits(excluded):
+            conflicts[bit] |= 1 << trigger
+
+    return CompiledCompatibility(
+        category_ids=category_ids,
+        category_masks=category_masks,
+        option_ids=option_ids,
+        option_bits=option_bits,
+        option_categories=option_categories,
+        conflicts=conflicts,
+        out_of_stock_mask=out_of_stock_mask,
+    )
@@ -0,0 +1,107 @@
+"""Completing a partial selection at the lowest (or highest) base price.
+
+The remaining categories are filled in by a depth-first branch-and-bound
+search over the compiled bitsets:
+
+* Each category's in-stock options are sorted by price once, at compile time,
+  together with the category's cheapest price, which is a lower bound on what
+  it adds to any completion (prices are negated to find the most expensive).
+* Open categories are searched fewest-options-first, cheapest option first,
+  so the first complete configuration found is usually already the best.
+* A branch is cut as soon as its price plus the lower bounds of the categories
+  still open cannot beat the best configuration found so far, or when an open
+  category has no option left that the choices so far do not block.
+"""
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from app.rule_engine.compatibility import CompiledCompatibility, iter_bits
+
+@dataclass
+class CompiledCompletion:
+    compatibility: CompiledCompatibility
+    # Objective ("cheapest"/"most_expensive") -> category index -> [(cost, bit)] in ascending cost
+    candidates: Dict[str, List[List[Tuple[Decimal, int]]]]
+
+    def complete(self, selected_option_ids: Iterable[int], objective: str = "cheapest") -> Optional[List[int]]:
+        """Returns the option IDs of the best valid full configuration containing the selection.
+
+        Raises InvalidSelectionError for malformed selections and returns None
+        when no in-stock completion satisfies the compatibility rules.
+        """
+        compatibility = self.compatibility
+        selected_bits = compatibility.selection_bits(selected_option_ids)
+        blocked = 0
+        for bit in selected_bits:
+            if blocked >> bit & 1 or compatibility.out_of_stock_mask >> bit & 1:
+                return None
+            blocked |= compatibility.conflicts[bit]
+
+        candidates = self.candidates[objective]
+        taken = {compatibility.option_categories[bit] for bit in selected_bits}
+        open_categories = sorted(
+            (index for index in range(len(compatibility.category_ids)) if index not in taken),
+            key=lambda index: (sum(1 for _, bit in candidates[index] if not blocked >> bit & 1), index),
+        )
+        # suffix_bounds[depth]: static lower bound of the categories from `depth` on
+        suffix_bounds = [Decimal("0")] * (len(open_categories) + 1)
+        for depth in range(len(open_categories) - 1, -1, -1):
+            options = candidates[open_categories[depth]]
+            if not options:
+                return None
+            suffix_bounds[depth] = suffix_bounds[depth + 1] + options[0][0]
+
+        best: List[Optional[Decimal]] = [None]
+        best_bits: List[int] = []
+        path: List[int] = []
+
+        def bound(depth: int, blocked: int) -> Optional[Decimal]:
+            """Cheapest unblocked option per open category, or None if one has none left."""
+            total = Decimal("0")
+            for index in open_categories[depth:]:
+                for cost, bit in candidates[index]:
+                    if not blocked >> bit & 1:
+                        total += cost
+                        break
+                else:
+                    return None
+            return total
+
+        def search(depth: int, blocked: int, cost: Decimal) -> None:
+            if depth == len(open_categories):
+                if best[0] is None or cost < best[0]:
+                    best[0] = cost
+                    best_bits[:] = path
+                return
+            lower = bound(depth, blocked)
+            if lower is None or (best[0] is not None and cost + lower >= best[0]):
+                return
+            for option_cost, bit in candidates[open_categories[depth]]:
+                if blocked >> bit & 1:
+                    continue
+                # Options are in ascending cost, so no later one can do better either
+                if best[0] is not None and cost + option_cost + suffix_bounds[depth + 1] >= best[0]:
+                    break
+                path.append(bit)
+                search(depth + 1, blocked | compatibility.conflicts[bit], cost + option_cost)
+                path.pop()
+
+        search(0, blocked, Decimal("0"))
+        if best[0] is None:
+            return None
+        bits = sorted(selected_bits + best_bits)
+        return [compatibility.option_ids[bit] for bit in bits]
+
+def compile_completion(compatibility: CompiledCompatibility, prices: Dict[int, Decimal]) -> CompiledCompletion:
+    """Sorts each category's in-stock options by base price (`prices` maps part option ID to it)."""
+    cheapest, most_expensive = [], []
+    for category_mask in compatibility.category_masks:
+        in_stock = category_mask & ~compatibility.out_of_stock_mask
+        options = [(prices[compatibility.option_ids[bit]], bit) for bit in iter_bits(in_stock)]
+        cheapest.append(sorted(options))
+        most_expensive.append(sorted((-price, bit) for price, bit in options))
+    return CompiledCompletion(
+        compatibility=compatibility,
+        candidates={"cheapest": cheapest, "most_expensive": most_expensive},
+    )
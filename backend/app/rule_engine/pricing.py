@@ -0,0 +1,138 @@
+"""Indexed matching of conditional pricing rules.
+
+A pricing rule sets the price of its target option when every option in its
+conditions is selected. Instead of testing every rule on every request, each
+rule is filed in an inverted index under one of its condition options: a rule
+can only match if that option is selected, so the candidates for a selection
+are the union of the buckets of the selected options. Candidates are then
+confirmed with a subset test. Rules are pre-sorted by priority, so the first
+match per target wins.
+"""
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import AbstractSet, Dict, FrozenSet, Iterable, List, Optional
+
+@dataclass(frozen=True)
+class CompiledPricingRule:
+    id: int
+    target_option_id: int
+    conditions: FrozenSet[int]
+    new_price: Decimal
+    priority: int
+
+@dataclass(frozen=True)
+class PricedOption:
+    part_option_id: int
+    part_category_id: int
+    name: str
+    base_price: Decimal
+
+@dataclass(frozen=True)
+class PriceLine:
+    part_option_id: int
+    part_category_id: int
+    name: str
+    base_price: Decimal
+    price: Decimal
+    pricing_rule_id: Optional[int]
+
+@dataclass(frozen=True)
+class PriceBreakdown:
+    lines: List[PriceLine]
+    base_price: Decimal # Sum of the base prices of the selection
+    total_price: Decimal # After pricing rules
+
+class PricingMatcher:
+    def __init__(self, options: List[PricedOption], rules: List[CompiledPricingRule]) -> None:
+        # `options` are expected in display order; price lines follow it
+        self.options: Dict[int, PricedOption] = {option.part_option_id: option for option in options}
+        self.option_order: Dict[int, int] = {option.part_option_id: i for i, option in enumerate(options)}
+        # Position in this list is the precedence: higher priority first, then older rules
+        self.rules: List[CompiledPricingRule] = sorted(rules, key=lambda rule: (-rule.priority, rule.id))
+        self.index: Dict[int, List[int]] = {}
+        self.unconditional: List[int] = []
+        for position, rule in enumerate(self.rules):
+            if not rule.conditions:
+                self.unconditional.append(position)
+                continue
+            # File the rule under its least crowded condition to keep buckets short
+            key = min(rule.conditions, key=lambda option_id: (len(self.index.get(option_id, ())), option_id))
+            self.index.setdefault(key, []).append(position)
+
+    def match(self, selected: AbstractSet[int]) -> Dict[int, CompiledPricingRule]:
+        """Returns the winning rule for each selected target option."""
+        candidates = set(self.unconditional)
+        for option_id in selected:
+            bucket = self.index.get(option_id)
+            if bucket:
+                candidates.update(bucket)
+
+        winners: Dict[int, CompiledPricingRule] = {}
+        for position in sorted(candidates):
+            rule = self.rules[position]
+            if rule.target_option_id in winners or rule.target_option_id not in selected:
+                continue
+            if rule.conditions <= selected:
+                winners[rule.target_option_id] = rule
+        return winners
+
+    def price(self, selected_option_ids: Iterable[int]) -> PriceBreakdown:
+        """Prices a selection of options that all belong to this product type."""
+        selected = frozenset(selected_option_ids)
+        winners = self.match(selected)
+        lines = []
+        for option_id in sorted(selected, key=self.option_order.__getitem__):
+            option = self.options[option_id]
+            rule = winners.get(option_id)
+            lines.append(PriceLine(
+                part_option_id=option_id,
+                part_category_id=option.part_category_id,
+                name=option.name,
+                base_price=option.base_price,
+                price=rule.new_price if rule else option.base_price,
+                pricing_rule_id=rule.id if rule else None,
+            ))
+        return PriceBreakdown(
+            lines=lines,
+            base_price=sum((line.base_price for line in lines), Decimal("0")),
+            total_price=sum((line.price for line in lines), Decimal("0")),
+        )
+
+def _as_decimal(value) -> Decimal:
+    return value if isinstance(value, Decimal) else Decimal(str(value))
+
+def compile_pricing(categories, options, pricing_rules) -> PricingMatcher:
+    """Builds the pricing matcher of a product type.
+
+    Options are ordered like the compatibility bitsets (category display order,
+    then name). Rules whose target or conditions fall outside the product type
+    can never match and are dropped.
+    """
+    category_order = {category.id: index for index, category in enumerate(categories)}
+    ordered = sorted(
+        (option for option in options if option.part_category_id in category_order),
+        key=lambda o: (category_order[o.part_category_id], o.name, o.id),
+    )
+    priced_options = [
+        PricedOption(
+            part_option_id=option.id,
+            part_category_id=option.part_category_id,
+            name=option.name,
+            base_price=_as_decimal(option.base_price),
+        )
+        for option in ordered
+    ]
+    known = {option.part_option_id for option in priced_options}
+    compiled_rules = []
+    for rule in pricing_rules:
+        conditions = frozenset(rule.condition_options or ())
+        if rule.target_option_id not in known or not conditions <= known:
+            continue
+        compiled_rules.append(CompiledPricingRule(
+            id=rule.id,
+            target_option_id=rule.target_option_id,
+            conditions=conditions,
+            new_price=_as_decimal(rule.new_price),
+            priority=rule.priority or 0,
+        ))
+    return PricingMatcher(priced_options, compiled_rules)
@@ -0,0 +1,76 @@
+"""In-process cache of compiled product types."""
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Optional, Union
+
+from app.config import settings
+from app.core.catalog_cache import VersionedLRUCache
+from app.rule_engine.analytics import AnalysisTooComplexError, ConfigurationAnalysis, analyze_configurations
+from app.rule_engine.compatibility import CompiledCompatibility, compile_compatibility
+from app.rule_engine.completion import CompiledCompletion, compile_completion
+from app.rule_engine.pricing import PricingMatcher, compile_pricing
+
+@dataclass
+class CompiledProductType:
+    product_type_id: int
+    version: int # Catalog version the rules were compiled from
+    compatibility: CompiledCompatibility
+    pricing: PricingMatcher
+    completion: CompiledCompletion
+
+    @cached_property
+    def _analysis(self) -> Union[ConfigurationAnalysis, AnalysisTooComplexError]:
+        try:
+            return analyze_configurations(
+                self.compatibility, max_states=settings.CONFIGURATION_ANALYTICS_MAX_STATES
+            )
+        except AnalysisTooComplexError as exc:
+            return exc
+
+    @property
+    def analysis(self) -> ConfigurationAnalysis:
+        """Valid configuration counts, computed once per compiled (catalog) version.
+
+        A search that exceeds the state budget is not retried either: the
+        AnalysisTooComplexError is cached and raised again on every access.
+        """
+        result = self._analysis
+        if isinstance(result, AnalysisTooComplexError):
+            raise result.with_traceback(None)
+        return result
+
+class RuleEngine:
+    """Holds one compiled rule set per product type for the catalog version it was built from.
+
+    Callers read the catalog version *before* loading rows from the database and
+    hand it to `compile()`; a load that raced with a write is then stamped with
+    an outdated version and is never served from the cache.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self._compiled = VersionedLRUCache(maxsize=maxsize)
+
+    def get(self, product_type_id: int, version: int) -> Optional[CompiledProductType]:
+        return self._compiled.get(product_type_id, version)
+
+    def compile(
+        self, product_type_id: int, categories, options, compatibility_rules, pricing_rules, version: int
+    ) -> CompiledProductType:
+        compatibility = compile_compatibility(categories, options, compatibility_rules)
+        pricing = compile_pricing(categories, options, pricing_rules)
+        base_prices = {option_id: option.base_price for option_id, option in pricing.options.items()}
+        compiled = CompiledProductType(
+            product_type_id=product_type_id,
+            version=version,
+            compatibility=compatibility,
+            pricing=pricing,
+            completion=compile_completion(compatibility, base_prices),
+        )
+        self._compiled.put(product_type_id, compiled, version)
+        return compiled
+
+    def stats(self):
+        return self._compiled.stats()
+
+# Process-wide instance used by the API
+rule_engine = RuleEngine(maxsize=settings.CATALOG_CACHE_SIZE)
@@ -1,5 +1,48 @@
-from .product_type import ProductType, ProductTypeCreate, ProductTypeUpdate
+from .product_type import (
+    ProductType,
+    ProductTypeCreate,
+    ProductTypeUpdate,
+    ProductTypeBulkDelete,
+    ProductTypeBulkDeleteResult,
+)
 from .part_category import PartCategory, PartCategoryCreate, PartCategoryUpdate
-from .part_option import PartOption, PartOptionCreate, PartOptionUpdate
+from .part_option import (
+    PartOption,
+    PartOptionCreate,
+    PartOptionUpdate,
+    PartOptionBulkUpdateItem,
+    PartOptionBulkResult,
+    BulkRowError,
+    PartOptionStockUpdate,
+    PartOptionStockResult,
+)
 from .auth import Token, LoginRequest
-from .admin_user import AdminUserRead 
\ No newline at end of file
+from .admin_user import AdminUserRead
+from .compatibility_rule import CompatibilityRule, CompatibilityRuleCreate, CompatibilityRuleUpdate
+from .pricing_rule import PricingRule, PricingRuleCreate, PricingRuleUpdate
+from .configuration import (
+    ConfigurationEvaluateRequest,
+    ConfigurationEvaluateResponse,
+    ConfigurationCompleteRequest,
+    ConfigurationCompleteResponse,
+    SelectionChangeRequest,
+    SelectionChangeResponse,
+    SelectionStateResponse,
+    ConfiguratorSelect,
+    ConfiguratorState,
+    CategoryAvailability,
+    DisabledOption,
+    ConfigurationAnalytics,
+    PriceLine,
+    PartCategoryWithOptions,
+    ProductConfiguration,
+)
+from .cart import Cart, CartItem, CartItemCreate
+from .catalog_import import (
+    CatalogImportRow,
+    ProductTypeImportRow,
+    PartCategoryImportRow,
+    PartOptionImportRow,
+    CatalogImportError,
+    CatalogImportSummary,
+)
@@ -0,0 +1,28 @@
+from pydantic import BaseModel, Field
+from typing import List
+from decimal import Decimal
+
+MAX_CART_ITEM_QUANTITY = 100
+
+# Schema for adding a configuration to a cart (request)
+class CartItemCreate(BaseModel):
+    product_type_id: int
+    selected_options: List[int] # One option per part category
+    quantity: int = Field(1, ge=1, le=MAX_CART_ITEM_QUANTITY)
+
+# Schema for reading a cart item, priced from the current catalog
+class CartItem(BaseModel):
+    id: int
+    product_type_id: int
+    selected_options: List[int] # Sorted by ID
+    quantity: int
+    unit_price: Decimal # Price of the options after pricing rules, as in the configurator
+    line_price: Decimal # unit_price * quantity
+    is_available: bool # False once the configuration can no longer be ordered
+    missing_options: List[int] = [] # Selected options deleted since; left out of unit_price
+
+# Schema for reading a cart
+class Cart(BaseModel):
+    token: str # Send back as the X-Cart-Token header
+    items: List[CartItem]
+    total_price: Decimal
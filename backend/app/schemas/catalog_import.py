@@ -0,0 +1,45 @@
+from pydantic import BaseModel, Field
+from typing import Annotated, List, Literal, Optional, Union
+
+from .product_type import ProductTypeCreate
+from .part_category import PartCategoryCreate
+from .part_option import PartOptionCreate
+
+# Import rows are the create schemas tagged with their `kind`. Parents may also
+# be referenced by name, so a new product line can be loaded from one file as
+# long as parents come before their children.
+
+# Schema for a product type row (matched on name)
+class ProductTypeImportRow(ProductTypeCreate):
+    kind: Literal["product_type"]
+
+# Schema for a part category row (matched on product type and name)
+class PartCategoryImportRow(PartCategoryCreate):
+    kind: Literal["part_category"]
+    product_type_id: Optional[int] = None
+    product_type: Optional[str] = None # Product type name, instead of product_type_id
+
+# Schema for a part option row (matched on part category and name)
+class PartOptionImportRow(PartOptionCreate):
+    kind: Literal["part_option"]
+    part_category_id: Optional[int] = None
+    product_type: Optional[str] = None # Product type and category names, instead of part_category_id
+    part_category: Optional[str] = None
+
+CatalogImportRow = Annotated[
+    Union[ProductTypeImportRow, PartCategoryImportRow, PartOptionImportRow],
+    Field(discriminator="kind"),
+]
+
+# Schema for a rejected import row
+class CatalogImportError(BaseModel):
+    line: int # Line of the file the row starts on
+    detail: str
+
+# Schema for the outcome of an import (response)
+class CatalogImportSummary(BaseModel):
+    inserted: int = 0
+    updated: int = 0
+    unchanged: int = 0 # Matched an existing row with the same values
+    rejected: int = 0
+    errors: List[CatalogImportError] = [] # Only the first rejections are listed
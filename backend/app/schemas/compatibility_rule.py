@@ -0,0 +1,29 @@
+from pydantic import BaseModel, ConfigDict
+from typing import Optional
+
+from app.models.compatibility_rule import CompatibilityRuleType
+
+# Base schema
+class CompatibilityRuleBase(BaseModel):
+    product_type_id: int
+    trigger_option_id: int
+    target_option_id: int
+    rule_type: CompatibilityRuleType = CompatibilityRuleType.EXCLUDES
+    description: Optional[str] = None
+
+# Schema for creation
+class CompatibilityRuleCreate(CompatibilityRuleBase):
+    pass
+
+# Schema for update
+class CompatibilityRuleUpdate(BaseModel):
+    trigger_option_id: Optional[int] = None
+    target_option_id: Optional[int] = None
+    rule_type: Optional[CompatibilityRuleType] = None
+    description: Optional[str] = None
+
+# Schema for reading
+class CompatibilityRule(CompatibilityRuleBase):
+    id: int
+
+    model_config = ConfigDict(from_attributes=True)
@@ -0,0 +1,102 @@
+from pydantic import BaseModel
+from typing import Dict, List, Literal, Optional
+from decimal import Decimal
+
+from app.schemas.product_type import ProductType
+from app.schemas.part_category import PartCategory
+from app.schemas.part_option import PartOption
+
+# A part category together with its options (ordered by name)
+class PartCategoryWithOptions(PartCategory):
+    options: List[PartOption] = []
+
+# Full product tree for GET /products/{product_type_id}/configuration, also the cached catalog snapshot
+class ProductConfiguration(BaseModel):
+    product_type: ProductType
+    categories: List[PartCategoryWithOptions] # Ordered by display_order
+
+# Request body for POST /products/{product_type_id}/evaluate
+class ConfigurationEvaluateRequest(BaseModel):
+    selected_options: List[int] = []
+
+# Request body for PATCH /products/{product_type_id}/selection
+class SelectionChangeRequest(BaseModel):
+    token: str # From the previous selection response
+    category_id: int
+    new_option_id: Optional[int] = None # None clears the category
+
+# Request body for POST /products/{product_type_id}/complete
+class ConfigurationCompleteRequest(ConfigurationEvaluateRequest):
+    objective: Literal["cheapest", "most_expensive"] = "cheapest"
+
+# An option that cannot currently be picked, and why
+class DisabledOption(BaseModel):
+    id: int
+    reason: Literal["incompatible", "out_of_stock"]
+
+# Availability of the options of a single part category
+class CategoryAvailability(BaseModel):
+    available_options: List[int]
+    disabled_options: List[DisabledOption]
+
+# Response for GET /admin/product-types/{product_type_id}/analytics
+class ConfigurationAnalytics(BaseModel):
+    product_type_id: int
+    total_configurations: int # Buildable combinations of in-stock options under the current rules
+    dead_options: List[DisabledOption] # Options that are in no valid configuration
+    option_frequencies: Dict[int, int] # Part option ID -> valid configurations that include it
+
+# Price of one selected option, after pricing rules
+class PriceLine(BaseModel):
+    part_option_id: int
+    part_category_id: int
+    name: str
+    base_price: Decimal
+    price: Decimal
+    pricing_rule_id: Optional[int] = None # Rule that set the price, if any
+
+# Response for POST /products/{product_type_id}/evaluate
+class ConfigurationEvaluateResponse(BaseModel):
+    product_type_id: int
+    selected_options: List[int]
+    configuration: Dict[int, CategoryAvailability] # Keyed by part category ID
+    base_price: Decimal # Sum of the selected options' base prices
+    total_price: Decimal
+    price_breakdown: List[PriceLine]
+
+# Response for POST /products/{product_type_id}/selection
+class SelectionStateResponse(ConfigurationEvaluateResponse):
+    token: str # Signed selection state for the next PATCH
+
+# Response for PATCH /products/{product_type_id}/selection
+class SelectionChangeResponse(BaseModel):
+    product_type_id: int
+    token: str
+    selected_options: List[int] # In display order
+    configuration: Dict[int, CategoryAvailability] # Only the categories whose availability changed
+    base_price: Decimal
+    total_price: Decimal
+
+# Client message on the configurator WebSocket (/products/{product_type_id}/session)
+class ConfiguratorSelect(BaseModel):
+    type: Literal["select"]
+    category_id: int
+    option_id: Optional[int] = None # None clears the category
+
+# Server message on the configurator WebSocket, on connect and after every select
+class ConfiguratorState(BaseModel):
+    type: Literal["state"] = "state"
+    product_type_id: int
+    selected_options: List[int] # In display order
+    configuration: Dict[int, CategoryAvailability] # Only the categories whose availability changed
+    base_price: Decimal
+    total_price: Decimal
+
+# Response for POST /products/{product_type_id}/complete
+class ConfigurationCompleteResponse(BaseModel):
+    product_type_id: int
+    objective: Literal["cheapest", "most_expensive"]
+    selected_options: List[int] # The full configuration, in display order
+    base_price: Decimal # The optimized sum of base prices
+    total_price: Decimal # After pricing rules
+    price_breakdown: List[PriceLine]
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, ConfigDict
-from typing import Optional
+from typing import List, Optional
 from decimal import Decimal
 
 # Base schema
@@ -24,4 +24,30 @@ class PartOptionUpdate(BaseModel):
 class PartOption(PartOptionBase):
     id: int
 
-    model_config = ConfigDict(from_attributes=True) 
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True)
+
+# Schema for one row of a bulk update (request)
+class PartOptionBulkUpdateItem(PartOptionUpdate):
+    id: int
+
+# Schema for a row rejected by a bulk operation
+class BulkRowError(BaseModel):
+    index: int # Position of the row in the request
+    detail: str
+
+# Schema for the outcome of a bulk create/update (response)
+class PartOptionBulkResult(BaseModel):
+    part_options: List[PartOption] # Written rows, in request order
+    errors: List[BulkRowError]
+
+# Schema for a set-based stock change (request); filters are combined with AND
+class PartOptionStockUpdate(BaseModel):
+    is_in_stock: bool
+    ids: Optional[List[int]] = None
+    part_category_id: Optional[int] = None
+    name_contains: Optional[str] = None # Case-insensitive substring of the option name
+
+# Schema for the outcome of a stock change (response)
+class PartOptionStockResult(BaseModel):
+    is_in_stock: bool
+    changed_ids: List[int] # Only options whose stock flag actually flipped
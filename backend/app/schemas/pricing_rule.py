@@ -0,0 +1,30 @@
+from pydantic import BaseModel, ConfigDict
+from typing import List, Optional
+from decimal import Decimal
+
+# Base schema
+class PricingRuleBase(BaseModel):
+    product_type_id: int
+    condition_options: List[int] # All of these must be selected
+    target_option_id: int
+    new_price: Decimal
+    priority: int = 0
+    description: Optional[str] = None
+
+# Schema for creation
+class PricingRuleCreate(PricingRuleBase):
+    pass
+
+# Schema for update
+class PricingRuleUpdate(BaseModel):
+    condition_options: Optional[List[int]] = None
+    target_option_id: Optional[int] = None
+    new_price: Optional[Decimal] = None
+    priority: Optional[int] = None
+    description: Optional[str] = None
+
+# Schema for reading
+class PricingRule(PricingRuleBase):
+    id: int
+
+    model_config = ConfigDict(from_attributes=True)
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, ConfigDict
-from typing import Optional
+from typing import List, Optional
 
 # Base schema for common fields
 class ProductTypeBase(BaseModel):
@@ -19,4 +19,12 @@ class ProductTypeUpdate(ProductTypeBase):
 class ProductType(ProductTypeBase):
     id: int
 
-    model_config = ConfigDict(from_attributes=True) # Use ConfigDict 
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True) # Use ConfigDict 
+
+# Schema for deleting many ProductTypes at once (request)
+class ProductTypeBulkDelete(BaseModel):
+    ids: List[int]
+
+# Schema for the outcome of a bulk delete (response)
+class ProductTypeBulkDeleteResult(BaseModel):
+    deleted_ids: List[int] # Only IDs that existed; missing ones are skipped
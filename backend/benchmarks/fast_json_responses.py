@@ -0,0 +1,114 @@
+"""Serialization cost of an admin list page, response_model versus app.core.fast_json.
+
+    python -m benchmarks.fast_json_responses
+    python -m benchmarks.fast_json_responses --rows 100 --requests 2000
+
+Builds a page of loaded part option rows once, serves it from two routes of
+an in-process app and compares
+
+  response_model  `response_model=List[schemas.PartOption]`: FastAPI validates
+                  every ORM row into the schema, then dumps the models
+  fast_json       `RowSerializer(schemas.PartOption).response(rows)`: row
+                  state copied into dicts and encoded with orjson
+
+It first checks that both routes return byte-identical bodies, then reports
+the serialization time per page on its own and requests per second through
+the whole ASGI stack.
+"""
+import argparse
+import asyncio
+import time
+from decimal import Decimal
+from typing import Awaitable, Callable, Dict, List
+
+import httpx
+from fastapi import FastAPI
+from fastapi.routing import APIRoute, serialize_response
+
+from app import models, schemas
+from app.core.fast_json import RowSerializer
+
+PATHS = {"response_model": "/response-model", "fast_json": "/fast-json"}
+
+def _rows(count: int) -> List[models.PartOption]:
+    return [
+        models.PartOption(
+            id=index,
+            name=f"Option {index} – Ø {index % 29} mm",
+            base_price=Decimal(f"{index % 500}.{index % 100:02d}"),
+            is_in_stock=index % 7 != 0,
+            part_category_id=1 + index % 10,
+        )
+        for index in range(1, count + 1)
+    ]
+
+def _app(rows: List[models.PartOption]) -> FastAPI:
+    bench = FastAPI()
+    serializer = RowSerializer(schemas.PartOption)
+
+    @bench.get(PATHS["response_model"], response_model=List[schemas.PartOption])
+    async def response_model_page():
+        return rows
+
+    @bench.get(PATHS["fast_json"], response_model=List[schemas.PartOption])
+    async def fast_json_page():
+        return serializer.response(rows)
+
+    return bench
+
+async def _time_per_page(serialize: Callable[[], Awaitable[object]], pages: int) -> float:
+    started = time.perf_counter()
+    for _ in range(pages):
+        await serialize()
+    return (time.perf_counter() - started) / pages
+
+async def _requests_per_second(client: httpx.AsyncClient, path: str, requests: int, concurrency: int) -> float:
+    remaining = iter(range(requests))
+
+    async def worker() -> None:
+        for _ in remaining:
+            (await client.get(path)).raise_for_status()
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return requests / (time.perf_counter() - started)
+
+async def main(row_count: int, requests: int, concurrency: int) -> None:
+    rows = _rows(row_count)
+    bench = _app(rows)
+    field = next(route for route in bench.routes if isinstance(route, APIRoute)).response_field
+    serializer = RowSerializer(schemas.PartOption)
+
+    async def response_model_body() -> bytes:
+        return await serialize_response(field=field, response_content=rows, dump_json=True)
+
+    async def fast_json_body() -> bytes:
+        return serializer.response(rows).body
+
+    results: Dict[str, Dict[str, float]] = {}
+    transport = httpx.ASGITransport(app=bench)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        bodies = {name: (await client.get(path)).content for name, path in PATHS.items()}
+        if bodies["response_model"] != bodies["fast_json"]:
+            raise SystemExit("Response bodies differ")
+
+        pages = max(requests, 1000)
+        results["response_model"] = {"serialize": await _time_per_page(response_model_body, pages)}
+        results["fast_json"] = {"serialize": await _time_per_page(fast_json_body, pages)}
+        for name, path in PATHS.items():
+            results[name]["requests_per_second"] = await _requests_per_second(client, path, requests, concurrency)
+
+    print(f"{row_count} rows per page, {len(bodies['fast_json'])} bytes, bodies identical")
+    print(f"{'':16}{'serialize (ms)':>16}{'req/s':>12}")
+    for name, result in results.items():
+        print(f"{name:16}{result['serialize'] * 1000:>16.3f}{result['requests_per_second']:>12.0f}")
+    speedup = results["response_model"]["serialize"] / results["fast_json"]["serialize"]
+    print(f"fast_json serialization speedup: {speedup:.2f}x")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.fast_json_responses", description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=32)
+    args = parser.parse_args()
+    asyncio.run(main(args.rows, args.requests, args.concurrency))
@@ -0,0 +1,89 @@
+"""Create catalog and admin tables
+
+Revision ID: 0c6d2e8b9f41
+Revises: 7193d75644d5
+Create Date: 2025-04-21 16:37:05.904117
+
+The two initial revisions were generated with empty bodies, so databases
+upgraded through them have no tables yet, while databases set up with
+`Base.metadata.create_all` already have them. Each table is therefore only
+created when it is missing; the rule and cart revisions that follow
+reference these tables.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0c6d2e8b9f41'
+down_revision: Union[str, None] = '7193d75644d5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    existing = set(sa.inspect(op.get_bind()).get_table_names())
+    if 'product_types' not in existing:
+        op.create_table('product_types',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('name', sa.String(length=100), nullable=False),
+        sa.Column('description', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('id')
+        )
+        op.create_index(op.f('ix_product_types_id'), 'product_types', ['id'], unique=False)
+        op.create_index(op.f('ix_product_types_name'), 'product_types', ['name'], unique=True)
+    if 'part_categories' not in existing:
+        op.create_table('part_categories',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('name', sa.String(length=100), nullable=False),
+        sa.Column('display_order', sa.Integer(), nullable=False),
+        sa.Column('product_type_id', sa.Integer(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['product_type_id'], ['product_types.id'], ),
+        sa.PrimaryKeyConstraint('id')
+        )
+        op.create_index(op.f('ix_part_categories_id'), 'part_categories', ['id'], unique=False)
+    if 'part_options' not in existing:
+        op.create_table('part_options',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('name', sa.String(length=100), nullable=False),
+        sa.Column('base_price', sa.Numeric(precision=10, scale=2), nullable=False),
+        sa.Column('is_in_stock', sa.Boolean(), nullable=False),
+        sa.Column('part_category_id', sa.Integer(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['part_category_id'], ['part_categories.id'], ),
+        sa.PrimaryKeyConstraint('id')
+        )
+        op.create_index(op.f('ix_part_options_id'), 'part_options', ['id'], unique=False)
+    if 'admin_users' not in existing:
+        op.create_table('admin_users',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('username', sa.String(length=100), nullable=False),
+        sa.Column('password_hash', sa.String(length=255), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('id')
+        )
+        op.create_index(op.f('ix_admin_users_id'), 'admin_users', ['id'], unique=False)
+        op.create_index(op.f('ix_admin_users_username'), 'admin_users', ['username'], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_admin_users_username'), table_name='admin_users')
+    op.drop_index(op.f('ix_admin_users_id'), table_name='admin_users')
+    op.drop_table('admin_users')
+    op.drop_index(op.f('ix_part_options_id'), table_name='part_options')
+    op.drop_table('part_options')
+    op.drop_index(op.f('ix_part_categories_id'), table_name='part_categories')
+    op.drop_table('part_categories')
+    op.drop_index(op.f('ix_product_types_name'), table_name='product_types')
+    op.drop_index(op.f('ix_product_types_id'), table_name='product_types')
+    op.drop_table('product_types')
@@ -0,0 +1,51 @@
+"""Cascade catalog deletes in the database
+
+Revision ID: a4c7e2f91d36
+Revises: e5a9c3f17b28
+Create Date: 2025-05-12 14:03:48.517390
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a4c7e2f91d36'
+down_revision: Union[str, None] = 'e5a9c3f17b28'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, column, referenced table) of the foreign keys that gain ON DELETE CASCADE
+CASCADED_FOREIGN_KEYS = (
+    ('part_categories', 'product_type_id', 'product_types'),
+    ('part_options', 'part_category_id', 'part_categories'),
+    ('compatibility_rules', 'product_type_id', 'product_types'),
+    ('pricing_rules', 'product_type_id', 'product_types'),
+)
+
+
+def _replace_foreign_keys(ondelete: Union[str, None]) -> None:
+    for table, column, referent in CASCADED_FOREIGN_KEYS:
+        # PostgreSQL's default constraint name, as created by the earlier revisions
+        name = f'{table}_{column}_fkey'
+        op.drop_constraint(name, table, type_='foreignkey')
+        op.create_foreign_key(name, table, referent, [column], ['id'], ondelete=ondelete)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    _replace_foreign_keys('CASCADE')
+    # Every cascaded part option row looks up the rules referencing it
+    op.create_index(op.f('ix_compatibility_rules_trigger_option_id'), 'compatibility_rules', ['trigger_option_id'], unique=False)
+    op.create_index(op.f('ix_compatibility_rules_target_option_id'), 'compatibility_rules', ['target_option_id'], unique=False)
+    op.create_index(op.f('ix_pricing_rules_target_option_id'), 'pricing_rules', ['target_option_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_pricing_rules_target_option_id'), table_name='pricing_rules')
+    op.drop_index(op.f('ix_compatibility_rules_target_option_id'), table_name='compatibility_rules')
+    op.drop_index(op.f('ix_compatibility_rules_trigger_option_id'), table_name='compatibility_rules')
+    _replace_foreign_keys(None)
@@ -0,0 +1,55 @@
+"""Add carts and cart_items tables
+
+Revision ID: b71c3e9a0d52
+Revises: 8f2d6b0e4a17
+Create Date: 2025-05-06 14:22:31.904117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'b71c3e9a0d52'
+down_revision: Union[str, None] = '8f2d6b0e4a17'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('carts',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('token', sa.String(length=64), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_carts_id'), 'carts', ['id'], unique=False)
+    op.create_index(op.f('ix_carts_token'), 'carts', ['token'], unique=True)
+    op.create_table('cart_items',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('part_option_ids', postgresql.ARRAY(sa.Integer()), nullable=False),
+    sa.Column('configuration_hash', sa.String(length=64), nullable=False),
+    sa.Column('quantity', sa.Integer(), nullable=False),
+    sa.Column('cart_id', sa.Integer(), nullable=False),
+    sa.Column('product_type_id', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['cart_id'], ['carts.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['product_type_id'], ['product_types.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('cart_id', 'configuration_hash', name='uq_cart_items_cart_id_configuration_hash')
+    )
+    op.create_index(op.f('ix_cart_items_id'), 'cart_items', ['id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_cart_items_id'), table_name='cart_items')
+    op.drop_table('cart_items')
+    op.drop_index(op.f('ix_carts_token'), table_name='carts')
+    op.drop_index(op.f('ix_carts_id'), table_name='carts')
+    op.drop_table('carts')
@@ -0,0 +1,32 @@
+"""Add catalog_versions table
+
+Revision ID: d3f8a1c6e925
+Revises: a4c7e2f91d36
+Create Date: 2025-05-14 10:21:07.342815
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd3f8a1c6e925'
+down_revision: Union[str, None] = 'a4c7e2f91d36'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('catalog_versions',
+    sa.Column('table_name', sa.String(length=63), nullable=False),
+    sa.Column('version', sa.BigInteger(), nullable=False),
+    sa.PrimaryKeyConstraint('table_name')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('catalog_versions')
@@ -0,0 +1,60 @@
+"""Add part category and part option listing indexes
+
+Revision ID: e5a9c3f17b28
+Revises: b71c3e9a0d52
+Create Date: 2025-05-08 09:41:17.220964
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5a9c3f17b28'
+down_revision: Union[str, None] = 'b71c3e9a0d52'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Built concurrently so live catalogs keep taking writes; that cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_part_categories_product_type_id_display_order_id',
+            'part_categories',
+            ['product_type_id', 'display_order', 'id'],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_part_options_part_category_id_name_id',
+            'part_options',
+            ['part_category_id', 'name', 'id'],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_part_options_part_category_id_name_id_in_stock',
+            'part_options',
+            ['part_category_id', 'name', 'id'],
+            unique=False,
+            postgresql_where=sa.text('is_in_stock'),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_part_options_part_category_id_name_id_in_stock', table_name='part_options', postgresql_concurrently=True
+        )
+        op.drop_index('ix_part_options_part_category_id_name_id', table_name='part_options', postgresql_concurrently=True)
+        op.drop_index(
+            'ix_part_categories_product_type_id_display_order_id',
+            table_name='part_categories',
+            postgresql_concurrently=True,
+        )
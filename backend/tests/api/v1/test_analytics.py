@@ -0,0 +1,61 @@
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import crud, models
+from app.schemas import CompatibilityRuleCreate, PartCategoryCreate, PartOptionCreate
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_read_configuration_analytics(
+    client: AsyncClient, db: AsyncSession, admin_user_headers: dict, test_product_type: models.ProductType
+) -> None:
+    frame = await crud.create_part_category(
+        db=db, part_category_in=PartCategoryCreate(name="Frame", product_type_id=test_product_type.id, display_order=1)
+    )
+    wheels = await crud.create_part_category(
+        db=db, part_category_in=PartCategoryCreate(name="Wheels", product_type_id=test_product_type.id, display_order=2)
+    )
+    full_suspension, diamond = [
+        await crud.create_part_option(
+            db=db, part_option_in=PartOptionCreate(name=name, base_price=100, part_category_id=frame.id)
+        )
+        for name in ("Full-suspension", "Diamond")
+    ]
+    mountain, road, fat = [
+        await crud.create_part_option(
+            db=db,
+            part_option_in=PartOptionCreate(
+                name=name, base_price=50, part_category_id=wheels.id, is_in_stock=name != "Fat bike wheels"
+            ),
+        )
+        for name in ("Mountain wheels", "Road wheels", "Fat bike wheels")
+    ]
+    await crud.create_compatibility_rule(
+        db=db,
+        compatibility_rule_in=CompatibilityRuleCreate(
+            product_type_id=test_product_type.id,
+            trigger_option_id=mountain.id,
+            target_option_id=full_suspension.id,
+            rule_type="REQUIRES",
+        ),
+    )
+
+    response = await client.get(
+        f"/api/v1/admin/product-types/{test_product_type.id}/analytics", headers=admin_user_headers
+    )
+    assert response.status_code == 200
+    content = response.json()
+    assert content["total_configurations"] == 3
+    assert content["dead_options"] == [{"id": fat.id, "reason": "out_of_stock"}]
+    assert content["option_frequencies"] == {
+        str(full_suspension.id): 2,
+        str(diamond.id): 1,
+        str(mountain.id): 1,
+        str(road.id): 2,
+        str(fat.id): 0,
+    }
+
+    response = await client.get(f"/api/v1/admin/product-types/{test_product_type.id}/analytics")
+    assert response.status_code == 401
@@ -0,0 +1,133 @@
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import crud, models
+from app.schemas import PartCategoryCreate, PartOptionCreate, PartOptionUpdate, PricingRuleCreate
+
+pytestmark = pytest.mark.asyncio
+
+
+async def _create_frame_and_wheels(db: AsyncSession, product_type: models.ProductType):
+    frame = await crud.create_part_category(
+        db=db, part_category_in=PartCategoryCreate(name="Frame", product_type_id=product_type.id, display_order=1)
+    )
+    wheels = await crud.create_part_category(
+        db=db, part_category_in=PartCategoryCreate(name="Wheels", product_type_id=product_type.id, display_order=2)
+    )
+    diamond = await crud.create_part_option(
+        db=db, part_option_in=PartOptionCreate(name="Diamond", base_price=100, part_category_id=frame.id)
+    )
+    road_wheels = await crud.create_part_option(
+        db=db, part_option_in=PartOptionCreate(name="Road wheels", base_price=80, part_category_id=wheels.id)
+    )
+    return diamond, road_wheels
+
+
+async def test_add_same_configuration_bumps_quantity(
+    client: AsyncClient, db: AsyncSession, test_product_type: models.ProductType
+) -> None:
+    diamond, road_wheels = await _create_frame_and_wheels(db, test_product_type)
+    item = {"product_type_id": test_product_type.id, "selected_options": [road_wheels.id, diamond.id]}
+
+    response = await client.post("/api/v1/cart", json=item)
+    assert response.status_code == 201
+    token = response.json()["token"]
+    headers = {"X-Cart-Token": token}
+
+    # Same options in another order are the same configuration
+    response = await client.post(
+        "/api/v1/cart", json={**item, "selected_options": [diamond.id, road_wheels.id], "quantity": 2}, headers=headers
+    )
+    content = response.json()
+    assert len(content["items"]) == 1
+    assert content["items"][0]["selected_options"] == sorted([diamond.id, road_wheels.id])
+    assert content["items"][0]["quantity"] == 3
+    assert float(content["items"][0]["unit_price"]) == 180
+    assert float(content["total_price"]) == 540
+
+
+async def test_read_cart_reprices_items(
+    client: AsyncClient, db: AsyncSession, test_product_type: models.ProductType
+) -> None:
+    diamond, road_wheels = await _create_frame_and_wheels(db, test_product_type)
+    response = await client.post(
+        "/api/v1/cart",
+        json={"product_type_id": test_product_type.id, "selected_options": [diamond.id, road_wheels.id]},
+    )
+    headers = {"X-Cart-Token": response.json()["token"]}
+
+    await crud.update_part_option(db=db, db_obj=diamond, part_option_in=PartOptionUpdate(base_price=120, is_in_stock=False))
+    response = await client.get("/api/v1/cart", headers=headers)
+    assert response.status_code == 200
+    item = response.json()["items"][0]
+    assert float(item["line_price"]) == 200
+    assert item["is_available"] is False
+
+
+
+async def test_cart_applies_pricing_rules_and_flags_deleted_options(
+    client: AsyncClient, db: AsyncSession, test_product_type: models.ProductType
+) -> None:
+    diamond, road_wheels = await _create_frame_and_wheels(db, test_product_type)
+    # Road wheels cost 60 instead of 80 on the diamond frame
+    await crud.create_pricing_rule(
+        db=db,
+        pricing_rule_in=PricingRuleCreate(
+            product_type_id=test_product_type.id,
+            condition_options=[diamond.id],
+            target_option_id=road_wheels.id,
+            new_price=60,
+        ),
+    )
+    response = await client.post(
+        "/api/v1/cart",
+        json={"product_type_id": test_product_type.id, "selected_options": [diamond.id, road_wheels.id]},
+    )
+    assert response.status_code == 201
+    item = response.json()["items"][0]
+    assert float(item["unit_price"]) == 160
+    assert (item["is_available"], item["missing_options"]) == (True, [])
+    headers = {"X-Cart-Token": response.json()["token"]}
+
+    await crud.remove_part_option(db=db, part_option_id=road_wheels.id)
+    response = await client.get("/api/v1/cart", headers=headers)
+    assert response.status_code == 200
+    item = response.json()["items"][0]
+    assert float(item["unit_price"]) == 100
+    assert (item["is_available"], item["missing_options"]) == (False, [road_wheels.id])
+
+async def test_add_incomplete_configuration(
+    client: AsyncClient, db: AsyncSession, test_product_type: models.ProductType
+) -> None:
+    diamond, road_wheels = await _create_frame_and_wheels(db, test_product_type)
+    response = await client.post(
+        "/api/v1/cart", json={"product_type_id": test_product_type.id, "selected_options": [diamond.id]}
+    )
+    assert response.status_code == 400
+
+
+async def test_delete_cart_item_and_cart(
+    client: AsyncClient, db: AsyncSession, test_product_type: models.ProductType
+) -> None:
+    diamond, road_wheels = await _create_frame_and_wheels(db, test_product_type)
+    response = await client.post(
+        "/api/v1/cart",
+        json={"product_type_id": test_product_type.id, "selected_options": [diamond.id, road_wheels.id]},
+    )
+    content = response.json()
+    headers = {"X-Cart-Token": content["token"]}
+
+    response = await client.delete(f"/api/v1/cart/items/{content['items'][0]['id']}", headers=headers)
+    assert response.status_code == 200
+    assert response.json()["items"] == []
+
+    response = await client.delete("/api/v1/cart", headers=headers)
+    assert response.status_code == 204
+    response = await client.get("/api/v1/cart", headers=headers)
+    assert response.status_code == 404
+
+
+async def test_read_cart_without_token(client: AsyncClient) -> None:
+    response = await client.get("/api/v1/cart")
+    assert response.status_code == 404
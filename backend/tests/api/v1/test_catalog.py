@@ -0,0 +1,135 @@
+import json
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import crud
+from app.models import PartCategory, PartOption, ProductType
+from app.schemas import PartCategoryCreate, PartOptionCreate, ProductTypeCreate
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_import_catalog_csv(client: AsyncClient, db: AsyncSession, admin_user_headers: dict) -> None:
+    csv_file = (
+        "kind,name,description,product_type,part_category,display_order,base_price,is_in_stock\n"
+        "product_type,Imported Bike,From a spreadsheet,,,,,\n"
+        "part_category,Frame,,Imported Bike,,1,,\n"
+        "part_option,Diamond,,Imported Bike,Frame,,100.00,\n"
+        "part_option,Step-through,,Imported Bike,Frame,,90.00,false\n"
+        "part_option,Orphan,,Imported Bike,Wheels,,80.00,\n"
+        "part_option,No price,,Imported Bike,Frame,,,\n"
+    )
+    response = await client.post(
+        "/api/v1/admin/catalog/import",
+        content=csv_file.encode("utf-8"),
+        headers={**admin_user_headers, "Content-Type": "text/csv"},
+    )
+    assert response.status_code == 200
+    summary = response.json()
+    assert summary["inserted"] == 4
+    assert summary["rejected"] == 2
+    assert sorted(error["line"] for error in summary["errors"]) == [6, 7]
+
+    # Importing again updates changed rows only
+    ndjson_file = b'{"kind": "part_option", "name": "Diamond", "product_type": "Imported Bike", "part_category": "Frame", "base_price": 110}\n'
+    response = await client.post(
+        "/api/v1/admin/catalog/import?format=ndjson", content=ndjson_file, headers=admin_user_headers
+    )
+    assert response.status_code == 200
+    assert response.json()["updated"] == 1
+
+    product_types = await crud.get_product_types(db, limit=None)
+    product_type = next(pt for pt in product_types if pt.name == "Imported Bike")
+    options = await crud.get_part_options_by_product_type(db, product_type_id=product_type.id)
+    assert {option.name: float(option.base_price) for option in options} == {"Diamond": 110.0, "Step-through": 90.0}
+
+
+async def test_import_catalog_requires_format(client: AsyncClient, admin_user_headers: dict) -> None:
+    response = await client.post(
+        "/api/v1/admin/catalog/import", content=b"{}", headers={**admin_user_headers, "Content-Type": "application/json"}
+    )
+    assert response.status_code == 415
+
+
+async def test_export_catalog_ndjson(
+    client: AsyncClient, db: AsyncSession, admin_user_headers: dict, test_product_type
+) -> None:
+    part_category = await crud.create_part_category(
+        db=db, part_category_in=PartCategoryCreate(name="Export Frame", product_type_id=test_product_type.id)
+    )
+    part_option = await crud.create_part_option(
+        db=db,
+        part_option_in=PartOptionCreate(name="Export Diamond", base_price=100, part_category_id=part_category.id),
+    )
+
+    response = await client.get("/api/v1/admin/catalog/export", headers=admin_user_headers)
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    kinds = [line["kind"] for line in lines]
+    # Parents come first
+    assert kinds == sorted(kinds, key=["product_type", "part_category", "part_option"].index)
+    # Parents are referenced by name, never by database ID
+    assert {"kind": "part_option", "name": "Export Diamond", "base_price": "100.00", "is_in_stock": True,
+            "product_type": test_product_type.name, "part_category": "Export Frame"} in lines
+    assert not any("id" in line or "product_type_id" in line or "part_category_id" in line for line in lines)
+
+
+async def _catalog_contents(db: AsyncSession) -> tuple:
+    product_types = await db.execute(select(ProductType.name, ProductType.description))
+    part_categories = await db.execute(
+        select(ProductType.name, PartCategory.name, PartCategory.display_order).join(PartCategory.product_type)
+    )
+    part_options = await db.execute(
+        select(ProductType.name, PartCategory.name, PartOption.name, PartOption.base_price, PartOption.is_in_stock)
+        .join(PartOption.part_category)
+        .join(PartCategory.product_type)
+    )
+    return set(product_types.all()), set(part_categories.all()), set(part_options.all())
+
+
+async def test_export_then_import_into_empty_catalog_round_trips(
+    client: AsyncClient, db: AsyncSession, admin_user_headers: dict
+) -> None:
+    for name, description in [("Round-trip Bike", "Two wheels"), ("Round-trip Skis", None)]:
+        product_type = await crud.create_product_type(
+            db=db, product_type_in=ProductTypeCreate(name=name, description=description)
+        )
+        for display_order, category_name in enumerate(["Frame", "Finish"]):
+            part_category = await crud.create_part_category(
+                db=db,
+                part_category_in=PartCategoryCreate(
+                    name=category_name, display_order=display_order, product_type_id=product_type.id
+                ),
+            )
+            for option_name, base_price, is_in_stock in [("Basic", "10.50", True), ("Deluxe", "99", False)]:
+                await crud.create_part_option(
+                    db=db,
+                    part_option_in=PartOptionCreate(
+                        name=option_name,
+                        base_price=base_price,
+                        is_in_stock=is_in_stock,
+                        part_category_id=part_category.id,
+                    ),
+                )
+    exported_contents = await _catalog_contents(db)
+
+    response = await client.get("/api/v1/admin/catalog/export", headers=admin_user_headers)
+    assert response.status_code == 200
+    export = response.content
+
+    # Empty the catalog; the database IDs of the new rows will all differ
+    product_type_ids = (await db.scalars(select(ProductType.id))).all()
+    await crud.remove_product_types(db=db, product_type_ids=product_type_ids)
+    assert await _catalog_contents(db) == (set(), set(), set())
+
+    response = await client.post(
+        "/api/v1/admin/catalog/import?format=ndjson", content=export, headers=admin_user_headers
+    )
+    assert response.status_code == 200
+    summary = response.json()
+    assert (summary["rejected"], summary["inserted"]) == (0, len(export.splitlines()))
+    assert await _catalog_contents(db) == exported_contents
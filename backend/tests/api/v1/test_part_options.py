@@ -4,7 +4,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.crud import create_part_category
 from app import crud, models
-from app.schemas import PartCategoryCreate, PartOptionCreate, PartOptionUpdate
+from app.config import settings
+from app.schemas import PartCategoryCreate, PartOptionBulkUpdateItem, PartOptionCreate, PartOptionUpdate
 
 pytestmark = pytest.mark.asyncio
 
@@ -205,4 +206,221 @@ async def test_delete_part_option(
 
 async def test_delete_part_option_not_found(client: AsyncClient, admin_user_headers: dict) -> None:
     response = await client.delete("/api/v1/admin/part-options/99999", headers=admin_user_headers)
-    assert response.status_code == 404 
\ No newline at end of file
+    assert response.status_code == 404 
+
+async def test_read_part_options_not_modified(
+    client: AsyncClient, db: AsyncSession, admin_user_headers: dict, test_product_type: models.ProductType
+) -> None:
+    part_category_in = PartCategoryCreate(
+        name="Test Category for ETag", product_type_id=test_product_type.id
+    )
+    part_category = await create_part_category(db=db, part_category_in=part_category_in)
+    part_option_in = PartOptionCreate(
+        name="Cached Part Option",
+        part_category_id=part_category.id,
+        base_price=75.00,
+        is_in_stock=True,
+    )
+    part_option = await crud.create_part_option(db=db, part_option_in=part_option_in)
+    url = f"/api/v1/admin/part-options?part_category_id={part_category.id}"
+
+    response = await client.get(url, headers=admin_user_headers)
+    assert response.status_code == 200
+    etag = response.headers["ETag"]
+    assert response.headers["Cache-Control"] == "private, no-cache"
+    assert "Last-Modified" in response.headers
+
+    response = await client.get(url, headers={**admin_user_headers, "If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+
+    # Any part option write changes the ETag
+    await crud.update_part_option(db=db, db_obj=part_option, part_option_in=PartOptionUpdate(is_in_stock=False))
+    response = await client.get(url, headers={**admin_user_headers, "If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+
+
+async def test_read_part_options_cursor_pagination(
+    client: AsyncClient, db: AsyncSession, admin_user_headers: dict, test_product_type: models.ProductType
+) -> None:
+    part_category_in = PartCategoryCreate(
+        name="Test Category for Cursor", product_type_id=test_product_type.id
+    )
+    part_category = await create_part_category(db=db, part_category_in=part_category_in)
+    for name in ["Chain B", "Chain A", "Chain B", "Chain C"]:
+        await crud.create_part_option(
+            db=db,
+            part_option_in=PartOptionCreate(name=name, part_category_id=part_category.id, base_price=10.00),
+        )
+
+    url = f"/api/v1/admin/part-options?part_category_id={part_category.id}&limit=2"
+    seen = []
+    for _ in range(3):
+        response = await client.get(url, headers=admin_user_headers)
+        assert response.status_code == 200
+        seen.extend((item["name"], item["id"]) for item in response.json())
+        cursor = response.headers.get("X-Next-Cursor")
+        if cursor is None:
+            break
+        url = f"/api/v1/admin/part-options?part_category_id={part_category.id}&limit=2&cursor={cursor}"
+
+    # Every option exactly once, ordered by (name, id)
+    assert len(seen) == 4
+    assert seen == sorted(seen)
+
+    response = await client.get(
+        f"/api/v1/admin/part-options?part_category_id={part_category.id}&cursor=bogus", headers=admin_user_headers
+    )
+    assert response.status_code == 400
+
+
+async def test_read_part_options_in_stock_only(
+    client: AsyncClient, db: AsyncSession, admin_user_headers: dict, test_product_type: models.ProductType
+) -> None:
+    part_category_in = PartCategoryCreate(
+        name="Test Category for Stock Filter", product_type_id=test_product_type.id
+    )
+    part_category = await create_part_category(db=db, part_category_in=part_category_in)
+    for name, is_in_stock in [("Saddle A", True), ("Saddle B", False), ("Saddle C", True)]:
+        await crud.create_part_option(
+            db=db,
+            part_option_in=PartOptionCreate(
+                name=name, part_category_id=part_category.id, base_price=30.00, is_in_stock=is_in_stock
+            ),
+        )
+
+    url = f"/api/v1/admin/part-options?part_category_id={part_category.id}"
+    response = await client.get(f"{url}&in_stock_only=true", headers=admin_user_headers)
+    assert response.status_code == 200
+    assert [item["name"] for item in response.json()] == ["Saddle A", "Saddle C"]
+
+    response = await client.get(url, headers=admin_user_headers)
+    assert len(response.json()) == 3
+
+
+async def test_bulk_create_and_update_part_options(
+    client: AsyncClient, db: AsyncSession, admin_user_headers: dict, test_product_type: models.ProductType
+) -> None:
+    part_category_in = PartCategoryCreate(
+        name="Test Category for Bulk", product_type_id=test_product_type.id
+    )
+    part_category = await create_part_category(db=db, part_category_in=part_category_in)
+    rows = [
+        {"name": "Bulk Rim A", "part_category_id": part_category.id, "base_price": 20.00},
+        {"name": "Bulk Rim B", "part_category_id": 99999, "base_price": 25.00}, # Unknown category
+        {"name": "Bulk Rim C", "part_category_id": part_category.id, "base_price": 30.00, "is_in_stock": False},
+    ]
+    response = await client.post("/api/v1/admin/part-options/bulk", json=rows, headers=admin_user_headers)
+    assert response.status_code == 200
+    content = response.json()
+    assert [item["name"] for item in content["part_options"]] == ["Bulk Rim A", "Bulk Rim C"]
+    assert content["errors"] == [{"index": 1, "detail": "PartCategory with id 99999 not found."}]
+
+    rim_a, rim_c = content["part_options"]
+    updates = [
+        {"id": rim_a["id"], "base_price": 22.50},
+        {"id": 99999, "name": "Missing"},
+        {"id": rim_c["id"], "is_in_stock": True},
+    ]
+    response = await client.patch("/api/v1/admin/part-options/bulk", json=updates, headers=admin_user_headers)
+    assert response.status_code == 200
+    content = response.json()
+    assert [item["id"] for item in content["part_options"]] == [rim_a["id"], rim_c["id"]]
+    assert float(content["part_options"][0]["base_price"]) == 22.50
+    assert content["part_options"][1]["is_in_stock"] is True
+    assert [error["index"] for error in content["errors"]] == [1]
+
+
+
+async def test_bulk_update_reports_part_options_deleted_meanwhile(
+    db: AsyncSession, test_product_type: models.ProductType
+) -> None:
+    part_category_in = PartCategoryCreate(
+        name="Test Category for Bulk Race", product_type_id=test_product_type.id
+    )
+    part_category = await create_part_category(db=db, part_category_in=part_category_in)
+    kept, deleted = [
+        await crud.create_part_option(
+            db=db, part_option_in=PartOptionCreate(name=name, part_category_id=part_category.id, base_price=10.00)
+        )
+        for name in ("Race Stem A", "Race Stem B")
+    ]
+    # Deleted after the endpoint checked that it exists
+    await crud.remove_part_option(db=db, part_option_id=deleted.id)
+
+    updated, errors = await crud.update_part_options(
+        db=db,
+        part_options_in=[
+            PartOptionBulkUpdateItem(id=kept.id, base_price=12.00),
+            PartOptionBulkUpdateItem(id=deleted.id, base_price=14.00),
+        ],
+    )
+    assert [part_option.id for part_option in updated.values()] == [kept.id]
+    assert errors == {1: f"PartOption with id {deleted.id} not found."}
+
+async def test_bulk_stock_toggle_returns_changed_ids(
+    client: AsyncClient, db: AsyncSession, admin_user_headers: dict, test_product_type: models.ProductType
+) -> None:
+    part_category_in = PartCategoryCreate(
+        name="Test Category for Stock", product_type_id=test_product_type.id
+    )
+    part_category = await create_part_category(db=db, part_category_in=part_category_in)
+    options = []
+    for name, in_stock in [("Stock Chain A", True), ("Stock Chain B", False), ("Stock Chain C", True)]:
+        options.append(await crud.create_part_option(
+            db=db,
+            part_option_in=PartOptionCreate(
+                name=name, part_category_id=part_category.id, base_price=10.00, is_in_stock=in_stock
+            ),
+        ))
+
+    response = await client.patch(
+        "/api/v1/admin/part-options/stock",
+        json={"is_in_stock": False, "ids": [option.id for option in options]},
+        headers=admin_user_headers,
+    )
+    assert response.status_code == 200
+    # Option B was already out of stock
+    assert response.json() == {"is_in_stock": False, "changed_ids": sorted([options[0].id, options[2].id])}
+
+    response = await client.patch(
+        "/api/v1/admin/part-options/stock",
+        json={"is_in_stock": True, "part_category_id": part_category.id, "name_contains": "chain b"},
+        headers=admin_user_headers,
+    )
+    assert response.status_code == 200
+    assert response.json()["changed_ids"] == [options[1].id]
+
+    response = await client.patch(
+        "/api/v1/admin/part-options/stock", json={"is_in_stock": True}, headers=admin_user_headers
+    )
+    assert response.status_code == 400
+
+
+
+async def test_read_part_options_fast_json_is_byte_identical(
+    client: AsyncClient,
+    db: AsyncSession,
+    admin_user_headers: dict,
+    test_product_type: models.ProductType,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    part_category_in = PartCategoryCreate(name="Test Category for Fast JSON", product_type_id=test_product_type.id)
+    part_category = await create_part_category(db=db, part_category_in=part_category_in)
+    for name, base_price in [("Sprocket – 11T", "12.50"), ("Sprocket 13T", "14"), ("Sprocket 15T", "15.00")]:
+        await crud.create_part_option(
+            db=db,
+            part_option_in=PartOptionCreate(name=name, part_category_id=part_category.id, base_price=base_price),
+        )
+
+    url = f"/api/v1/admin/part-options?part_category_id={part_category.id}&limit=2"
+    expected = await client.get(url, headers=admin_user_headers)
+    monkeypatch.setattr(settings, "FAST_JSON_RESPONSES", True)
+    response = await client.get(url, headers=admin_user_headers)
+    assert response.status_code == 200
+    assert response.content == expected.content
+    # Headers set by the endpoint and its dependencies survive the fast path
+    assert "X-Next-Cursor" in response.headers
+    for header in ("ETag", "Last-Modified", "X-Next-Cursor"):
+        assert response.headers.get(header) == expected.headers.get(header)
@@ -0,0 +1,45 @@
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import crud, models
+from app.schemas import PartCategoryCreate, PartOptionCreate, PricingRuleCreate
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_read_pricing_rules_cursor_pagination(
+    client: AsyncClient, db: AsyncSession, admin_user_headers: dict, test_product_type: models.ProductType
+) -> None:
+    part_category = await crud.create_part_category(
+        db=db, part_category_in=PartCategoryCreate(name="Frame", product_type_id=test_product_type.id)
+    )
+    frame = await crud.create_part_option(
+        db=db, part_option_in=PartOptionCreate(name="Steel", part_category_id=part_category.id, base_price=50.00)
+    )
+    rule_ids = []
+    for new_price in (40, 45, 48):
+        rule = await crud.create_pricing_rule(
+            db=db,
+            pricing_rule_in=PricingRuleCreate(
+                product_type_id=test_product_type.id,
+                condition_options=[frame.id],
+                target_option_id=frame.id,
+                new_price=new_price,
+            ),
+        )
+        rule_ids.append(rule.id)
+
+    url = f"/api/v1/admin/rules/pricing?product_type_id={test_product_type.id}&limit=2"
+    response = await client.get(url, headers=admin_user_headers)
+    assert response.status_code == 200
+    assert [item["id"] for item in response.json()] == rule_ids[:2]
+    cursor = response.headers["X-Next-Cursor"]
+    assert response.headers["Link"].endswith('>; rel="next"')
+
+    response = await client.get(f"{url}&cursor={cursor}", headers=admin_user_headers)
+    assert [item["id"] for item in response.json()] == rule_ids[2:]
+    assert "X-Next-Cursor" not in response.headers
+
+    response = await client.get(f"{url}&cursor=bogus", headers=admin_user_headers)
+    assert response.status_code == 400
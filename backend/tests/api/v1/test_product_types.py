@@ -1,10 +1,19 @@
 import pytest
 from fastapi.testclient import TestClient
+from httpx import AsyncClient
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app import crud
-from app.models import ProductType, AdminUser # Import models
-from app.schemas import ProductTypeCreate, ProductTypeUpdate # Import schemas
+from app.models import ProductType, AdminUser, CompatibilityRule, PartCategory, PartOption # Import models
+from app.schemas import ( # Import schemas
+    CompatibilityRuleCreate,
+    PartCategoryCreate,
+    PartOptionCreate,
+    ProductTypeCreate,
+    ProductTypeUpdate,
+)
 from app.core.security import hash_password # For creating admin user
 
 # Helper from test_auth (or move to a shared conftest)
@@ -113,4 +122,57 @@ def test_delete_product_type_api(client: TestClient, test_product_type_id_db: in
 def test_delete_product_type_not_found(client: TestClient, test_admin_user: AdminUser):
     headers = get_admin_auth_headers(client, test_admin_user.username, test_admin_user.raw_password)
     response = client.delete(f"{ADMIN_ENDPOINT}/99999", headers=headers) # Non-existent ID
-    assert response.status_code == 404 
\ No newline at end of file
+    assert response.status_code == 404 
+
+@pytest.mark.asyncio
+async def test_delete_product_type_cascades_in_database(
+    client: AsyncClient, db: AsyncSession, admin_user_headers: dict, test_product_type: ProductType
+) -> None:
+    part_category = await crud.create_part_category(
+        db=db, part_category_in=PartCategoryCreate(name="Cascaded Frame", product_type_id=test_product_type.id)
+    )
+    part_options = [
+        await crud.create_part_option(
+            db=db, part_option_in=PartOptionCreate(name=name, base_price=100, part_category_id=part_category.id)
+        )
+        for name in ("Cascaded Diamond", "Cascaded Step-through")
+    ]
+    await crud.create_compatibility_rule(
+        db=db,
+        compatibility_rule_in=CompatibilityRuleCreate(
+            product_type_id=test_product_type.id,
+            trigger_option_id=part_options[0].id,
+            target_option_id=part_options[1].id,
+        ),
+    )
+
+    response = await client.delete(f"{ADMIN_ENDPOINT}/{test_product_type.id}", headers=admin_user_headers)
+    assert response.status_code == 200
+    assert response.json()["name"] == test_product_type.name
+
+    # Everything below the product type went with it, although the endpoint never loaded it
+    for model, column in (
+        (PartCategory, PartCategory.product_type_id),
+        (CompatibilityRule, CompatibilityRule.product_type_id),
+    ):
+        assert await db.scalar(select(func.count()).select_from(model).where(column == test_product_type.id)) == 0
+    remaining_options = select(func.count()).select_from(PartOption).where(PartOption.part_category_id == part_category.id)
+    assert await db.scalar(remaining_options) == 0
+
+    response = await client.delete(f"{ADMIN_ENDPOINT}/{test_product_type.id}", headers=admin_user_headers)
+    assert response.status_code == 404
+
+@pytest.mark.asyncio
+async def test_bulk_delete_product_types(client: AsyncClient, db: AsyncSession, admin_user_headers: dict) -> None:
+    product_types = [
+        await crud.create_product_type(db=db, product_type_in=ProductTypeCreate(name=name))
+        for name in ("Bulk Deleted Bike A", "Bulk Deleted Bike B")
+    ]
+    ids = [product_type.id for product_type in product_types]
+
+    response = await client.post(
+        f"{ADMIN_ENDPOINT}/bulk-delete", headers=admin_user_headers, json={"ids": [*ids, 99999]}
+    )
+    assert response.status_code == 200
+    assert response.json() == {"deleted_ids": sorted(ids)}
+    assert await db.scalar(select(func.count()).select_from(ProductType).where(ProductType.id.in_(ids))) == 0
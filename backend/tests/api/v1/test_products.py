@@ -0,0 +1,236 @@
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import crud, models
+from app.core.catalog_cache import evaluation_cache
+from app.schemas import (
+    PartCategoryCreate,
+    PartOptionCreate,
+    PartOptionUpdate,
+    CompatibilityRuleCreate,
+    PricingRuleCreate,
+)
+
+pytestmark = pytest.mark.asyncio
+
+
+async def _create_frame_and_wheels(db: AsyncSession, product_type: models.ProductType):
+    frame = await crud.create_part_category(
+        db=db, part_category_in=PartCategoryCreate(name="Frame", product_type_id=product_type.id, display_order=1)
+    )
+    wheels = await crud.create_part_category(
+        db=db, part_category_in=PartCategoryCreate(name="Wheels", product_type_id=product_type.id, display_order=2)
+    )
+    full_suspension = await crud.create_part_option(
+        db=db, part_option_in=PartOptionCreate(name="Full-suspension", base_price=130, part_category_id=frame.id)
+    )
+    diamond = await crud.create_part_option(
+        db=db, part_option_in=PartOptionCreate(name="Diamond", base_price=100, part_category_id=frame.id)
+    )
+    road_wheels = await crud.create_part_option(
+        db=db, part_option_in=PartOptionCreate(name="Road wheels", base_price=80, part_category_id=wheels.id)
+    )
+    fat_wheels = await crud.create_part_option(
+        db=db,
+        part_option_in=PartOptionCreate(
+            name="Fat bike wheels", base_price=90, part_category_id=wheels.id, is_in_stock=False
+        ),
+    )
+    return frame, wheels, full_suspension, diamond, road_wheels, fat_wheels
+
+
+async def test_read_product_configuration(
+    client: AsyncClient, db: AsyncSession, test_product_type: models.ProductType
+) -> None:
+    frame, wheels, full_suspension, diamond, road_wheels, fat_wheels = await _create_frame_and_wheels(
+        db, test_product_type
+    )
+    response = await client.get(f"/api/v1/products/{test_product_type.id}/configuration")
+    assert response.status_code == 200
+    content = response.json()
+    assert content["product_type"]["id"] == test_product_type.id
+    assert [category["id"] for category in content["categories"]] == [frame.id, wheels.id]
+    assert [option["id"] for option in content["categories"][0]["options"]] == [diamond.id, full_suspension.id]
+
+    # A write bumps the catalog version, so the cached tree is rebuilt
+    await crud.update_part_option(db=db, db_obj=diamond, part_option_in=PartOptionUpdate(is_in_stock=False))
+    response = await client.get(f"/api/v1/products/{test_product_type.id}/configuration")
+    assert response.json()["categories"][0]["options"][0]["is_in_stock"] is False
+
+
+async def test_evaluate_configuration(
+    client: AsyncClient, db: AsyncSession, test_product_type: models.ProductType
+) -> None:
+    frame, wheels, full_suspension, diamond, road_wheels, fat_wheels = await _create_frame_and_wheels(
+        db, test_product_type
+    )
+    await crud.create_compatibility_rule(
+        db=db,
+        compatibility_rule_in=CompatibilityRuleCreate(
+            product_type_id=test_product_type.id,
+            trigger_option_id=road_wheels.id,
+            target_option_id=full_suspension.id,
+            rule_type="EXCLUDES",
+        ),
+    )
+
+    response = await client.post(
+        f"/api/v1/products/{test_product_type.id}/evaluate",
+        json={"selected_options": [full_suspension.id]},
+    )
+    assert response.status_code == 200
+    content = response.json()
+    assert content["product_type_id"] == test_product_type.id
+    assert content["configuration"][str(frame.id)]["available_options"] == [diamond.id, full_suspension.id]
+    assert content["configuration"][str(wheels.id)]["available_options"] == []
+    assert content["configuration"][str(wheels.id)]["disabled_options"] == [
+        {"id": fat_wheels.id, "reason": "out_of_stock"},
+        {"id": road_wheels.id, "reason": "incompatible"},
+    ]
+
+
+async def test_evaluate_configuration_applies_pricing_rules(
+    client: AsyncClient, db: AsyncSession, test_product_type: models.ProductType
+) -> None:
+    frame, wheels, full_suspension, diamond, road_wheels, fat_wheels = await _create_frame_and_wheels(
+        db, test_product_type
+    )
+    pricing_rule = await crud.create_pricing_rule(
+        db=db,
+        pricing_rule_in=PricingRuleCreate(
+            product_type_id=test_product_type.id,
+            condition_options=[full_suspension.id],
+            target_option_id=road_wheels.id,
+            new_price=95,
+        ),
+    )
+
+    response = await client.post(
+        f"/api/v1/products/{test_product_type.id}/evaluate",
+        json={"selected_options": [road_wheels.id, full_suspension.id]},
+    )
+    assert response.status_code == 200
+    content = response.json()
+    assert float(content["base_price"]) == 210.0
+    assert float(content["total_price"]) == 225.0
+    lines = content["price_breakdown"]
+    assert [line["part_option_id"] for line in lines] == [full_suspension.id, road_wheels.id]
+    assert lines[1]["pricing_rule_id"] == pricing_rule.id
+    assert float(lines[1]["price"]) == 95.0
+
+
+async def test_evaluate_configuration_is_cached_until_catalog_changes(
+    client: AsyncClient, db: AsyncSession, test_product_type: models.ProductType
+) -> None:
+    frame, wheels, full_suspension, diamond, road_wheels, fat_wheels = await _create_frame_and_wheels(
+        db, test_product_type
+    )
+    url = f"/api/v1/products/{test_product_type.id}/evaluate"
+    response = await client.post(url, json={"selected_options": [diamond.id, road_wheels.id]})
+    assert float(response.json()["base_price"]) == 180.0
+
+    # The same set of options in another order is served from the cache
+    hits = evaluation_cache.hits
+    response = await client.post(url, json={"selected_options": [road_wheels.id, diamond.id]})
+    assert evaluation_cache.hits == hits + 1
+    assert response.json()["selected_options"] == [road_wheels.id, diamond.id]
+
+    # A part option write bumps the catalog version and invalidates the result
+    await crud.update_part_option(db=db, db_obj=diamond, part_option_in=PartOptionUpdate(base_price=110))
+    response = await client.post(url, json={"selected_options": [road_wheels.id, diamond.id]})
+    assert evaluation_cache.hits == hits + 1
+    assert float(response.json()["base_price"]) == 190.0
+
+
+async def test_evaluate_configuration_rejects_foreign_option(
+    client: AsyncClient, db: AsyncSession, test_product_type: models.ProductType
+) -> None:
+    await _create_frame_and_wheels(db, test_product_type)
+    response = await client.post(
+        f"/api/v1/products/{test_product_type.id}/evaluate",
+        json={"selected_options": [99999]},
+    )
+    assert response.status_code == 400
+
+
+async def test_evaluate_configuration_product_type_not_found(client: AsyncClient) -> None:
+    response = await client.post("/api/v1/products/99999/evaluate", json={"selected_options": []})
+    assert response.status_code == 404
+
+
+async def test_complete_configuration(
+    client: AsyncClient, db: AsyncSession, test_product_type: models.ProductType
+) -> None:
+    frame, wheels, full_suspension, diamond, road_wheels, fat_wheels = await _create_frame_and_wheels(
+        db, test_product_type
+    )
+    url = f"/api/v1/products/{test_product_type.id}/complete"
+
+    response = await client.post(url, json={"selected_options": []})
+    assert response.status_code == 200
+    content = response.json()
+    assert content["objective"] == "cheapest"
+    assert content["selected_options"] == [diamond.id, road_wheels.id]
+    assert float(content["base_price"]) == 180
+
+    # Fat bike wheels are dearer, but out of stock
+    response = await client.post(url, json={"selected_options": [], "objective": "most_expensive"})
+    assert response.json()["selected_options"] == [full_suspension.id, road_wheels.id]
+
+    response = await client.post(url, json={"selected_options": [fat_wheels.id]})
+    assert response.status_code == 409
+    response = await client.post(url, json={"selected_options": [diamond.id, full_suspension.id]})
+    assert response.status_code == 400
+
+
+async def test_change_selection(
+    client: AsyncClient, db: AsyncSession, test_product_type: models.ProductType
+) -> None:
+    frame, wheels, full_suspension, diamond, road_wheels, fat_wheels = await _create_frame_and_wheels(
+        db, test_product_type
+    )
+    await crud.create_compatibility_rule(
+        db=db,
+        compatibility_rule_in=CompatibilityRuleCreate(
+            product_type_id=test_product_type.id,
+            trigger_option_id=road_wheels.id,
+            target_option_id=full_suspension.id,
+            rule_type="EXCLUDES",
+        ),
+    )
+    url = f"/api/v1/products/{test_product_type.id}/selection"
+    response = await client.post(url, json={"selected_options": [diamond.id]})
+    assert response.status_code == 200
+    content = response.json()
+    assert set(content["configuration"]) == {str(frame.id), str(wheels.id)}
+
+    # Picking the road wheels only changes what the frame category offers
+    response = await client.patch(
+        url, json={"token": content["token"], "category_id": wheels.id, "new_option_id": road_wheels.id}
+    )
+    assert response.status_code == 200
+    content = response.json()
+    assert content["selected_options"] == [diamond.id, road_wheels.id]
+    assert set(content["configuration"]) == {str(frame.id)}
+    assert content["configuration"][str(frame.id)]["disabled_options"] == [
+        {"id": full_suspension.id, "reason": "incompatible"}
+    ]
+    assert float(content["total_price"]) == 180.0
+
+    # Clearing the frame leaves the wheels' availability as it was
+    response = await client.patch(url, json={"token": content["token"], "category_id": frame.id})
+    assert response.json()["selected_options"] == [road_wheels.id]
+    assert response.json()["configuration"] == {}
+
+    # After a catalog write every category is re-sent
+    token = response.json()["token"]
+    await crud.update_part_option(db=db, db_obj=diamond, part_option_in=PartOptionUpdate(base_price=110))
+    response = await client.patch(url, json={"token": token, "category_id": frame.id, "new_option_id": diamond.id})
+    assert set(response.json()["configuration"]) == {str(frame.id), str(wheels.id)}
+    assert float(response.json()["base_price"]) == 190.0
+
+    response = await client.patch(url, json={"token": token + "x", "category_id": frame.id})
+    assert response.status_code == 400
+    response = await client.patch(url, json={"token": token, "category_id": frame.id, "new_option_id": road_wheels.id})
+    assert response.status_code == 400
@@ -0,0 +1,45 @@
+import json
+import pytest
+from decimal import Decimal
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import crud, models
+from app.core.change_feed import RESYNC_EVENT, part_option_feed
+from app.schemas import PartCategoryCreate, PartOptionCreate, PartOptionUpdate
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_part_option_writes_are_published(db: AsyncSession, test_product_type: models.ProductType) -> None:
+    frame = await crud.create_part_category(
+        db=db, part_category_in=PartCategoryCreate(name="Frame", product_type_id=test_product_type.id, display_order=1)
+    )
+    subscription = part_option_feed.subscribe(test_product_type.id)
+    try:
+        diamond = await crud.create_part_option(
+            db=db, part_option_in=PartOptionCreate(name="Diamond", base_price=100, part_category_id=frame.id)
+        )
+        await crud.update_part_option(db=db, db_obj=diamond, part_option_in=PartOptionUpdate(base_price=110))
+        await crud.set_part_options_stock(db=db, is_in_stock=False, part_option_ids=[diamond.id])
+        # The three writes coalesce into the latest state of the option
+        [(name, data)] = subscription.drain()
+        assert name == "part_option"
+        assert json.loads(data)["id"] == diamond.id
+        assert Decimal(json.loads(data)["base_price"]) == 110
+        assert json.loads(data)["is_in_stock"] is False
+
+        await crud.remove_part_option(db=db, part_option_id=diamond.id)
+        assert subscription.drain() == [
+            ("part_option_deleted", json.dumps({"id": diamond.id, "part_category_id": frame.id}))
+        ]
+
+        await crud.remove_part_category(db=db, part_category_id=frame.id)
+        assert subscription.drain() == [RESYNC_EVENT]
+    finally:
+        part_option_feed.unsubscribe(test_product_type.id, subscription)
+
+
+async def test_stream_product_type_not_found(client: AsyncClient) -> None:
+    response = await client.get("/api/v1/stream/product-types/99999")
+    assert response.status_code == 404
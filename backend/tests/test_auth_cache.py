@@ -0,0 +1,44 @@
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from app.core.auth_cache import ExpiringLRUCache, cache_claims, claims_cache, get_cached_claims, token_digest
+
+def test_entries_expire_at_their_deadline():
+    cache = ExpiringLRUCache(maxsize=4)
+    cache.put("fresh", 1, time.monotonic() + 60)
+    cache.put("stale", 2, time.monotonic() - 1)
+    assert cache.get("fresh") == 1
+    assert cache.get("stale") is None
+    assert len(cache) == 1
+    assert cache.stats() == {"size": 1, "maxsize": 4, "hits": 1, "misses": 1, "hit_ratio": 0.5}
+
+def test_least_recently_used_entry_is_evicted():
+    cache = ExpiringLRUCache(maxsize=2)
+    deadline = time.monotonic() + 60
+    cache.put("a", 1, deadline)
+    cache.put("b", 2, deadline)
+    cache.get("a")
+    cache.put("c", 3, deadline)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1 and cache.get("c") == 3
+
+def test_discard_where_drops_every_entry_of_a_user():
+    cache = ExpiringLRUCache(maxsize=8)
+    deadline = time.monotonic() + 60
+    alice, bob = SimpleNamespace(id=1), SimpleNamespace(id=2)
+    cache.put(("alice", token_digest("t1")), alice, deadline)
+    cache.put(("alice", token_digest("t2")), alice, deadline)
+    cache.put(("bob", token_digest("t3")), bob, deadline)
+    assert cache.discard_where(lambda user: user.id == alice.id) == 2
+    assert cache.get(("bob", token_digest("t3"))) is bob
+
+def test_claims_are_cached_until_the_token_expires():
+    claims_cache.clear()
+    cache_claims("valid", {"sub": "alice", "exp": time.time() + 60})
+    cache_claims("expired", {"sub": "bob", "exp": time.time() - 1})
+    cache_claims("no-exp", {"sub": "carol"})
+    assert get_cached_claims("valid") == {"sub": "alice", "exp": pytest.approx(time.time() + 60, abs=5)}
+    assert get_cached_claims("expired") is None
+    assert get_cached_claims("no-exp") is None
@@ -0,0 +1,75 @@
+import pytest
+from decimal import Decimal
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import crud, models
+from app.api.deps import fetch_catalog_snapshot
+from app.core.catalog_cache import CatalogVersion, VersionedLRUCache, catalog_cache
+
+@pytest.mark.asyncio
+async def test_catalog_version_is_monotonic_and_per_table(db):
+    version = CatalogVersion()
+    first = await version.read(db)
+    bumped = await version.bump(db, models.PartOption.__tablename__)
+    assert bumped > first.current
+    # The bump also drops the versions this session had read
+    second = await version.read(db)
+    assert second.current == second.table(models.PartOption.__tablename__) == bumped
+    assert second.table(models.ProductType.__tablename__) == first.table(models.ProductType.__tablename__)
+    assert await version.read(db) is second
+
+@pytest.mark.asyncio
+async def test_catalog_version_is_shared_by_sessions_and_rolled_back_with_the_write(db):
+    version = CatalogVersion()
+    async with AsyncSession(db.bind) as writer:
+        await version.bump(writer, models.PricingRule.__tablename__)
+        await writer.rollback()
+        assert (await version.read(writer)).current == (await version.read(db)).current
+        bumped = await version.bump(writer, models.PricingRule.__tablename__)
+        await writer.commit()
+    async with AsyncSession(db.bind) as reader:
+        assert (await version.read(reader)).current == bumped
+
+def test_entry_is_served_only_for_its_version():
+    cache = VersionedLRUCache(maxsize=2)
+    cache.put(1, "snapshot", version=5)
+    assert cache.get(1, version=5) == "snapshot"
+    assert cache.get(1, version=6) is None
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+def test_least_recently_used_entry_is_evicted():
+    cache = VersionedLRUCache(maxsize=2)
+    cache.put(1, "a", version=0)
+    cache.put(2, "b", version=0)
+    cache.get(1, version=0) # 2 is now the least recently used
+    cache.put(3, "c", version=0)
+    assert len(cache) == 2
+    assert cache.get(2, version=0) is None
+    assert cache.get(1, version=0) == "a"
+    assert cache.get(3, version=0) == "c"
+
+@pytest.mark.asyncio
+async def test_snapshot_skips_options_committed_with_a_newer_category(monkeypatch):
+    # The category query ran before "Wheels" and its option were committed; the option query after
+    async def get_product_type(db, product_type_id):
+        return models.ProductType(id=product_type_id, name="Bike")
+
+    async def get_part_categories_by_product_type(db, product_type_id, limit):
+        return [models.PartCategory(id=1, name="Frame", display_order=1, product_type_id=product_type_id)]
+
+    async def get_part_options_by_product_type(db, product_type_id):
+        return [
+            models.PartOption(id=1, name="Diamond", base_price=Decimal("100"), is_in_stock=True, part_category_id=1),
+            models.PartOption(id=2, name="Road", base_price=Decimal("80"), is_in_stock=True, part_category_id=2),
+        ]
+
+    monkeypatch.setattr(crud, "get_product_type", get_product_type)
+    monkeypatch.setattr(crud, "get_part_categories_by_product_type", get_part_categories_by_product_type)
+    monkeypatch.setattr(crud, "get_part_options_by_product_type", get_part_options_by_product_type)
+    monkeypatch.setattr(catalog_cache, "get", lambda key, version: None)
+    monkeypatch.setattr(catalog_cache, "put", lambda key, value, version: None)
+
+    snapshot = await fetch_catalog_snapshot(None, 1, version=0)
+    assert [category.id for category in snapshot.categories] == [1]
+    assert [option.id for option in snapshot.categories[0].options] == [1]
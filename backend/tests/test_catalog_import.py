@@ -0,0 +1,51 @@
+import asyncio
+
+from app.catalog_io import format_from_content_type, iter_rows
+
+async def _chunks(data: bytes, size: int = 5):
+    for start in range(0, len(data), size):
+        yield data[start:start + size]
+
+def _parse(data: bytes, file_format: str):
+    async def collect():
+        return [parsed async for parsed in iter_rows(_chunks(data), file_format)]
+    return asyncio.run(collect())
+
+def test_csv_rows_are_parsed_across_chunks():
+    data = (
+        "﻿kind,name,description,product_type,part_category,base_price,is_in_stock\r\n"
+        'product_type,Bicycle,"Two wheels,\nfully ""custom"""\r\n'
+        "part_category,Frame,,Bicycle\r\n"
+        "part_option,Diamond,,Bicycle,Frame,100.00,false\r\n"
+    ).encode("utf-8")
+    parsed = _parse(data, "csv")
+    assert [row.line for row in parsed] == [2, 4, 5]
+    assert all(row.error is None for row in parsed)
+    assert parsed[0].row.description == 'Two wheels,\nfully "custom"'
+    assert parsed[1].row.product_type == "Bicycle"
+    # Empty cells are missing fields, so defaults apply and are not marked as set
+    assert parsed[1].row.display_order == 0
+    assert "display_order" not in parsed[1].row.model_fields_set
+    assert parsed[2].row.is_in_stock is False
+
+def test_invalid_rows_are_rejected_individually():
+    data = b"\n".join([
+        b'{"kind": "product_type", "name": "Bicycle"}',
+        b"not json",
+        b'{"kind": "part_option", "name": "Diamond", "base_price": "abc", "part_category_id": 1}',
+        b'{"kind": "part_option", "name": "Diamond", "base_price": 100}',
+        b'{"kind": "widget", "name": "x"}',
+        b'{"kind": "part_category", "name": "Frame", "product_type_id": 1}',
+    ])
+    parsed = _parse(data, "ndjson")
+    assert [(row.line, row.row is not None) for row in parsed] == [
+        (1, True), (2, False), (3, False), (4, False), (5, False), (6, True),
+    ]
+    assert "base_price" in parsed[2].error
+    assert "part_category_id" in parsed[3].error
+
+def test_format_from_content_type():
+    assert format_from_content_type("text/csv; charset=utf-8") == "csv"
+    assert format_from_content_type("application/x-ndjson") == "ndjson"
+    assert format_from_content_type("application/json") is None
+    assert format_from_content_type(None) is None
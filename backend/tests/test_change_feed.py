@@ -0,0 +1,49 @@
+import asyncio
+import pytest
+
+from app.api.v1.endpoints import stream
+from app.core.change_feed import RESYNC_EVENT, ChangeFeed
+
+def test_rapid_updates_to_one_row_are_coalesced():
+    feed = ChangeFeed(max_pending=10)
+    subscription = feed.subscribe(1)
+    feed.publish(1, 7, ("part_option", '{"base_price":"10"}'))
+    feed.publish(1, 8, ("part_option", '{"base_price":"20"}'))
+    feed.publish(1, 7, ("part_option", '{"base_price":"11"}'))
+    feed.publish(2, 9, ("part_option", "{}")) # Another product type
+    assert subscription.drain() == [("part_option", '{"base_price":"11"}'), ("part_option", '{"base_price":"20"}')]
+    assert subscription.drain() == []
+
+def test_subscriber_that_falls_behind_is_told_to_resync():
+    feed = ChangeFeed(max_pending=2)
+    subscription = feed.subscribe(1)
+    for key in range(3):
+        feed.publish(1, key, ("part_option", str(key)))
+    assert subscription.drain() == [RESYNC_EVENT, ("part_option", "2")]
+
+def test_unsubscribe_forgets_empty_topics():
+    feed = ChangeFeed(max_pending=2)
+    subscription = feed.subscribe(1)
+    assert feed.has_subscribers
+    feed.unsubscribe(1, subscription)
+    assert not feed.has_subscribers
+    feed.publish(1, 7, ("part_option", "{}"))
+    assert subscription.drain() == []
+
+@pytest.mark.asyncio
+async def test_event_stream_sends_heartbeats_and_coalesced_frames(monkeypatch):
+    monkeypatch.setattr(stream.settings, "STREAM_HEARTBEAT_SECONDS", 0.05)
+    monkeypatch.setattr(stream.settings, "STREAM_COALESCE_SECONDS", 0.05)
+    monkeypatch.setattr(stream, "part_option_feed", ChangeFeed(max_pending=10))
+    events = stream.part_option_events(1)
+    assert await events.__anext__() == ": connected\n\n"
+    assert await events.__anext__() == ": heartbeat\n\n"
+
+    frame = asyncio.ensure_future(events.__anext__())
+    await asyncio.sleep(0)
+    stream.part_option_feed.publish(1, 7, ("part_option", '{"id":7,"is_in_stock":false}'))
+    stream.part_option_feed.publish(1, 7, ("part_option", '{"id":7,"is_in_stock":true}'))
+    assert await frame == 'event: part_option\ndata: {"id":7,"is_in_stock":true}\n\n'
+
+    await events.aclose()
+    assert not stream.part_option_feed.has_subscribers
@@ -0,0 +1,115 @@
+import pytest
+from decimal import Decimal
+
+from app.models import PartCategory, PartOption, CompatibilityRule
+from app.rule_engine import InvalidSelectionError, RuleEngine, compile_compatibility
+
+# Frame (1: Full-suspension, 2: Diamond), Wheels (3: Mountain, 4: Road, 5: Fat bike),
+# Rim color (6: Red, 7: Black, out of stock)
+CATEGORIES = [
+    PartCategory(id=10, name="Frame", display_order=1, product_type_id=1),
+    PartCategory(id=20, name="Wheels", display_order=2, product_type_id=1),
+    PartCategory(id=30, name="Rim color", display_order=3, product_type_id=1),
+]
+OPTIONS = [
+    PartOption(id=1, name="Full-suspension", base_price=Decimal("130"), is_in_stock=True, part_category_id=10),
+    PartOption(id=2, name="Diamond", base_price=Decimal("100"), is_in_stock=True, part_category_id=10),
+    PartOption(id=3, name="Mountain wheels", base_price=Decimal("50"), is_in_stock=True, part_category_id=20),
+    PartOption(id=4, name="Road wheels", base_price=Decimal("80"), is_in_stock=True, part_category_id=20),
+    PartOption(id=5, name="Fat bike wheels", base_price=Decimal("90"), is_in_stock=True, part_category_id=20),
+    PartOption(id=6, name="Red", base_price=Decimal("20"), is_in_stock=True, part_category_id=30),
+    PartOption(id=7, name="Black", base_price=Decimal("15"), is_in_stock=False, part_category_id=30),
+]
+RULES = [
+    # Mountain wheels are only available with the full-suspension frame
+    CompatibilityRule(id=1, product_type_id=1, trigger_option_id=3, target_option_id=1, rule_type="REQUIRES"),
+    # Fat bike wheels do not come with a red rim
+    CompatibilityRule(id=2, product_type_id=1, trigger_option_id=5, target_option_id=6, rule_type="EXCLUDES"),
+]
+
+@pytest.fixture
+def compiled():
+    return compile_compatibility(CATEGORIES, OPTIONS, RULES)
+
+def _by_category(evaluation):
+    return {category.category_id: category for category in evaluation}
+
+def test_empty_selection_only_disables_out_of_stock(compiled):
+    categories = _by_category(compiled.evaluate([]))
+    assert list(categories) == [10, 20, 30]
+    # Options are listed by name within a category
+    assert categories[10].available_options == [2, 1]
+    assert categories[20].available_options == [5, 3, 4]
+    assert categories[30].available_options == [6]
+    assert categories[30].disabled_options == [(7, "out_of_stock")]
+
+def test_excludes_rule_is_symmetric(compiled):
+    categories = _by_category(compiled.evaluate([5]))
+    assert (6, "incompatible") in categories[30].disabled_options
+
+    categories = _by_category(compiled.evaluate([6]))
+    assert categories[20].available_options == [3, 4]
+    assert categories[20].disabled_options == [(5, "incompatible")]
+
+def test_requires_rule_excludes_siblings_of_target(compiled):
+    categories = _by_category(compiled.evaluate([3]))
+    assert categories[10].available_options == [1]
+    assert categories[10].disabled_options == [(2, "incompatible")]
+
+    categories = _by_category(compiled.evaluate([2]))
+    assert categories[20].disabled_options == [(3, "incompatible")]
+
+def test_selection_does_not_block_its_own_category(compiled):
+    categories = _by_category(compiled.evaluate([2, 4]))
+    # Switching the wheels is still allowed, except to the ones needing full-suspension
+    assert categories[20].available_options == [5, 4]
+    # Switching the frame is still allowed: nothing selected elsewhere blocks it
+    assert categories[10].available_options == [2, 1]
+
+def test_unknown_option_is_rejected(compiled):
+    with pytest.raises(InvalidSelectionError):
+        compiled.evaluate([999])
+
+def test_two_options_in_one_category_are_rejected(compiled):
+    with pytest.raises(InvalidSelectionError):
+        compiled.evaluate([1, 2])
+
+def test_rule_engine_serves_compiled_rules_for_current_version_only():
+    engine = RuleEngine(maxsize=4)
+    compiled = engine.compile(1, CATEGORIES, OPTIONS, RULES, [], version=3)
+    assert engine.get(1, version=3) is compiled
+    # Any catalog write bumps the version and retires the compiled rules
+    assert engine.get(1, version=4) is None
+
+def test_check_configuration(compiled):
+    compiled.check_configuration([1, 3, 6])
+    with pytest.raises(InvalidSelectionError, match="must be selected"):
+        compiled.check_configuration([1, 3])
+    with pytest.raises(InvalidSelectionError, match="cannot be combined"):
+        compiled.check_configuration([2, 3, 6])
+    with pytest.raises(InvalidSelectionError, match="out of stock"):
+        compiled.check_configuration([1, 4, 7])
+
+def test_evaluate_change_returns_only_affected_categories(compiled):
+    # Switching the wheels from road to mountain blocks the diamond frame
+    selected, changed = compiled.evaluate_change([2, 4], 20, 3)
+    assert selected == [2, 3]
+    assert [category.category_id for category in changed] == [10]
+    assert changed[0].disabled_options == [(2, "incompatible")]
+
+    # Switching to fat bike wheels unblocks the frame and blocks the red rim
+    selected, changed = compiled.evaluate_change([1, 3], 20, 5)
+    assert selected == [1, 5]
+    assert [category.category_id for category in changed] == [10, 30]
+    full = _by_category(compiled.evaluate([1, 5]))
+    assert changed == [full[10], full[30]]
+
+    # Clearing a category; a change that blocks nothing new re-evaluates nothing
+    assert compiled.evaluate_change([1, 5], 20, None) == ([1], [_by_category(compiled.evaluate([1]))[30]])
+    assert compiled.evaluate_change([1], 30, 7) == ([1, 7], [])
+
+def test_evaluate_change_rejects_foreign_category_or_option(compiled):
+    with pytest.raises(InvalidSelectionError):
+        compiled.evaluate_change([1], 99, None)
+    with pytest.raises(InvalidSelectionError):
+        compiled.evaluate_change([1], 20, 6)
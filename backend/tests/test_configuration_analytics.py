@@ -0,0 +1,108 @@
+import itertools
+from decimal import Decimal
+
+import pytest
+
+from app.config import settings
+from app.models import PartCategory, PartOption, CompatibilityRule
+from app.rule_engine import AnalysisTooComplexError, RuleEngine, analyze_configurations, compile_compatibility
+from app.rule_engine import registry
+
+# Frame (1: Full-suspension, 2: Diamond), Wheels (3: Mountain, 4: Road, 5: Fat bike),
+# Rim color (6: Red, 7: Black, out of stock)
+CATEGORIES = [
+    PartCategory(id=10, name="Frame", display_order=1, product_type_id=1),
+    PartCategory(id=20, name="Wheels", display_order=2, product_type_id=1),
+    PartCategory(id=30, name="Rim color", display_order=3, product_type_id=1),
+]
+OPTIONS = [
+    PartOption(id=1, name="Full-suspension", base_price=Decimal("130"), is_in_stock=True, part_category_id=10),
+    PartOption(id=2, name="Diamond", base_price=Decimal("100"), is_in_stock=True, part_category_id=10),
+    PartOption(id=3, name="Mountain wheels", base_price=Decimal("50"), is_in_stock=True, part_category_id=20),
+    PartOption(id=4, name="Road wheels", base_price=Decimal("80"), is_in_stock=True, part_category_id=20),
+    PartOption(id=5, name="Fat bike wheels", base_price=Decimal("90"), is_in_stock=True, part_category_id=20),
+    PartOption(id=6, name="Red", base_price=Decimal("20"), is_in_stock=True, part_category_id=30),
+    PartOption(id=7, name="Black", base_price=Decimal("15"), is_in_stock=False, part_category_id=30),
+]
+RULES = [
+    # Mountain wheels are only available with the full-suspension frame
+    CompatibilityRule(id=1, product_type_id=1, trigger_option_id=3, target_option_id=1, rule_type="REQUIRES"),
+    # Fat bike wheels do not come with a red rim
+    CompatibilityRule(id=2, product_type_id=1, trigger_option_id=5, target_option_id=6, rule_type="EXCLUDES"),
+]
+
+def _brute_force(compiled):
+    """Reference count by enumerating every combination of in-stock options."""
+    domains = [
+        [bit for bit in range(len(compiled.option_ids)) if mask >> bit & 1 and not compiled.out_of_stock_mask >> bit & 1]
+        for mask in compiled.category_masks
+    ]
+    total, frequencies = 0, {option_id: 0 for option_id in compiled.option_ids}
+    for combination in itertools.product(*domains):
+        if all(not compiled.conflicts[a] >> b & 1 for a, b in itertools.combinations(combination, 2)):
+            total += 1
+            for bit in combination:
+                frequencies[compiled.option_ids[bit]] += 1
+    return total, frequencies
+
+def test_counts_configurations_and_dead_options():
+    analysis = analyze_configurations(compile_compatibility(CATEGORIES, OPTIONS, RULES))
+    # Full-suspension with mountain or road wheels, diamond with road wheels; always a red rim
+    assert analysis.total_configurations == 3
+    assert analysis.option_frequencies == {1: 2, 2: 1, 3: 1, 4: 2, 5: 0, 6: 3, 7: 0}
+    # Fat bike wheels would need a rim color other than red, and black is out of stock
+    assert analysis.dead_options == [(5, "incompatible"), (7, "out_of_stock")]
+
+def test_independent_categories_multiply():
+    categories = [PartCategory(id=index, name=f"C{index}", display_order=index, product_type_id=1) for index in range(10)]
+    options = [
+        PartOption(id=category.id * 100 + n, name=f"O{n:02}", is_in_stock=True, part_category_id=category.id)
+        for category in categories
+        for n in range(20)
+    ]
+    analysis = analyze_configurations(compile_compatibility(categories, options, []))
+    assert analysis.total_configurations == 20 ** 10
+    assert set(analysis.option_frequencies.values()) == {20 ** 9}
+    assert analysis.dead_options == []
+
+def test_matches_brute_force_on_interacting_rules():
+    categories = [PartCategory(id=index, name=f"C{index}", display_order=index, product_type_id=1) for index in range(4)]
+    options = [
+        PartOption(id=category.id * 10 + n, name=f"O{n}", is_in_stock=n != 3, part_category_id=category.id)
+        for category in categories
+        for n in range(4)
+    ]
+    pairs = [(0, 11), (1, 22), (12, 30), (21, 32), (2, 31), (10, 20), (1, 31)]
+    rules = [
+        CompatibilityRule(id=i, product_type_id=1, trigger_option_id=a, target_option_id=b, rule_type="EXCLUDES")
+        for i, (a, b) in enumerate(pairs)
+    ]
+    rules.append(CompatibilityRule(id=99, product_type_id=1, trigger_option_id=0, target_option_id=21, rule_type="REQUIRES"))
+    compiled = compile_compatibility(categories, options, rules)
+    analysis = analyze_configurations(compiled)
+    assert (analysis.total_configurations, analysis.option_frequencies) == _brute_force(compiled)
+
+def test_category_without_usable_options_builds_nothing():
+    options = [option for option in OPTIONS if option.part_category_id != 30] + [
+        PartOption(id=7, name="Black", is_in_stock=False, part_category_id=30)
+    ]
+    analysis = analyze_configurations(compile_compatibility(CATEGORIES, options, RULES))
+    assert analysis.total_configurations == 0
+    assert [option_id for option_id, _ in analysis.dead_options] == [2, 1, 5, 3, 4, 7]
+
+def test_state_budget_is_enforced():
+    with pytest.raises(AnalysisTooComplexError):
+        analyze_configurations(compile_compatibility(CATEGORIES, OPTIONS, RULES), max_states=1)
+
+def test_too_complex_analysis_is_cached(monkeypatch):
+    calls = []
+    def counting_analyze(*args, **kwargs):
+        calls.append(args)
+        return analyze_configurations(*args, **kwargs)
+    monkeypatch.setattr(registry, "analyze_configurations", counting_analyze)
+    monkeypatch.setattr(settings, "CONFIGURATION_ANALYTICS_MAX_STATES", 1)
+    compiled = RuleEngine(maxsize=1).compile(1, CATEGORIES, OPTIONS, RULES, [], version=1)
+    for _ in range(2):
+        with pytest.raises(AnalysisTooComplexError):
+            compiled.analysis
+    assert len(calls) == 1
@@ -0,0 +1,53 @@
+import pytest
+from decimal import Decimal
+
+from app.models import PartCategory, PartOption, CompatibilityRule
+from app.rule_engine import InvalidSelectionError, RuleEngine
+
+# Frame (1: Full-suspension, 2: Diamond), Wheels (3: Mountain, 4: Road, 5: Fat bike),
+# Rim color (6: Red, 7: Black, out of stock)
+CATEGORIES = [
+    PartCategory(id=10, name="Frame", display_order=1, product_type_id=1),
+    PartCategory(id=20, name="Wheels", display_order=2, product_type_id=1),
+    PartCategory(id=30, name="Rim color", display_order=3, product_type_id=1),
+]
+OPTIONS = [
+    PartOption(id=1, name="Full-suspension", base_price=Decimal("130"), is_in_stock=True, part_category_id=10),
+    PartOption(id=2, name="Diamond", base_price=Decimal("100"), is_in_stock=True, part_category_id=10),
+    PartOption(id=3, name="Mountain wheels", base_price=Decimal("50"), is_in_stock=True, part_category_id=20),
+    PartOption(id=4, name="Road wheels", base_price=Decimal("80"), is_in_stock=True, part_category_id=20),
+    PartOption(id=5, name="Fat bike wheels", base_price=Decimal("90"), is_in_stock=True, part_category_id=20),
+    PartOption(id=6, name="Red", base_price=Decimal("20"), is_in_stock=True, part_category_id=30),
+    PartOption(id=7, name="Black", base_price=Decimal("15"), is_in_stock=False, part_category_id=30),
+]
+RULES = [
+    # Mountain wheels are only available with the full-suspension frame
+    CompatibilityRule(id=1, product_type_id=1, trigger_option_id=3, target_option_id=1, rule_type="REQUIRES"),
+    # Fat bike wheels do not come with a red rim
+    CompatibilityRule(id=2, product_type_id=1, trigger_option_id=5, target_option_id=6, rule_type="EXCLUDES"),
+]
+
+@pytest.fixture
+def completion():
+    return RuleEngine(maxsize=1).compile(1, CATEGORIES, OPTIONS, RULES, [], version=0).completion
+
+def test_cheapest_completion_respects_rules(completion):
+    # Mountain wheels force the full-suspension frame; the only rim in stock is red
+    assert completion.complete([3]) == [1, 3, 6]
+    # With road wheels, the diamond frame is the cheaper one
+    assert completion.complete([4]) == [2, 4, 6]
+
+def test_most_expensive_completion_skips_excluded_options(completion):
+    # Fat bike wheels would be dearer, but they exclude the only rim in stock
+    assert completion.complete([], "most_expensive") == [1, 4, 6]
+
+def test_selection_without_valid_completion(completion):
+    assert completion.complete([7]) is None # Out of stock
+    assert completion.complete([5]) is None # Needs a rim other than red
+    assert completion.complete([2, 3]) is None # Mountain wheels require full-suspension
+
+def test_invalid_selection_is_rejected(completion):
+    with pytest.raises(InvalidSelectionError):
+        completion.complete([99])
+    with pytest.raises(InvalidSelectionError):
+        completion.complete([1, 2])
@@ -0,0 +1,70 @@
+import pytest
+from fastapi.testclient import TestClient
+from starlette.websockets import WebSocketDisconnect
+
+from app.api.v1.endpoints import configurator
+from app.core.catalog_cache import CatalogVersions, catalog_version
+from app.main import app
+from app.rule_engine import rule_engine
+from tests.test_compatibility_engine import CATEGORIES, OPTIONS, RULES
+
+URL = "/api/v1/products/1/session"
+
+@pytest.fixture
+def client(monkeypatch):
+    # Compiled for the catalog version a stubbed read reports, so sessions never reach the database
+    async def read(db):
+        return CatalogVersions()
+    monkeypatch.setattr(catalog_version, "read", read)
+    rule_engine.compile(1, CATEGORIES, OPTIONS, RULES, [], version=CatalogVersions().current)
+    return TestClient(app)
+
+def test_session_pushes_changed_availability_and_price(client):
+    with client.websocket_connect(URL) as websocket:
+        state = websocket.receive_json()
+        assert state["type"] == "state"
+        assert set(state["configuration"]) == {"10", "20", "30"}
+        assert state["configuration"]["30"]["disabled_options"] == [{"id": 7, "reason": "out_of_stock"}]
+
+        websocket.send_json({"type": "select", "category_id": 20, "option_id": 3})
+        state = websocket.receive_json()
+        assert state["selected_options"] == [3]
+        # Mountain wheels need the full-suspension frame; nothing else changes
+        assert state["configuration"] == {
+            "10": {"available_options": [1], "disabled_options": [{"id": 2, "reason": "incompatible"}]}
+        }
+        assert float(state["total_price"]) == 50
+
+        websocket.send_json({"type": "select", "category_id": 10, "option_id": 1})
+        state = websocket.receive_json()
+        assert state["selected_options"] == [1, 3]
+        assert state["configuration"] == {}
+        assert float(state["total_price"]) == 180
+
+def test_invalid_messages_keep_the_session_open(client):
+    with client.websocket_connect(URL) as websocket:
+        websocket.receive_json()
+        websocket.send_json({"type": "select", "category_id": 20, "option_id": 6})
+        assert websocket.receive_json()["type"] == "error"
+        websocket.send_json({"type": "unknown"})
+        assert websocket.receive_json()["type"] == "error"
+        websocket.send_json({"type": "select", "category_id": 30, "option_id": 6})
+        assert websocket.receive_json()["selected_options"] == [6]
+
+def test_idle_sessions_are_closed(client, monkeypatch):
+    monkeypatch.setattr(configurator.settings, "CONFIGURATOR_IDLE_TIMEOUT_SECONDS", 0.05)
+    with client.websocket_connect(URL) as websocket:
+        websocket.receive_json()
+        with pytest.raises(WebSocketDisconnect) as exc_info:
+            websocket.receive_json()
+    assert exc_info.value.reason == "Idle timeout"
+
+def test_sessions_are_capped_per_worker(client, monkeypatch):
+    monkeypatch.setattr(configurator.session_limiter, "limit", 1)
+    with client.websocket_connect(URL) as websocket:
+        websocket.receive_json()
+        with client.websocket_connect(URL) as rejected:
+            with pytest.raises(WebSocketDisconnect) as exc_info:
+                rejected.receive_json()
+        assert exc_info.value.code == 1013
+    assert configurator.session_limiter.active == 0
@@ -0,0 +1,63 @@
+import pytest
+from decimal import Decimal
+from typing import List, Optional
+from fastapi import Response
+from pydantic import BaseModel, Field, TypeAdapter
+
+from app import models, schemas
+from app.core.fast_json import RowSerializer
+
+ROWS = [
+    (schemas.ProductType, [models.ProductType(id=1, name="Bicycle – Ø 29", description=None)]),
+    (schemas.PartCategory, [models.PartCategory(id=2, name="Frame", display_order=1, product_type_id=1)]),
+    (
+        schemas.PartOption,
+        [
+            models.PartOption(
+                id=3, name='Full "suspension"\n', base_price=Decimal("130.50"), is_in_stock=True, part_category_id=2
+            ),
+            models.PartOption(id=4, name="Diamond", base_price=Decimal("1E+2"), is_in_stock=None, part_category_id=2),
+        ],
+    ),
+    (
+        schemas.CompatibilityRule,
+        [
+            models.CompatibilityRule(
+                id=5, product_type_id=1, trigger_option_id=3, target_option_id=4,
+                rule_type=models.CompatibilityRuleType.REQUIRES, description="Needs it",
+            )
+        ],
+    ),
+    (
+        schemas.PricingRule,
+        [
+            models.PricingRule(
+                id=6, product_type_id=1, condition_options=[3, 4], target_option_id=4,
+                new_price=Decimal("95.00"), priority=0, description=None,
+            )
+        ],
+    ),
+]
+
+@pytest.mark.parametrize("schema, rows", ROWS, ids=[schema.__name__ for schema, _ in ROWS])
+def test_output_is_byte_identical_to_response_model(schema, rows):
+    adapter = TypeAdapter(List[schema])
+    expected = adapter.dump_json(adapter.validate_python(rows, from_attributes=True))
+    assert RowSerializer(schema).response(rows).body == expected
+
+def test_headers_set_by_the_endpoint_are_kept():
+    endpoint_response = Response()
+    del endpoint_response.headers["content-length"]
+    endpoint_response.headers["ETag"] = 'W/"7"'
+    response = RowSerializer(schemas.ProductType).response([], endpoint_response)
+    assert response.body == b"[]"
+    assert response.headers["etag"] == 'W/"7"'
+    assert response.media_type == "application/json"
+
+def test_schemas_with_custom_serialization_are_rejected():
+    class Aliased(BaseModel):
+        id: int
+        name: Optional[str] = Field(None, serialization_alias="title")
+
+    with pytest.raises(TypeError):
+        RowSerializer(Aliased)
@@ -0,0 +1,25 @@
+from datetime import datetime, timezone, timedelta
+
+from app.core.http_cache import etag_matches, format_last_modified, make_etag
+
+def test_make_etag_is_strong_and_deterministic():
+    etag = make_etag("/api/v1/admin/product-types", "skip=0", 3)
+    assert etag.startswith('"') and etag.endswith('"')
+    assert etag == make_etag("/api/v1/admin/product-types", "skip=0", 3)
+    assert etag != make_etag("/api/v1/admin/product-types", "skip=0", 4)
+
+def test_etag_matches():
+    etag = make_etag("x")
+    assert etag_matches(etag, etag)
+    assert etag_matches(f'"other", W/{etag}', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches('"other"', etag)
+    assert not etag_matches(None, etag)
+
+def test_format_last_modified_uses_latest_timestamp():
+    older = datetime(2025, 4, 20, 10, 0, 0)
+    newer = datetime(2025, 4, 21, 8, 30, 0)
+    assert format_last_modified([older, None, newer]) == "Mon, 21 Apr 2025 08:30:00 GMT"
+    aware = datetime(2025, 4, 21, 10, 30, 0, tzinfo=timezone(timedelta(hours=2)))
+    assert format_last_modified([aware]) == "Mon, 21 Apr 2025 08:30:00 GMT"
+    assert format_last_modified([]) is None
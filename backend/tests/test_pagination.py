@@ -0,0 +1,32 @@
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from app.core.pagination import InvalidCursorError, decode_cursor, encode_cursor, next_cursor, paginate
+from app.models import PartCategory, PartOption
+
+CATEGORY_ORDER = (PartCategory.display_order, PartCategory.id)
+OPTION_ORDER = (PartOption.name, PartOption.id)
+
+def test_cursor_round_trip():
+    cursor = encode_cursor(["Full-suspension", 42])
+    assert "=" not in cursor
+    assert decode_cursor(cursor, OPTION_ORDER) == ["Full-suspension", 42]
+
+@pytest.mark.parametrize("cursor", ["not base64!", encode_cursor([1]), encode_cursor(["a", "b"]), encode_cursor({"id": 1})])
+def test_foreign_cursors_are_rejected(cursor):
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(cursor, OPTION_ORDER)
+
+def test_paginate_uses_keyset_predicate_instead_of_offset():
+    statement = paginate(select(PartCategory), CATEGORY_ORDER, cursor=encode_cursor([1, 7]), skip=50, limit=20)
+    sql = str(statement.compile(dialect=postgresql.dialect()))
+    assert "(part_categories.display_order, part_categories.id) > (" in sql
+    assert "ORDER BY part_categories.display_order, part_categories.id" in sql
+    assert "OFFSET" not in sql
+
+def test_next_cursor_only_for_full_pages():
+    rows = [PartOption(id=3, name="a"), PartOption(id=1, name="b")]
+    assert decode_cursor(next_cursor(rows, OPTION_ORDER, 2), OPTION_ORDER) == ["b", 1]
+    assert next_cursor(rows, OPTION_ORDER, 3) is None
+    assert next_cursor(rows, OPTION_ORDER, None) is None
@@ -0,0 +1,76 @@
+import pytest
+from decimal import Decimal
+
+from app.models import PartCategory, PartOption, PricingRule
+from app.rule_engine import compile_pricing
+
+CATEGORIES = [
+    PartCategory(id=10, name="Frame type", display_order=1, product_type_id=1),
+    PartCategory(id=20, name="Frame finish", display_order=2, product_type_id=1),
+]
+OPTIONS = [
+    PartOption(id=1, name="Full-suspension", base_price=Decimal("130.00"), part_category_id=10),
+    PartOption(id=2, name="Diamond", base_price=Decimal("100.00"), part_category_id=10),
+    PartOption(id=3, name="Matte", base_price=Decimal("35.00"), part_category_id=20),
+    PartOption(id=4, name="Shiny", base_price=Decimal("30.00"), part_category_id=20),
+]
+
+def _matcher(*rules):
+    return compile_pricing(CATEGORIES, OPTIONS, list(rules))
+
+def test_no_rules_sums_base_prices():
+    breakdown = _matcher().price([3, 1])
+    assert [line.part_option_id for line in breakdown.lines] == [1, 3] # Display order
+    assert breakdown.total_price == Decimal("165.00")
+    assert breakdown.base_price == Decimal("165.00")
+    assert all(line.pricing_rule_id is None for line in breakdown.lines)
+
+def test_matching_rule_overrides_target_price():
+    # Matte finish costs 50 if the frame is full-suspension
+    rule = PricingRule(id=7, condition_options=[1], target_option_id=3, new_price=Decimal("50.00"), priority=0)
+    breakdown = _matcher(rule).price([1, 3])
+    assert breakdown.total_price == Decimal("180.00")
+    assert breakdown.base_price == Decimal("165.00")
+    matte = breakdown.lines[1]
+    assert matte.price == Decimal("50.00")
+    assert matte.base_price == Decimal("35.00")
+    assert matte.pricing_rule_id == 7
+
+def test_rule_needs_every_condition_and_its_target():
+    rule = PricingRule(id=7, condition_options=[1, 4], target_option_id=3, new_price=Decimal("50.00"), priority=0)
+    matcher = _matcher(rule)
+    assert matcher.price([1, 3]).total_price == Decimal("165.00") # Condition 4 missing
+    assert matcher.match(frozenset([1, 4])) == {} # Target not selected
+
+def test_highest_priority_wins():
+    low = PricingRule(id=1, condition_options=[1], target_option_id=3, new_price=Decimal("50.00"), priority=0)
+    high = PricingRule(id=2, condition_options=[1], target_option_id=3, new_price=Decimal("45.00"), priority=5)
+    breakdown = _matcher(low, high).price([1, 3])
+    assert breakdown.lines[1].pricing_rule_id == 2
+    assert breakdown.total_price == Decimal("175.00")
+
+def test_equal_priority_falls_back_to_oldest_rule():
+    first = PricingRule(id=1, condition_options=[1], target_option_id=3, new_price=Decimal("50.00"), priority=0)
+    second = PricingRule(id=2, condition_options=[1], target_option_id=3, new_price=Decimal("45.00"), priority=0)
+    assert _matcher(second, first).price([1, 3]).lines[1].pricing_rule_id == 1
+
+def test_unconditional_rule_always_applies():
+    rule = PricingRule(id=3, condition_options=[], target_option_id=4, new_price=Decimal("25.00"), priority=0)
+    assert _matcher(rule).price([2, 4]).total_price == Decimal("125.00")
+
+def test_rules_outside_the_product_type_are_dropped():
+    rule = PricingRule(id=3, condition_options=[999], target_option_id=3, new_price=Decimal("1.00"), priority=0)
+    matcher = _matcher(rule)
+    assert matcher.rules == []
+
+@pytest.mark.parametrize("rule_count", [5000])
+def test_index_keeps_candidate_set_small(rule_count):
+    # Many rules conditioned on an option that is not selected are never looked at
+    rules = [
+        PricingRule(id=i, condition_options=[2], target_option_id=3, new_price=Decimal(i), priority=i)
+        for i in range(1, rule_count + 1)
+    ]
+    matcher = _matcher(*rules)
+    assert len(matcher.index[2]) == rule_count
+    assert matcher.match(frozenset([1, 3])) == {}
+    assert matcher.match(frozenset([2, 3]))[3].id == rule_count
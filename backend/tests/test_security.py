@@ -1,5 +1,9 @@
+import asyncio
+import threading
+
 import pytest
 from app.core.security import hash_password, check_password, create_access_token, verify_token
+from app.core.security import PasswordHashingBusyError, PasswordHashingPool, password_needs_rehash
 from jose import jwt, JWTError
 from app.config import settings
 from datetime import timedelta, datetime, timezone
@@ -23,6 +27,31 @@ def test_check_password():
     assert check_password("wrongpassword", hashed) is False
     assert check_password(password.upper(), hashed) is False # Case-sensitive 
 
+def test_password_needs_rehash_on_cost_change():
+    """Test that hashes made with another cost factor are flagged for rehashing."""
+    assert password_needs_rehash(hash_password("pw", rounds=settings.BCRYPT_ROUNDS)) is False
+    assert password_needs_rehash(hash_password("pw", rounds=4 if settings.BCRYPT_ROUNDS != 4 else 5)) is True
+    assert password_needs_rehash("not-a-bcrypt-hash") is True
+
+def test_password_hashing_pool_rejects_beyond_max_pending():
+    """Test that the hashing pool turns callers away instead of queueing without bound."""
+    pool = PasswordHashingPool(workers=1, max_pending=2)
+    release = threading.Event()
+
+    async def scenario():
+        blocked = [asyncio.ensure_future(pool.run(release.wait)) for _ in range(2)]
+        await asyncio.sleep(0)
+        with pytest.raises(PasswordHashingBusyError):
+            await pool.run(release.wait)
+        release.set()
+        await asyncio.gather(*blocked)
+        assert await pool.check_password("pw", hash_password("pw", rounds=4)) is True
+
+    asyncio.run(scenario())
+    assert pool.rejected == 1
+    assert pool.pending == 0
+    pool.shutdown()
+
 def test_create_access_token():
     """Test creating a JWT access token."""
     subject = "testuser"
@@ -92,4 +121,18 @@ def test_verify_token_no_sub(credentials_exception):
     no_sub_token = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
     with pytest.raises(HTTPException) as excinfo:
         verify_token(no_sub_token, credentials_exception)
-    assert excinfo.value.status_code == 401 
\ No newline at end of file
+    assert excinfo.value.status_code == 401 
+
+def test_verify_token_caches_verified_claims(credentials_exception, monkeypatch):
+    """Test that a token is only decoded once while its claims are cached."""
+    token = create_access_token("cacheduser")
+    assert verify_token(token, credentials_exception) == "cacheduser"
+
+    def fail_decode(*args, **kwargs):
+        raise AssertionError("token decoded again")
+
+    monkeypatch.setattr(jwt, "decode", fail_decode)
+    assert verify_token(token, credentials_exception) == "cacheduser"
+    # A tampered token has another digest and still goes through verification
+    with pytest.raises(AssertionError):
+        verify_token(token + "tamper", credentials_exception)
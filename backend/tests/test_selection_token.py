@@ -0,0 +1,20 @@
+import pytest
+
+from app.core.selection_token import InvalidSelectionTokenError, decode_selection_token, encode_selection_token
+
+def test_selection_token_round_trip():
+    token = encode_selection_token(7, 42, [3, 1])
+    assert "=" not in token
+    state = decode_selection_token(token)
+    assert (state.product_type_id, state.version, state.selected_options) == (7, 42, [3, 1])
+
+def test_tampered_selection_token_is_rejected():
+    token = encode_selection_token(7, 42, [3, 1])
+    forged = encode_selection_token(7, 42, [3, 2]).split(".")[0] + "." + token.split(".")[1]
+    with pytest.raises(InvalidSelectionTokenError, match="signature"):
+        decode_selection_token(forged)
+
+@pytest.mark.parametrize("token", ["", "not a token", "e30.", encode_selection_token(7, 42, [])[:-2]])
+def test_malformed_selection_tokens_are_rejected(token):
+    with pytest.raises(InvalidSelectionTokenError):
+        decode_selection_token(token)
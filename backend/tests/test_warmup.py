@@ -0,0 +1,13 @@
+import asyncio
+
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.db.warmup import warm_up_pool
+
+def test_no_connections_are_opened_when_warm_up_is_disabled():
+    engine = create_async_engine("postgresql+asyncpg://u:p@127.0.0.1:1/unreachable", pool_size=2)
+    assert asyncio.run(warm_up_pool(engine, 0)) == 0
+
+def test_unreachable_database_does_not_stop_startup():
+    engine = create_async_engine("postgresql+asyncpg://u:p@127.0.0.1:1/unreachable", pool_size=2)
+    assert asyncio.run(warm_up_pool(engine, 5)) == 0